@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark: lxml bulletin-table parser vs the pd.read_html path.
+
+Builds a synthetic corpus of Colonial transit bulletins, parses it with both
+ColonialTransitExtractor table parsers, checks that they emit identical
+records and reports the speedup.
+
+Usage:
+    python benchmarks/bench_bulletin_parser.py [--bulletins 200] [--routes 40]
+"""
+
+import argparse
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "data"))
+from ScrapeEmail import ColonialTransitExtractor  # noqa: E402
+
+LOCATIONS = ["HTN", "GBJ", "LNJ", "ATJ", "CHJ", "GRJ", "HFJ", "BLJ", "DRJ", "SLJ"]
+
+
+def synthetic_bulletin(bulletin_date: date, n_routes: int, rng: np.random.Generator) -> str:
+    """One Outlook-style bulletin body with a From/To/Cycle transit table."""
+    rows = []
+    for i in range(n_routes):
+        from_loc = LOCATIONS[i % 3]
+        to_loc = LOCATIONS[(i % (len(LOCATIONS) - 1)) + 1]
+        cycle = 1 + (bulletin_date.timetuple().tm_yday // 5 + i // len(LOCATIONS)) % 72
+        gas_days, dist_days = rng.integers(2, 20, size=2)
+        gas_hours, dist_hours = rng.integers(0, 24, size=2)
+        dist_cells = (f"<td>{dist_days}</td><td>{dist_hours}</td>" if rng.random() > 0.1
+                      else "<td>&nbsp;</td><td>&nbsp;</td>")
+        rows.append(
+            f"<tr><td>{from_loc}&nbsp;</td><td>{to_loc}</td><td>{cycle}</td>"
+            f"<td>{gas_days}</td><td>{gas_hours}</td>{dist_cells}</tr>"
+        )
+    return (
+        "<html><head><style>p {margin:0} td {font-family:Calibri}</style></head><body>"
+        f"<p>T4 Bulletin: Colonial - TRANSIT TIMES</p>"
+        f"<p>Date: {bulletin_date:%A, %B %d, %Y}</p>"
+        "<table border=1>"
+        "<tr><td colspan=7>Colonial Pipeline Transit Times</td></tr>"
+        "<tr><td>From</td><td>To</td><td>Cycle</td><td>Gas Days</td><td>Gas Hours</td>"
+        "<td>Dist Days</td><td>Dist Hours</td></tr>"
+        + "".join(rows)
+        + "</table><p>Times are estimates.</p></body></html>"
+    )
+
+
+def build_corpus(n_bulletins: int, n_routes: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    start = date(2020, 1, 1)
+    return [
+        (start + timedelta(days=i), synthetic_bulletin(start + timedelta(days=i), n_routes, rng))
+        for i in range(n_bulletins)
+    ]
+
+
+def time_parser(table_parser: str, corpus, repeats: int):
+    extractor = ColonialTransitExtractor(table_parser=table_parser)
+    best = float("inf")
+    records = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        records = [r for fallback, body in corpus for r in extractor._parse_bulletin(body, fallback)]
+        best = min(best, time.perf_counter() - start)
+    return best, records
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--bulletins", type=int, default=200)
+    arg_parser.add_argument("--routes", type=int, default=40)
+    arg_parser.add_argument("--repeats", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    corpus = build_corpus(args.bulletins, args.routes)
+    pandas_time, pandas_records = time_parser("pandas", corpus, args.repeats)
+    lxml_time, lxml_records = time_parser("lxml", corpus, args.repeats)
+
+    identical = [tuple(map(str, r.values())) for r in pandas_records] == \
+                [tuple(map(str, r.values())) for r in lxml_records]
+
+    print(f"Corpus: {args.bulletins} bulletins x {args.routes} route rows")
+    print(f"  pd.read_html path: {pandas_time:.3f}s ({pandas_time / args.bulletins * 1e3:.2f} ms/bulletin)")
+    print(f"  lxml path:         {lxml_time:.3f}s ({lxml_time / args.bulletins * 1e3:.2f} ms/bulletin)")
+    print(f"  Speedup:           {pandas_time / lxml_time:.1f}x")
+    print(f"  Identical records: {identical} ({len(lxml_records)} rows)")
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
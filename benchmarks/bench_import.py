@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cold import time of line1_implied with lazy vs eager submodules.
+
+Each measurement runs in a fresh interpreter. "lazy" is a plain
+`import line1_implied`; "eager" additionally imports every submodule, which is
+what the package did before attribute access became lazy. For each public
+entry point the script also reports which heavy dependencies its first access
+pulls in.
+
+Usage:
+    python benchmarks/bench_import.py [--repeats 5]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+HEAVY = ["pandas", "pyarrow", "scipy", "statsmodels", "sklearn", "matplotlib"]
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import line1_implied
+{extra}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+EAGER = "for _name in line1_implied.__all__: getattr(line1_implied, _name)"
+
+ENTRY_POINTS = ["TransitStore", "load_aligned_panel", "_estimate_cointegrating_relation",
+                "_forecast_evaluation", "run_pipeline_complete", "create_transit_correlation_matrix"]
+
+
+def probe(extra: str = "") -> dict:
+    code = PROBE.format(extra=extra, heavy=HEAVY)
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True,
+                         capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def time_probe(extra: str, repeats: int):
+    runs = [probe(extra) for _ in range(repeats)]
+    return statistics.median(r["seconds"] for r in runs), runs[-1]["heavy"]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--repeats", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    lazy_time, lazy_heavy = time_probe("", args.repeats)
+    eager_time, eager_heavy = time_probe(EAGER, args.repeats)
+
+    print(f"Cold import (median of {args.repeats} fresh interpreters)")
+    print(f"  lazy  `import line1_implied`: {lazy_time * 1e3:8.1f} ms  heavy: {lazy_heavy or 'none'}")
+    print(f"  eager (all submodules):       {eager_time * 1e3:8.1f} ms  heavy: {eager_heavy}")
+    print(f"  Speedup:                      {eager_time / lazy_time:.0f}x")
+    print("First access per entry point")
+    for name in ENTRY_POINTS:
+        seconds, heavy = time_probe(f"line1_implied.{name}", 1)
+        print(f"  {name:<36} {seconds * 1e3:8.1f} ms  heavy: {heavy}")
+    return 0 if not lazy_heavy else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Benchmark: every ECM pipeline stage on synthetic data across sample sizes.
+
+For each size a synthetic cointegrated L1/L3/L13 panel is generated (see
+benchmarks/synthetic.py) and each stage is timed on it: _prepare_aligned_data,
+align_with_l13, _estimate_cointegrating_relation, _build_ecm_model,
+_forecast_evaluation and the end-to-end run_pipeline_complete (caching,
+plotting and saving off). With --routes above 3 the multi-route runner is
+timed as well. Results are written as JSON tagged with the git commit;
+--compare prints the ratio against an earlier results file and fails on
+regressions above --threshold.
+
+Usage:
+    python benchmarks/bench_pipeline.py [--sizes 250 1000 4000] [--routes 3]
+        [--missing 0.05] [--breaks 1] [--repeats 3] [--n-test 26]
+        [--out results.json] [--compare baseline.json]
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from synthetic import SyntheticConfig, pipeline_data, route_panel  # noqa: E402
+
+from line1_implied.cointegration import _estimate_cointegrating_relation  # noqa: E402
+from line1_implied.ecm import _build_ecm_model  # noqa: E402
+from line1_implied.forecast import _forecast_evaluation  # noqa: E402
+from line1_implied.log import quiet  # noqa: E402
+from line1_implied.preparation import _prepare_aligned_data, align_with_l13  # noqa: E402
+from line1_implied.routes import run_multi_route  # noqa: E402
+from line1_implied.run_all import run_pipeline_complete  # noqa: E402
+
+
+def git_commit():
+    def git(*args):
+        return subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+
+    sha = git("rev-parse", "--short", "HEAD") or "unknown"
+    dirty = bool(git("status", "--porcelain", "--untracked-files=no"))
+    return sha, dirty
+
+
+def environment():
+    import numpy
+    import pandas
+    import statsmodels
+
+    sha, dirty = git_commit()
+    return {
+        "commit": sha,
+        "dirty": dirty,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": numpy.__version__,
+        "pandas": pandas.__version__,
+        "statsmodels": statsmodels.__version__,
+    }
+
+
+def time_stage(fn, repeats):
+    """Run ``fn`` ``repeats`` times; returns (last result, per-run seconds)."""
+    runs, result = [], None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        with quiet():
+            result = fn()
+        runs.append(time.perf_counter() - start)
+    return result, runs
+
+
+def warm_up(n_test):
+    """One untimed pass so lazy imports (statsmodels, scipy) do not land in the first timing."""
+    data = pipeline_data(SyntheticConfig(n_obs=max(120, 4 * n_test)))
+    with quiet():
+        aligned = _prepare_aligned_data(data, {})
+        coint = _estimate_cointegrating_relation(aligned, plot=False)
+        _forecast_evaluation(aligned.copy(), coint, _build_ecm_model(aligned, coint), n_test=n_test)
+
+
+def bench_size(config, repeats, n_test):
+    panel = route_panel(config)
+    data = pipeline_data(config, panel)
+    stages = []
+
+    def record(stage, fn, n_obs):
+        result, runs = time_stage(fn, repeats)
+        stages.append({"stage": stage, "n_obs": n_obs, "best_s": min(runs),
+                       "median_s": statistics.median(runs), "runs_s": runs})
+        print(f"  {stage:<34} n={n_obs:<6} best {min(runs) * 1e3:10.1f} ms"
+              f"  median {statistics.median(runs) * 1e3:10.1f} ms")
+        return result
+
+    n_rows = len(data["Line13"])
+    aligned = record("_prepare_aligned_data", lambda: _prepare_aligned_data(data, {}), n_rows)
+    record("align_with_l13", lambda: align_with_l13(data), n_rows)
+    n_obs = len(aligned)
+    coint = record("_estimate_cointegrating_relation",
+                   lambda: _estimate_cointegrating_relation(aligned, plot=False), n_obs)
+    ecm = record("_build_ecm_model", lambda: _build_ecm_model(aligned, coint), n_obs)
+    record("_forecast_evaluation",
+           lambda: _forecast_evaluation(aligned.copy(), coint, ecm, n_test=n_test), n_obs)
+    record("run_pipeline_complete",
+           lambda: run_pipeline_complete(data, {}, n_test=n_test, save_outputs=False,
+                                         display_results=False, use_cache=False), n_obs)
+    if config.n_routes > 3:
+        targets = [route for route in panel.columns[1:] if route != "HTN-LNJ"]
+        record("run_multi_route",
+               lambda: run_multi_route(panel, drivers={t: ["HTN-LNJ"] for t in targets}, n_test=n_test),
+               n_obs)
+    return stages
+
+
+def compare(results, baseline_path, threshold):
+    """Print current/baseline best-time ratios; returns the number of regressions."""
+    baseline = json.loads(Path(baseline_path).read_text())
+    before = {(r["n_obs_target"], r["stage"]): r["best_s"] for r in baseline["results"]}
+    regressions = 0
+    print(f"Compared with {baseline['environment']['commit']} ({baseline_path})")
+    for r in results:
+        old = before.get((r["n_obs_target"], r["stage"]))
+        if old is None:
+            continue
+        ratio = r["best_s"] / old
+        flag = "  REGRESSION" if ratio > threshold else ""
+        regressions += bool(flag)
+        print(f"  T={r['n_obs_target']:<6} {r['stage']:<34} {old * 1e3:10.1f} -> {r['best_s'] * 1e3:10.1f} ms"
+              f"  x{ratio:5.2f}{flag}")
+    return regressions
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--sizes", type=int, nargs="+", default=[250, 1000, 4000])
+    arg_parser.add_argument("--routes", type=int, default=3)
+    arg_parser.add_argument("--missing", type=float, default=0.05)
+    arg_parser.add_argument("--breaks", type=int, default=1)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("--repeats", type=int, default=3)
+    arg_parser.add_argument("--n-test", type=int, default=26)
+    arg_parser.add_argument("--out", type=Path, help="results file (default: benchmarks/results/pipeline-<commit>.json)")
+    arg_parser.add_argument("--compare", type=Path, help="earlier results file to compare against")
+    arg_parser.add_argument("--threshold", type=float, default=1.25,
+                            help="slowdown ratio reported as a regression with --compare")
+    args = arg_parser.parse_args()
+
+    env = environment()
+    results = []
+    warm_up(args.n_test)
+    for size in args.sizes:
+        config = SyntheticConfig(n_obs=size, n_routes=args.routes, missing=args.missing,
+                                 breaks=args.breaks, seed=args.seed)
+        print(f"T={size} routes={args.routes} missing={args.missing:.0%} breaks={args.breaks}")
+        for stage in bench_size(config, args.repeats, args.n_test):
+            results.append({"n_obs_target": size, **stage})
+
+    out = args.out or ROOT / "benchmarks" / "results" / f"pipeline-{env['commit']}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "benchmark": "pipeline",
+        "environment": env,
+        "config": {"sizes": args.sizes, "routes": args.routes, "missing": args.missing,
+                   "breaks": args.breaks, "seed": args.seed, "repeats": args.repeats, "n_test": args.n_test},
+        "results": results,
+    }
+    out.write_text(json.dumps(payload, indent=2))
+    print(f"Results written to {out}")
+
+    if args.compare is not None:
+        return 1 if compare(results, args.compare, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""
+Synthetic cointegrated Colonial transit-time data for benchmarks.
+
+Line 13 (and any extra route) follows a random walk; Line 1 and Line 3 are
+cointegrated with it through a trend-stationary relation with AR(1) errors, so
+the pipeline finds a real error-correction term at any sample size. Values are
+rounded to whole hours like the published bulletins.
+
+    from synthetic import SyntheticConfig, pipeline_data
+    data = pipeline_data(SyntheticConfig(n_obs=2000, missing=0.05, breaks=2))
+"""
+
+from dataclasses import asdict, dataclass
+
+import numpy as np
+import pandas as pd
+
+LINE_ROUTES = {"Line1": "HTN-GBJ", "Line3": "GBJ-HTN", "Line13": "HTN-LNJ"}
+EXTRA_LOCATIONS = ["ATJ", "CHJ", "GRJ", "HFJ", "BLJ", "DRJ", "SLJ", "SPJ", "ALJ", "NOJ"]
+
+
+@dataclass(frozen=True)
+class SyntheticConfig:
+    """Shape of one synthetic panel.
+
+    n_obs:     bulletin dates (one per 5-day cycle)
+    n_routes:  routes generated; the first three are Line 1/3/13
+    missing:   fraction of bulletins dropped independently per route
+    breaks:    level shifts in the Line 1/Line 3 long-run relations
+    seed:      RNG seed (the same config always yields the same data)
+    """
+
+    n_obs: int = 500
+    n_routes: int = 3
+    missing: float = 0.0
+    breaks: int = 0
+    seed: int = 0
+
+    def to_dict(self):
+        return asdict(self)
+
+
+def _route_names(n_routes):
+    names = [LINE_ROUTES["Line1"], LINE_ROUTES["Line3"], LINE_ROUTES["Line13"]]
+    for i in range(max(0, n_routes - 3)):
+        names.append(f"HTN-{EXTRA_LOCATIONS[i % len(EXTRA_LOCATIONS)]}{i // len(EXTRA_LOCATIONS) or ''}")
+    return names[:max(3, n_routes)]
+
+
+def _ar1(rng, n, phi, scale):
+    shocks = rng.normal(0.0, scale, n)
+    out = np.empty(n)
+    out[0] = shocks[0]
+    for t in range(1, n):
+        out[t] = phi * out[t - 1] + shocks[t]
+    return out
+
+
+def _level_shifts(rng, n, breaks, size):
+    shifts = np.zeros(n)
+    for at in rng.integers(n // 10, n - n // 10, size=breaks) if n >= 20 else []:
+        shifts[at:] += rng.choice([-1.0, 1.0]) * size
+    return shifts
+
+
+def route_panel(config=SyntheticConfig()):
+    """Wide ``Gas Transit Days`` panel: ``Date`` plus one column per route (NaN = missing bulletin)."""
+    rng = np.random.default_rng(config.seed)
+    n = config.n_obs
+    trend = np.arange(1, n + 1) / max(n, 1) * 100  # same total drift at every size
+    dates = pd.date_range("2000-01-03", periods=n, freq="5D")
+
+    # Line 13 is the common stochastic trend, kept in a plausible day range
+    l13 = np.clip(9.0 + np.cumsum(rng.normal(0.0, 0.15, n)), 4.0, 20.0)
+    columns = {
+        LINE_ROUTES["Line1"]: 5.8 + 0.16 * l13 + 0.03 * trend + _ar1(rng, n, 0.6, 0.35)
+                              + _level_shifts(rng, n, config.breaks, 0.8),
+        LINE_ROUTES["Line3"]: 7.5 + 0.25 * l13 + _ar1(rng, n, 0.5, 0.30)
+                              + _level_shifts(rng, n, config.breaks, 0.5),
+        LINE_ROUTES["Line13"]: l13,
+    }
+    for route in _route_names(config.n_routes)[3:]:
+        columns[route] = rng.uniform(2.0, 6.0) + rng.uniform(0.3, 1.0) * l13 + _ar1(rng, n, 0.7, 0.3)
+
+    panel = pd.DataFrame({route: np.round(np.clip(values, 0.5, None) * 24) / 24 for route, values in columns.items()})
+    if config.missing > 0:
+        panel = panel.mask(rng.random(panel.shape) < config.missing)
+    panel.insert(0, "Date", dates)
+    return panel
+
+
+def pipeline_data(config=SyntheticConfig(), panel=None):
+    """``pipeline_data`` dict (``Line1``/``Line3``/``Line13`` frames) as loaded from the workbook."""
+    panel = route_panel(config) if panel is None else panel
+    frames = {}
+    for line_name, route in LINE_ROUTES.items():
+        rows = panel[["Date", route]].dropna().rename(columns={route: "Gas Transit Days"})
+        frm, to = route.split("-")
+        frames[line_name] = rows.assign(From=frm, To=to).reset_index(drop=True)
+    return frames
@@ -6,28 +6,142 @@ Extracts transit time data from Outlook emails containing Colonial Pipeline bull
 Supports configurable From/To location parameters.
 """
 
+import os
 import re
+import json
+import hashlib
 import warnings
 import pandas as pd
-import win32com.client
 from io import StringIO
-from datetime import timedelta
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime, timedelta
 from dateutil import parser
 from bs4 import BeautifulSoup
+from lxml.etree import ParserError
 from typing import Optional, Tuple, List, Dict, Any
 
+import bulletin_parser
+from bulletin_cache import BulletinCache
+from bulletin_archive import BulletinArchive
+
+
+# Bump whenever bulletin parsing/normalization logic changes; this invalidates
+# every BulletinCache entry written by earlier logic.
+PARSER_VERSION = 1
+
+
+TRANSIT_COLUMNS = [
+    "Date", "From", "To", "Cycle", "Gas Days", "Gas Hours",
+    "Distillates Days", "Distillates Hours"
+]
+ROUTE_COLUMNS = TRANSIT_COLUMNS[:1] + ["Route"] + TRANSIT_COLUMNS[1:]
+
+
+class ExtractionState:
+    """
+    Persisted high-water mark for incremental bulletin extraction.
+    
+    Holds the latest processed ReceivedTime and the body hashes of bulletins
+    received at or after it, so reruns stop at the first older message and
+    never parse the same bulletin twice.
+    """
+    
+    def __init__(self, path: str, last_received: Optional[datetime] = None,
+                 seen: Optional[Dict[str, str]] = None):
+        """
+        Initialize the state.
+        
+        Args:
+            path: JSON file the state is read from and written to
+            last_received: Latest ReceivedTime processed so far
+            seen: Mapping of body hash -> ISO received time
+        """
+        self.path = path
+        self.last_received = last_received
+        self.seen = dict(seen or {})
+    
+    @classmethod
+    def load(cls, path: str) -> "ExtractionState":
+        """Load state from disk, returning an empty state if the file is missing."""
+        if not os.path.exists(path):
+            return cls(path)
+        with open(path, "r", encoding="utf-8") as fh:
+            payload = json.load(fh)
+        last_received = payload.get("last_received")
+        return cls(
+            path,
+            datetime.fromisoformat(last_received) if last_received else None,
+            payload.get("seen", {}),
+        )
+    
+    @staticmethod
+    def digest(html_body: str) -> str:
+        """Content hash used to recognise a bulletin across runs."""
+        return hashlib.sha256(html_body.encode("utf-8", errors="replace")).hexdigest()
+    
+    def has_seen(self, digest: str) -> bool:
+        return digest in self.seen
+    
+    def mark(self, digest: str, received: datetime) -> None:
+        """Record a processed bulletin and advance the high-water mark."""
+        self.seen[digest] = received.isoformat()
+        if self.last_received is None or received > self.last_received:
+            self.last_received = received
+    
+    def save(self) -> None:
+        """Write the state atomically, keeping only hashes at the high-water mark."""
+        if self.last_received is not None:
+            cutoff = self.last_received.isoformat()
+            self.seen = {k: v for k, v in self.seen.items() if v >= cutoff}
+        payload = {
+            "last_received": self.last_received.isoformat() if self.last_received else None,
+            "seen": self.seen,
+        }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump(payload, fh, indent=2)
+        os.replace(tmp_path, self.path)
+
 
 class ColonialTransitExtractor:
     """Extracts Colonial Pipeline transit time data from Outlook emails."""
     
-    def __init__(self, target_subject: str = "T4 Bulletin: Colonial - TRANSIT TIMES sent to sto_susan"):
+    def __init__(self, target_subject: str = "T4 Bulletin: Colonial - TRANSIT TIMES sent to sto_susan",
+                 table_parser: str = "lxml", cache_dir: Optional[str] = None,
+                 archive_dir: Optional[str] = None, replay: bool = False):
         """
         Initialize the extractor.
         
         Args:
             target_subject: Email subject line to search for
+            table_parser: "lxml" walks each table once (bulletin_parser);
+                          "pandas" uses the original pd.read_html path
+            cache_dir: Optional directory for the parsed-bulletin cache
+            archive_dir: Optional raw-bulletin archive; every bulletin read from
+                         Outlook is appended to it
+            replay: Read bulletins from archive_dir instead of Outlook
         """
+        if table_parser not in ("lxml", "pandas"):
+            raise ValueError(f"table_parser must be 'lxml' or 'pandas', got {table_parser!r}")
+        if replay and archive_dir is None:
+            raise ValueError("replay=True requires archive_dir")
         self.target_subject = target_subject
+        self.table_parser = table_parser
+        self.cache_dir = cache_dir
+        self.archive_dir = archive_dir
+        self.replay = replay
+    
+    @property
+    def cache_version(self) -> str:
+        """Cache key covering the table parser and the parsing logic version."""
+        return f"{self.table_parser}-v{PARSER_VERSION}"
+    
+    def _open_cache(self) -> Optional[BulletinCache]:
+        """Open the parsed-bulletin cache for the current parser version, if configured."""
+        if self.cache_dir is None:
+            return None
+        return BulletinCache(self.cache_dir, self.cache_version)
     
     def _create_soup(self, html: str) -> BeautifulSoup:
         """Create BeautifulSoup object with fallback parsers."""
@@ -121,24 +235,47 @@ class ColonialTransitExtractor:
         
         return pd.NA
     
-    def extract_transit_data(self, from_location: str = "HTN", to_location: str = "GBJ") -> pd.DataFrame:
+    def _parse_route(self, route) -> Tuple[str, str]:
+        """Normalize a route given as a (from, to) pair or a "FROM-TO" string."""
+        if isinstance(route, str):
+            parts = re.split(r"[-/>\s]+", route.strip())
+            parts = [p for p in parts if p]
+            if len(parts) != 2:
+                raise ValueError(f"Route must look like 'HTN-GBJ', got {route!r}")
+            route = parts
+        from_location, to_location = route
+        return self._normalize_location_code(from_location), self._normalize_location_code(to_location)
+    
+    @staticmethod
+    def _received_time(message) -> Optional[datetime]:
+        """Return the message ReceivedTime as a naive datetime (None if absent)."""
+        received = getattr(message, "ReceivedTime", None)
+        if received is None:
+            return None
+        return datetime(received.year, received.month, received.day,
+                        received.hour, received.minute, received.second)
+    
+    def _iter_bulletin_messages(self, since: Optional[datetime] = None):
         """
-        Extract Colonial Pipeline transit time data from Outlook emails.
+        Yield messages matching the target subject, newest first.
         
-        Args:
-            from_location: Source location code (default: "HTN")
-            to_location: Destination location code (default: "GBJ")
+        Messages come from Outlook, or from the raw-bulletin archive when
+        replaying. Outlook messages are archived as they are read if an
+        archive directory is configured.
         
-        Returns:
-            DataFrame with columns: Date, From, To, Cycle, Gas Days, Gas Hours, 
-                                  Distillates Days, Distillates Hours
+        Args:
+            since: Stop at the first message received strictly before this time
         """
-        # Normalize location codes
-        from_code = self._normalize_location_code(from_location)
-        to_code = self._normalize_location_code(to_location)
+        if self.replay:
+            archive = BulletinArchive(self.archive_dir)
+            yield from archive.iter_messages(subject_contains=self.target_subject, start=since)
+            return
+        
+        archive = BulletinArchive(self.archive_dir) if self.archive_dir else None
         
         # Connect to Outlook
         try:
+            import win32com.client  # Windows-only; imported lazily so parsing works anywhere
             outlook = win32com.client.Dispatch("Outlook.Application")
             namespace = outlook.GetNamespace("MAPI")
             inbox = namespace.GetDefaultFolder(6)  # Inbox folder
@@ -147,10 +284,12 @@ class ColonialTransitExtractor:
         except Exception as e:
             raise RuntimeError(f"Failed to connect to Outlook: {e}")
         
-        extracted_data = []
-        
-        # Process each email
         for message in items:
+            if since is not None:
+                received = self._received_time(message)
+                if received is not None and received < since:
+                    break  # items are sorted newest first
+            
             subject = getattr(message, "Subject", "") or ""
             if self.target_subject not in subject:
                 continue
@@ -159,80 +298,328 @@ class ColonialTransitExtractor:
             if not html_body:
                 continue
             
-            # Parse HTML and extract date
-            soup = self._create_soup(html_body)
-            text_content = soup.get_text("\n", strip=True)
-            email_date = self._extract_date_from_text(text_content, message.ReceivedTime.date())
+            if archive is not None:
+                archive.append(self._received_time(message), subject, html_body)
             
-            # Process all tables in the email
-            for table in soup.find_all("table"):
-                with warnings.catch_warnings():
-                    warnings.simplefilter("ignore", FutureWarning)
-                    try:
-                        dataframes = pd.read_html(StringIO(str(table)))
-                    except Exception:
-                        continue
+            yield message
+    
+    def _parse_bulletin(self, html_body: str, fallback_date, routes: Optional[set] = None) -> List[Dict[str, Any]]:
+        """
+        Parse one bulletin body and return a record per matching table row.
+        
+        Args:
+            html_body: Raw HTML body of the bulletin email
+            fallback_date: Date used when no date can be read from the text
+            routes: Set of normalized (from, to) pairs to keep; None keeps every route
+        
+        Returns:
+            List of record dicts with Date, From, To, Cycle and the four day/hour values
+        """
+        if self.table_parser == "lxml":
+            try:
+                return self._parse_bulletin_lxml(html_body, fallback_date, routes)
+            except ParserError:
+                pass  # fall back to the more forgiving BeautifulSoup path
+        return self._parse_bulletin_pandas(html_body, fallback_date, routes)
+    
+    def _parse_bulletin_lxml(self, html_body: str, fallback_date, routes: Optional[set] = None) -> List[Dict[str, Any]]:
+        """Parse a bulletin with a single walk of its lxml tree."""
+        root = bulletin_parser.parse_document(html_body)
+        email_date = self._extract_date_from_text(bulletin_parser.document_text(root), fallback_date)
+        
+        records = []
+        for table in bulletin_parser.parse_bulletin_tables(root):
+            for from_code, to_code, cycle, values in zip(
+                table.from_codes, table.to_codes, table.cycles, table.values.tolist()
+            ):
+                if routes is not None and (from_code, to_code) not in routes:
+                    continue
+                gas_days, gas_hours, dist_days, dist_hours = (
+                    pd.NA if v == bulletin_parser.MISSING else v for v in values
+                )
+                records.append({
+                    "Date": email_date,
+                    "From": from_code,
+                    "To": to_code,
+                    "Cycle": pd.NA if cycle == bulletin_parser.MISSING else int(cycle),
+                    "Gas Days": gas_days,
+                    "Gas Hours": gas_hours,
+                    "Distillates Days": dist_days,
+                    "Distillates Hours": dist_hours
+                })
+        
+        return records
+    
+    def _parse_bulletin_pandas(self, html_body: str, fallback_date, routes: Optional[set] = None) -> List[Dict[str, Any]]:
+        """Original path: BeautifulSoup, then pd.read_html on every table."""
+        records = []
+        
+        # Parse HTML and extract date
+        soup = self._create_soup(html_body)
+        text_content = soup.get_text("\n", strip=True)
+        email_date = self._extract_date_from_text(text_content, fallback_date)
+        
+        # Process all tables in the email
+        for table in soup.find_all("table"):
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", FutureWarning)
+                try:
+                    dataframes = pd.read_html(StringIO(str(table)))
+                except Exception:
+                    continue
+            
+            # Process each DataFrame from the table
+            for df in dataframes:
+                if df.empty:
+                    continue
                 
-                # Process each DataFrame from the table
-                for df in dataframes:
-                    if df.empty:
-                        continue
-                    
-                    # Promote header row
-                    df = self._promote_header_row(df)
-                    
-                    # Find column indices
-                    from_idx, to_idx, cycle_idx = self._find_column_indices(df)
-                    if from_idx is None or to_idx is None:
-                        continue
-                    
-                    # Clean location codes
-                    df["From"] = df.iloc[:, from_idx].map(self._normalize_location_code)
-                    df["To"] = df.iloc[:, to_idx].map(self._normalize_location_code)
-                    
-                    # Determine starting column for number extraction
-                    start_col_idx = cycle_idx if cycle_idx is not None else max(from_idx, to_idx)
+                # Promote header row
+                df = self._promote_header_row(df)
+                
+                # Find column indices
+                from_idx, to_idx, cycle_idx = self._find_column_indices(df)
+                if from_idx is None or to_idx is None:
+                    continue
+                
+                # Clean location codes
+                df["From"] = df.iloc[:, from_idx].map(self._normalize_location_code)
+                df["To"] = df.iloc[:, to_idx].map(self._normalize_location_code)
+                
+                # Determine starting column for number extraction
+                start_col_idx = cycle_idx if cycle_idx is not None else max(from_idx, to_idx)
+                
+                # Filter rows matching the requested routes (or any labelled route)
+                if routes is None:
+                    route_mask = (df["From"] != "") & (df["To"] != "")
+                else:
+                    route_mask = pd.Series(list(zip(df["From"], df["To"])), index=df.index).isin(routes)
+                matching_rows = df.index[route_mask]
+                
+                # Extract data from matching rows
+                for row_idx in matching_rows:
+                    gas_days, gas_hours, dist_days, dist_hours = self._extract_first_four_numbers(
+                        df, row_idx, start_col_idx
+                    )
                     
-                    # Filter rows matching the specified route
-                    route_mask = (df["From"] == from_code) & (df["To"] == to_code)
-                    matching_rows = df.index[route_mask]
+                    cycle_value = self._extract_cycle_value(df, row_idx, cycle_idx)
                     
-                    # Extract data from matching rows
-                    for row_idx in matching_rows:
-                        gas_days, gas_hours, dist_days, dist_hours = self._extract_first_four_numbers(
-                            df, row_idx, start_col_idx
-                        )
-                        
-                        cycle_value = self._extract_cycle_value(df, row_idx, cycle_idx)
-                        
-                        extracted_data.append({
-                            "Date": email_date,
-                            "From": from_code,
-                            "To": to_code,
-                            "Cycle": cycle_value,
-                            "Gas Days": gas_days,
-                            "Gas Hours": gas_hours,
-                            "Distillates Days": dist_days,
-                            "Distillates Hours": dist_hours
-                        })
+                    records.append({
+                        "Date": email_date,
+                        "From": df.at[row_idx, "From"],
+                        "To": df.at[row_idx, "To"],
+                        "Cycle": cycle_value,
+                        "Gas Days": gas_days,
+                        "Gas Hours": gas_hours,
+                        "Distillates Days": dist_days,
+                        "Distillates Hours": dist_hours
+                    })
+        
+        return records
+    
+    def _iter_bulletin_bodies(self, state: Optional[ExtractionState] = None):
+        """
+        Reader stage: yield (fallback_date, html_body) for every new bulletin.
+        
+        All Outlook/COM access happens here, in the calling process, so the
+        parser stage only ever sees plain strings.
+        """
+        since = state.last_received if state is not None else None
+        for message in self._iter_bulletin_messages(since=since):
+            html_body = message.HTMLBody
+            if state is not None:
+                digest = ExtractionState.digest(html_body)
+                if state.has_seen(digest):
+                    continue
+                state.mark(digest, self._received_time(message))
+            
+            yield message.ReceivedTime.date(), html_body
+    
+    def _collect_records(self, routes: Optional[set], state_path: Optional[str] = None,
+                         workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Parse every (new) bulletin once, updating the extraction state if given.
+        
+        With workers > 1 the reader feeds a bounded process pool of parsers;
+        results are consumed in submission order so records stay in
+        received-time order regardless of which worker finishes first.
+        
+        With a parsed-bulletin cache, bulletins already in the cache skip the
+        HTML stage; new ones are parsed for all routes, cached, then filtered.
+        """
+        state = ExtractionState.load(state_path) if state_path else None
+        bodies = self._iter_bulletin_bodies(state)
+        cache = self._open_cache()
+        parse_routes = None if cache is not None else routes
+        
+        records = []
+        
+        def _finish(digest, parsed):
+            if cache is not None:
+                if digest is not None:
+                    cache.put(digest, parsed)
+                if routes is not None:
+                    parsed = [r for r in parsed if (r["From"], r["To"]) in routes]
+            records.extend(parsed)
+        
+        def _lookup(html_body):
+            if cache is None:
+                return None, None
+            digest = cache.digest(html_body)
+            cached = cache.get(digest)
+            return (None, cached) if cached is not None else (digest, None)
+        
+        if workers is None or workers <= 1:
+            for fallback_date, html_body in bodies:
+                digest, cached = _lookup(html_body)
+                if cached is None:
+                    cached = self._parse_bulletin(html_body, fallback_date, routes=parse_routes)
+                _finish(digest, cached)
+        else:
+            max_pending = workers * 4
+            pending = deque()
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for fallback_date, html_body in bodies:
+                    digest, cached = _lookup(html_body)
+                    if cached is None:
+                        cached = pool.submit(_parse_bulletin_job, self, html_body, fallback_date, parse_routes)
+                    pending.append((digest, cached))
+                    # Bound memory: wait for the oldest job before reading further
+                    if len(pending) >= max_pending:
+                        digest, job = pending.popleft()
+                        _finish(digest, job.result() if isinstance(job, Future) else job)
+                while pending:
+                    digest, job = pending.popleft()
+                    _finish(digest, job.result() if isinstance(job, Future) else job)
+        
+        # Only persist once the whole pass succeeded
+        if cache is not None:
+            cache.flush()
+        if state is not None:
+            state.save()
+        
+        return records
+    
+    def extract_transit_data(self, from_location: str = "HTN", to_location: str = "GBJ",
+                             state_path: Optional[str] = None,
+                             workers: Optional[int] = None) -> pd.DataFrame:
+        """
+        Extract Colonial Pipeline transit time data from Outlook emails.
+        
+        Args:
+            from_location: Source location code (default: "HTN")
+            to_location: Destination location code (default: "GBJ")
+            state_path: Optional JSON state file; when given only bulletins received
+                        since the previous run are parsed (use one file per route)
+            workers: Number of parser processes; None or 1 parses in-process
+        
+        Returns:
+            DataFrame with columns: Date, From, To, Cycle, Gas Days, Gas Hours, 
+                                  Distillates Days, Distillates Hours
+        """
+        route = self._parse_route((from_location, to_location))
+        extracted_data = self._collect_records({route}, state_path, workers)
         
         # Create final DataFrame
         if not extracted_data:
-            return pd.DataFrame(columns=[
-                "Date", "From", "To", "Cycle", "Gas Days", "Gas Hours", 
-                "Distillates Days", "Distillates Hours"
-            ])
+            return pd.DataFrame(columns=TRANSIT_COLUMNS)
         
         result_df = (pd.DataFrame(extracted_data)
                     .sort_values("Date", ascending=False)
                     .reset_index(drop=True))
         
         return result_df
+    
+    def extract_routes_data(self, routes: Optional[List[Any]] = None,
+                            state_path: Optional[str] = None,
+                            workers: Optional[int] = None) -> pd.DataFrame:
+        """
+        Extract transit times for several routes in a single pass over the inbox.
+        
+        Each bulletin is parsed exactly once and every table row whose From/To
+        pair is requested is emitted, so the cost no longer scales with the
+        number of routes.
+        
+        Args:
+            routes: Routes as (from, to) pairs or "FROM-TO" strings, e.g.
+                    [("HTN", "GBJ"), "HTN-LNJ"]. None returns every route found.
+            state_path: Optional JSON state file; when given only bulletins received
+                        since the previous run are parsed and returned
+            workers: Number of parser processes; None or 1 parses in-process
+        
+        Returns:
+            Long-format DataFrame with columns: Date, Route, From, To, Cycle,
+            Gas Days, Gas Hours, Distillates Days, Distillates Hours
+        """
+        route_set = None if routes is None else {self._parse_route(r) for r in routes}
+        extracted_data = self._collect_records(route_set, state_path, workers)
+        return self._to_long_frame(extracted_data)
+    
+    def _to_long_frame(self, records: List[Dict[str, Any]]) -> pd.DataFrame:
+        """Build the long-format (date, route, cycle) frame from parsed records."""
+        if not records:
+            return pd.DataFrame(columns=ROUTE_COLUMNS)
+        
+        df = pd.DataFrame(records)
+        df.insert(1, "Route", df["From"] + "-" + df["To"])
+        return (df[ROUTE_COLUMNS]
+                .sort_values(["Date", "Route", "Cycle"], ascending=[False, True, True], kind="mergesort")
+                .reset_index(drop=True))
+
+
+def replay_colonial_transit_routes(archive_dir: str,
+                                   routes: Optional[List[Any]] = None,
+                                   target_subject: str = "T4 Bulletin: Colonial - TRANSIT TIMES sent to sto_susan",
+                                   workers: Optional[int] = None,
+                                   cache_dir: Optional[str] = None) -> pd.DataFrame:
+    """
+    Re-run extraction over a local raw-bulletin archive (no Outlook needed).
+    
+    Args:
+        archive_dir: Directory written by an extractor with archive_dir set
+        routes: Routes as (from, to) pairs or "FROM-TO" strings; None keeps every route
+        target_subject: Subject substring the archived bulletins must contain
+        workers: Number of parser processes; None or 1 parses in-process
+        cache_dir: Optional directory for the parsed-bulletin cache
+    
+    Returns:
+        Long-format DataFrame keyed by Date, Route and Cycle
+    """
+    extractor = ColonialTransitExtractor(target_subject, cache_dir=cache_dir,
+                                         archive_dir=archive_dir, replay=True)
+    return extractor.extract_routes_data(routes, workers=workers)
+
+
+def _parse_bulletin_job(extractor: ColonialTransitExtractor, html_body: str,
+                        fallback_date, routes: Optional[set]) -> List[Dict[str, Any]]:
+    """Parser-stage entry point; module level so it can be pickled to pool workers."""
+    return extractor._parse_bulletin(html_body, fallback_date, routes=routes)
+
+
+def split_routes(long_df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """
+    Split a long-format route frame into one per-route frame.
+    
+    The per-route frames have the same columns as extract_transit_data, so they
+    can be fed straight into the existing merge/dedup notebook steps.
+    
+    Args:
+        long_df: Output of ColonialTransitExtractor.extract_routes_data
+    
+    Returns:
+        Dict mapping "FROM-TO" route keys to DataFrames
+    """
+    return {
+        route: group.drop(columns="Route").reset_index(drop=True)
+        for route, group in long_df.groupby("Route", sort=True)
+    }
 
 
 def extract_colonial_transit_times(from_location: str = "HTN", 
                                  to_location: str = "GBJ",
-                                 target_subject: str = "T4 Bulletin: Colonial - TRANSIT TIMES sent to sto_susan") -> pd.DataFrame:
+                                 target_subject: str = "T4 Bulletin: Colonial - TRANSIT TIMES sent to sto_susan",
+                                 state_path: Optional[str] = None,
+                                 workers: Optional[int] = None,
+                                 cache_dir: Optional[str] = None) -> pd.DataFrame:
     """
     Convenience function to extract Colonial Pipeline transit time data.
     
@@ -240,12 +627,37 @@ def extract_colonial_transit_times(from_location: str = "HTN",
         from_location: Source location code (default: "HTN")
         to_location: Destination location code (default: "GBJ")
         target_subject: Email subject line to search for
+        state_path: Optional JSON state file for incremental extraction
+        workers: Number of parser processes; None or 1 parses in-process
+        cache_dir: Optional directory for the parsed-bulletin cache
     
     Returns:
         DataFrame with transit time data
     """
-    extractor = ColonialTransitExtractor(target_subject)
-    return extractor.extract_transit_data(from_location, to_location)
+    extractor = ColonialTransitExtractor(target_subject, cache_dir=cache_dir)
+    return extractor.extract_transit_data(from_location, to_location, state_path, workers)
+
+
+def extract_colonial_transit_routes(routes: Optional[List[Any]] = None,
+                                    target_subject: str = "T4 Bulletin: Colonial - TRANSIT TIMES sent to sto_susan",
+                                    state_path: Optional[str] = None,
+                                    workers: Optional[int] = None,
+                                    cache_dir: Optional[str] = None) -> pd.DataFrame:
+    """
+    Convenience function to extract several routes in one pass over the inbox.
+    
+    Args:
+        routes: Routes as (from, to) pairs or "FROM-TO" strings; None keeps every route
+        target_subject: Email subject line to search for
+        state_path: Optional JSON state file for incremental extraction
+        workers: Number of parser processes; None or 1 parses in-process
+        cache_dir: Optional directory for the parsed-bulletin cache
+    
+    Returns:
+        Long-format DataFrame keyed by Date, Route and Cycle
+    """
+    extractor = ColonialTransitExtractor(target_subject, cache_dir=cache_dir)
+    return extractor.extract_routes_data(routes, state_path, workers)
 
 
 def main():
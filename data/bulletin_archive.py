@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Append-only, compressed archive of raw Colonial transit bulletin bodies.
+
+Every bulletin HTML body is zlib-compressed and appended to a single data file;
+a JSON-lines index records its received time, subject, content hash and byte
+range. The archive can be replayed through ColonialTransitExtractor so parser
+fixes and full-history reprocessing run offline (e.g. on Linux) from local disk.
+"""
+
+import os
+import json
+import zlib
+import hashlib
+import logging
+from datetime import datetime
+from typing import Iterator, List, NamedTuple, Optional, Dict, Any
+
+
+DATA_FILE = "bulletins.dat"
+INDEX_FILE = "index.jsonl"
+
+logger = logging.getLogger(__name__)
+
+
+class ArchivedMessage(NamedTuple):
+    """Stand-in for an Outlook message, exposing the attributes the extractor reads."""
+    ReceivedTime: datetime
+    Subject: str
+    HTMLBody: str
+
+
+class BulletinArchive:
+    """Append-only raw-bulletin store indexed by received time and subject."""
+
+    def __init__(self, archive_dir: str, compression_level: int = 6):
+        """
+        Open (or create) an archive.
+
+        Args:
+            archive_dir: Directory holding the data and index files
+            compression_level: zlib level used for new bodies
+        """
+        self.archive_dir = archive_dir
+        self.compression_level = compression_level
+        self.data_path = os.path.join(archive_dir, DATA_FILE)
+        self.index_path = os.path.join(archive_dir, INDEX_FILE)
+        self._index: List[Dict[str, Any]] = []
+        self._digests = set()
+        self._load_index()
+
+    def _load_index(self) -> None:
+        """
+        Read the index, dropping a final line torn by a crash during append().
+
+        The torn line is truncated away so the next append starts on a clean
+        line; its body (if written) is simply re-archived on the next scrape.
+        An unparseable line anywhere else is real corruption and still raises.
+        """
+        if not os.path.exists(self.index_path):
+            return
+        with open(self.index_path, "rb") as fh:
+            lines = fh.readlines()
+        offset = 0
+        for i, raw in enumerate(lines):
+            line = raw.strip()
+            if line:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    if any(rest.strip() for rest in lines[i + 1:]):
+                        raise
+                    logger.warning("Dropping torn last index line in %s (%d bytes)", self.index_path, len(raw))
+                    with open(self.index_path, "r+b") as fh:
+                        fh.truncate(offset)
+                    return
+                self._index.append(entry)
+                self._digests.add(entry["digest"])
+            offset += len(raw)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @staticmethod
+    def digest(html_body: str) -> str:
+        return hashlib.sha256(html_body.encode("utf-8", errors="replace")).hexdigest()
+
+    def append(self, received: datetime, subject: str, html_body: str) -> bool:
+        """
+        Archive one bulletin body; identical bodies are stored only once.
+
+        Returns:
+            True if the body was written, False if it was already archived
+        """
+        digest = self.digest(html_body)
+        if digest in self._digests:
+            return False
+
+        os.makedirs(self.archive_dir, exist_ok=True)
+        payload = zlib.compress(html_body.encode("utf-8", errors="replace"), self.compression_level)
+        with open(self.data_path, "ab") as fh:
+            offset = fh.tell()
+            fh.write(payload)
+
+        # Index line is written after the data, so a crash never indexes missing bytes
+        entry = {
+            "received": received.isoformat(),
+            "subject": subject,
+            "digest": digest,
+            "offset": offset,
+            "length": len(payload),
+        }
+        with open(self.index_path, "a", encoding="utf-8") as fh:
+            fh.write(json.dumps(entry) + "\n")
+
+        self._index.append(entry)
+        self._digests.add(digest)
+        return True
+
+    def entries(self, subject_contains: Optional[str] = None,
+                start: Optional[datetime] = None, end: Optional[datetime] = None,
+                newest_first: bool = True) -> List[Dict[str, Any]]:
+        """Index entries filtered by subject substring and received-time range."""
+        start_iso = start.isoformat() if start is not None else None
+        end_iso = end.isoformat() if end is not None else None
+        selected = [
+            e for e in self._index
+            if (subject_contains is None or subject_contains in e["subject"])
+            and (start_iso is None or e["received"] >= start_iso)
+            and (end_iso is None or e["received"] <= end_iso)
+        ]
+        return sorted(selected, key=lambda e: e["received"], reverse=newest_first)
+
+    def iter_messages(self, subject_contains: Optional[str] = None,
+                      start: Optional[datetime] = None, end: Optional[datetime] = None,
+                      newest_first: bool = True) -> Iterator[ArchivedMessage]:
+        """
+        Replay archived bulletins as message-like objects.
+
+        Bodies are read with one seek per entry from a single open file handle.
+        """
+        selected = self.entries(subject_contains, start, end, newest_first)
+        if not selected:
+            return
+        with open(self.data_path, "rb") as fh:
+            for entry in selected:
+                fh.seek(entry["offset"])
+                body = zlib.decompress(fh.read(entry["length"])).decode("utf-8")
+                yield ArchivedMessage(
+                    ReceivedTime=datetime.fromisoformat(entry["received"]),
+                    Subject=entry["subject"],
+                    HTMLBody=body,
+                )
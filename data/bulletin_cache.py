@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+On-disk cache of parsed Colonial transit bulletins.
+
+Maps a SHA-256 hash of each bulletin HTML body to its parsed, normalized table
+rows (all routes, all products). Rows are stored as append-only Parquet part
+files under a directory named after the parser version, so bumping
+ScrapeEmail.PARSER_VERSION (or switching table parser) starts a fresh cache
+instead of serving rows produced by old parsing logic.
+"""
+
+import os
+import hashlib
+import pandas as pd
+from datetime import datetime
+from typing import Optional, List, Dict, Any
+
+
+RECORD_COLUMNS = [
+    "Date", "From", "To", "Cycle", "Gas Days", "Gas Hours",
+    "Distillates Days", "Distillates Hours"
+]
+INT_COLUMNS = RECORD_COLUMNS[3:]
+
+
+class BulletinCache:
+    """Parsed-bulletin rows keyed by HTML content hash."""
+
+    def __init__(self, cache_dir: str, version_key: str):
+        """
+        Open (or create) the cache for one parser version.
+
+        Args:
+            cache_dir: Root directory of the cache
+            version_key: Parser version identifier; each key gets its own subdirectory
+        """
+        self.path = os.path.join(cache_dir, version_key)
+        self._entries: Dict[str, List[Dict[str, Any]]] = {}
+        self._pending: Dict[str, List[Dict[str, Any]]] = {}
+        self._load()
+
+    @staticmethod
+    def digest(html_body: str) -> str:
+        """Content hash used as the cache key."""
+        return hashlib.sha256(html_body.encode("utf-8", errors="replace")).hexdigest()
+
+    def _part_files(self) -> List[str]:
+        if not os.path.isdir(self.path):
+            return []
+        return sorted(
+            os.path.join(self.path, name) for name in os.listdir(self.path)
+            if name.endswith(".parquet")
+        )
+
+    def _load(self) -> None:
+        """Read every part file into the in-memory digest -> rows index."""
+        parts = self._part_files()
+        if not parts:
+            return
+        df = pd.concat([pd.read_parquet(part) for part in parts], ignore_index=True)
+        for digest, group in df.groupby("digest", sort=False):
+            # Bulletins without any route rows are stored as a single null row
+            rows = group[group["From"].notna()][RECORD_COLUMNS]
+            self._entries[digest] = [
+                {k: (pd.NA if pd.isna(v) else v) for k, v in row.items()}
+                for row in rows.to_dict("records")
+            ]
+
+    def __len__(self) -> int:
+        return len(self._entries) + len(self._pending)
+
+    def __contains__(self, digest: str) -> bool:
+        return digest in self._entries or digest in self._pending
+
+    def get(self, digest: str) -> Optional[List[Dict[str, Any]]]:
+        """Return the cached rows for a bulletin, or None on a miss."""
+        rows = self._entries.get(digest)
+        if rows is None:
+            rows = self._pending.get(digest)
+        return None if rows is None else [dict(r) for r in rows]
+
+    def put(self, digest: str, records: List[Dict[str, Any]]) -> None:
+        """Add a freshly parsed bulletin (all routes) to the cache."""
+        if digest not in self:
+            self._pending[digest] = [dict(r) for r in records]
+
+    def flush(self) -> Optional[str]:
+        """Append pending entries as a new Parquet part file; returns its path."""
+        if not self._pending:
+            return None
+
+        rows = []
+        for digest, records in self._pending.items():
+            if records:
+                rows.extend({"digest": digest, **r} for r in records)
+            else:
+                rows.append({"digest": digest, **{c: None for c in RECORD_COLUMNS}})
+        df = pd.DataFrame(rows, columns=["digest"] + RECORD_COLUMNS)
+        for col in INT_COLUMNS:
+            df[col] = pd.array(df[col], dtype="Int64")
+
+        os.makedirs(self.path, exist_ok=True)
+        part_path = os.path.join(self.path, f"part-{datetime.now():%Y%m%d%H%M%S%f}.parquet")
+        tmp_path = f"{part_path}.tmp"
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, part_path)
+
+        self._entries.update(self._pending)
+        self._pending = {}
+        return part_path
+
+    def compact(self) -> Optional[str]:
+        """Merge all part files into one (e.g. after many small incremental runs)."""
+        parts = self._part_files()
+        if len(parts) <= 1:
+            return parts[0] if parts else None
+        self._pending, self._entries = {**self._entries, **self._pending}, {}
+        part_path = self.flush()
+        for part in parts:
+            os.remove(part)
+        return part_path
+
+    def frame(self) -> pd.DataFrame:
+        """All cached rows as one DataFrame (with their bulletin digest)."""
+        rows = [
+            {"digest": digest, **r}
+            for source in (self._entries, self._pending)
+            for digest, records in source.items()
+            for r in records
+        ]
+        return pd.DataFrame(rows, columns=["digest"] + RECORD_COLUMNS)
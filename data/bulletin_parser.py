@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Direct lxml parser for Colonial Pipeline transit bulletin tables.
+
+Walks each bulletin's lxml tree once: it locates the From/To/Cycle header row
+of every table and pulls the integer day/hour cells straight into typed NumPy
+arrays, instead of round-tripping every <table> through str() -> StringIO ->
+pd.read_html and then scanning the resulting frame cell by cell.
+"""
+
+import re
+import numpy as np
+from lxml import html as lxml_html
+from typing import List, NamedTuple, Optional, Tuple
+
+
+MISSING = np.iinfo(np.int64).min   # sentinel for absent integer cells
+N_VALUES = 4                        # Gas Days, Gas Hours, Distillates Days, Distillates Hours
+HEADER_SCAN_ROWS = 9                # optional <th> row + the 8 rows scanned for From/To
+
+_NON_LETTERS = re.compile(r"[^A-Z]")
+_SKIP_TEXT_TAGS = {"script", "style", "head", "title"}
+
+
+class BulletinTable(NamedTuple):
+    """Typed rows of one bulletin table (one entry per labelled route row)."""
+    from_codes: np.ndarray   # object array of normalized location codes
+    to_codes: np.ndarray     # object array of normalized location codes
+    cycles: np.ndarray       # int64, MISSING where no integer cycle
+    values: np.ndarray       # int64 (n_rows, 4), MISSING where absent
+
+
+def normalize_location_code(code: str) -> str:
+    """Normalize location code by keeping only uppercase letters."""
+    return _NON_LETTERS.sub("", str(code).upper())
+
+
+def parse_document(html_body: str):
+    """Parse a bulletin body into an lxml element tree."""
+    return lxml_html.document_fromstring(html_body)
+
+
+def document_text(root) -> str:
+    """Visible text with one stripped fragment per line (like soup.get_text("\\n", strip=True))."""
+    fragments = []
+    for element in root.iter():
+        if not isinstance(element.tag, str):
+            # Comments / processing instructions: only their tail is visible text
+            if element.tail and element.tail.strip():
+                fragments.append(element.tail.strip())
+            continue
+        if element.tag not in _SKIP_TEXT_TAGS and element.text and element.text.strip():
+            fragments.append(element.text.strip())
+        if element is not root and element.tail and element.tail.strip():
+            fragments.append(element.tail.strip())
+    return "\n".join(fragments)
+
+
+def _is_hidden(element) -> bool:
+    """Mirror pd.read_html(displayed_only=True): skip display:none elements."""
+    return "display:none" in element.get("style", "").replace(" ", "")
+
+
+def _cell_text(cell) -> str:
+    return " ".join(cell.text_content().split())
+
+
+def _table_rows(table) -> List[List[str]]:
+    """
+    Return the cell texts of a table's own rows, expanding colspan/rowspan.
+
+    Rows of nested tables are left to their own table, so layout tables that
+    wrap the bulletin do not duplicate its rows.
+    """
+    rows = []
+    carried = {}  # column index -> [text, remaining rows]
+    for tr in table.xpath("./tr|./thead/tr|./tbody/tr|./tfoot/tr"):
+        if _is_hidden(tr):
+            continue
+        row = []
+        col = 0
+        cells = iter(c for c in tr if c.tag in ("td", "th") and not _is_hidden(c))
+        cell = next(cells, None)
+        while cell is not None or col in carried:
+            if col in carried:
+                text, remaining = carried[col]
+                row.append(text)
+                if remaining <= 1:
+                    del carried[col]
+                else:
+                    carried[col][1] = remaining - 1
+                col += 1
+                continue
+            text = _cell_text(cell)
+            try:
+                colspan = max(1, int(cell.get("colspan", 1)))
+                rowspan = max(1, int(cell.get("rowspan", 1)))
+            except ValueError:
+                colspan, rowspan = 1, 1
+            for _ in range(colspan):
+                if rowspan > 1:
+                    carried[col] = [text, rowspan - 1]
+                row.append(text)
+                col += 1
+            cell = next(cells, None)
+        rows.append(row)
+    return rows
+
+
+def _to_int(text: str) -> int:
+    """Parse an integer-valued cell, returning MISSING for anything else."""
+    text = text.replace(",", "").strip()
+    if not text:
+        return MISSING
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        value = float(text)
+    except ValueError:
+        return MISSING
+    if np.isfinite(value) and value.is_integer():
+        return int(value)
+    return MISSING
+
+
+def _find_header(rows: List[List[str]]) -> Optional[Tuple[int, int, int, Optional[int]]]:
+    """Locate the header row and its From, To and Cycle column indices."""
+    for i, row in enumerate(rows[:HEADER_SCAN_ROWS]):
+        lowered = [c.strip().lower() for c in row]
+        if "from" in lowered and "to" in lowered:
+            cycle_idx = next((j for j, c in enumerate(lowered) if "cycle" in c), None)
+            return i, lowered.index("from"), lowered.index("to"), cycle_idx
+    return None
+
+
+def parse_table(table) -> Optional[BulletinTable]:
+    """Parse one <table> element; None when it is not a From/To transit table."""
+    rows = _table_rows(table)
+    header = _find_header(rows)
+    if header is None:
+        return None
+    header_idx, from_idx, to_idx, cycle_idx = header
+    start_col_idx = cycle_idx if cycle_idx is not None else max(from_idx, to_idx)
+
+    from_codes, to_codes, cycles, values = [], [], [], []
+    for row in rows[header_idx + 1:]:
+        from_code = normalize_location_code(row[from_idx]) if from_idx < len(row) else ""
+        to_code = normalize_location_code(row[to_idx]) if to_idx < len(row) else ""
+        if not from_code or not to_code:
+            continue
+
+        numbers = []
+        for text in row[start_col_idx + 1:]:
+            number = _to_int(text)
+            if number != MISSING:
+                numbers.append(number)
+                if len(numbers) == N_VALUES:
+                    break
+        numbers.extend([MISSING] * (N_VALUES - len(numbers)))
+
+        from_codes.append(from_code)
+        to_codes.append(to_code)
+        cycles.append(_to_int(row[cycle_idx]) if cycle_idx is not None and cycle_idx < len(row) else MISSING)
+        values.append(numbers)
+
+    return BulletinTable(
+        from_codes=np.array(from_codes, dtype=object),
+        to_codes=np.array(to_codes, dtype=object),
+        cycles=np.array(cycles, dtype=np.int64),
+        values=np.array(values, dtype=np.int64).reshape(-1, N_VALUES),
+    )
+
+
+def parse_bulletin_tables(root) -> List[BulletinTable]:
+    """Parse every transit table in a bulletin document."""
+    tables = []
+    for table in root.iter("table"):
+        if _is_hidden(table):
+            continue
+        parsed = parse_table(table)
+        if parsed is not None and len(parsed.cycles):
+            tables.append(parsed)
+    return tables
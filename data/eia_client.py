@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+EIA API v2 client for PADD 3 -> PADD 1 pipeline movements.
+
+Replaces the ad-hoc requests.get calls in max_vol_test.ipynb: pages are fetched
+concurrently over one pooled session, every response is cached on disk keyed by
+its query (refreshed with ETag / Last-Modified validators once stale), and
+volumes are normalized to KBD exactly like the notebook's clean().
+
+The API key is read from the EIA_API_KEY environment variable (or passed in);
+it is never stored in the cache. eia_fake_server.EIAFakeServer serves the same
+API shape locally for offline runs.
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+EIA_BASE_URL = "https://api.eia.gov/v2"
+PIPE_ROUTE = "petroleum/move/pipe"
+MAX_PAGE_LENGTH = 5000
+
+# Series used by max_vol_test.ipynb (PADD 3 -> PADD 1 pipeline movements)
+GASOLINE_SERIES = ["MBCMPP1P31", "MGFMPP1P31"]
+GASOIL_SERIES = ["MDIMPP1P31"]
+
+
+def to_kbd(df: pd.DataFrame, group: bool = False) -> pd.DataFrame:
+    """
+    Normalize EIA monthly volumes to KBD, same as clean() in max_vol_test.ipynb.
+
+    Args:
+        df: Raw EIA rows with 'period' and 'value' columns
+        group: Sum all series per period (gasoline is the sum of two series)
+
+    Returns:
+        DataFrame with period, value (KBD) and units columns sorted by period
+    """
+    out = df[["period", "value"]].copy()
+    out["value"] = pd.to_numeric(out["value"], errors="coerce") / 30
+    out["units"] = "KBD"
+    if group:
+        out = out.groupby("period", as_index=False)["value"].sum()
+    return out.sort_values("period").reset_index(drop=True)
+
+
+class EIAClient:
+    """Paginated, pooled and disk-cached EIA API v2 client."""
+
+    def __init__(self, api_key: Optional[str] = None, base_url: str = EIA_BASE_URL,
+                 cache_dir: Optional[str] = None, max_age: float = 24 * 3600,
+                 workers: int = 4, page_length: int = MAX_PAGE_LENGTH, timeout: float = 30.0):
+        """
+        Initialize the client.
+
+        Args:
+            api_key: EIA API key; defaults to the EIA_API_KEY environment variable
+            base_url: API root (point at EIAFakeServer.base_url for offline use)
+            cache_dir: Directory for cached responses; None disables the cache
+            max_age: Seconds a cached response is served without revalidation
+            workers: Concurrent page requests (also the connection pool size)
+            page_length: Rows requested per page (the API caps this at 5000)
+            timeout: Per-request timeout in seconds
+        """
+        self.api_key = api_key if api_key is not None else os.environ.get("EIA_API_KEY")
+        if not self.api_key:
+            raise ValueError("EIA API key required: pass api_key or set EIA_API_KEY")
+        self.base_url = base_url.rstrip("/")
+        self.cache_dir = cache_dir
+        self.max_age = max_age
+        self.workers = max(1, int(workers))
+        self.page_length = max(1, min(int(page_length), MAX_PAGE_LENGTH))
+        self.timeout = timeout
+        self.stats = {"requests": 0, "cache_hits": 0, "not_modified": 0}
+        self._stats_lock = threading.Lock()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.workers,
+            max_retries=Retry(total=3, backoff_factor=0.5,
+                              status_forcelist=(429, 500, 502, 503, 504),
+                              allowed_methods=("GET",)),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            self.stats[name] += 1
+
+    @staticmethod
+    def _query_key(route: str, params: Dict[str, Any]) -> str:
+        """Cache key: route + canonical params, without the API key."""
+        canonical = sorted(
+            (k, sorted(v) if isinstance(v, (list, tuple)) else v)
+            for k, v in params.items() if k != "api_key"
+        )
+        payload = json.dumps([route, canonical], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _cache_path(self, key: str) -> Optional[str]:
+        return os.path.join(self.cache_dir, f"{key}.json") if self.cache_dir else None
+
+    def _read_cache(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._cache_path(key)
+        if path is None or not os.path.exists(path):
+            return None
+        with open(path, "r", encoding="utf-8") as fh:
+            return json.load(fh)
+
+    def _write_cache(self, key: str, entry: Dict[str, Any]) -> None:
+        path = self._cache_path(key)
+        if path is None:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump(entry, fh)
+        os.replace(tmp_path, path)
+
+    def _get(self, route: str, params: Dict[str, Any], refresh: bool = False) -> Dict[str, Any]:
+        """
+        GET one page, served from the disk cache when fresh.
+
+        Stale entries are revalidated with If-None-Match / If-Modified-Since;
+        a 304 keeps the cached body and resets its age.
+        """
+        key = self._query_key(route, params)
+        cached = self._read_cache(key)
+        if cached is not None and not refresh and time.time() - cached["fetched_at"] < self.max_age:
+            self._count("cache_hits")
+            return cached["body"]
+
+        headers = {}
+        if cached is not None:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        self._count("requests")
+        response = self.session.get(
+            f"{self.base_url}/{route.strip('/')}/data/",
+            params={**params, "api_key": self.api_key},
+            headers=headers,
+            timeout=self.timeout,
+        )
+        if response.status_code == 304 and cached is not None:
+            self._count("not_modified")
+            cached["fetched_at"] = time.time()
+            self._write_cache(key, cached)
+            return cached["body"]
+        response.raise_for_status()
+
+        body = response.json()
+        self._write_cache(key, {
+            "fetched_at": time.time(),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "body": body,
+        })
+        return body
+
+    def fetch(self, route: str, params: Dict[str, Any], refresh: bool = False) -> pd.DataFrame:
+        """
+        Fetch every page of a query.
+
+        The first page reports the total row count; the remaining offsets are
+        then requested concurrently over the pooled session.
+
+        Args:
+            route: API route below the base URL, e.g. "petroleum/move/pipe"
+            params: Query parameters (frequency, data[0], facets[...][], start, end, sort...)
+            refresh: Revalidate cached pages even if they are younger than max_age
+
+        Returns:
+            DataFrame of all rows in API order
+        """
+        params = {k: v for k, v in params.items() if k not in ("api_key", "offset", "length")}
+
+        def page(offset: int, length: int = self.page_length) -> Dict[str, Any]:
+            return self._get(route, {**params, "offset": offset, "length": length}, refresh)
+
+        first = page(0)
+        first_rows = len(first["response"]["data"])
+        total = int(first["response"].get("total", first_rows))
+        # The server may cap page size below the requested length; step by what it returned
+        step = max(1, min(self.page_length, first_rows))
+        offsets = list(range(step, total, step))
+
+        pages = [first]
+        if offsets:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                pages.extend(pool.map(lambda offset: page(offset, step), offsets))
+
+        rows = [row for body in pages for row in body["response"]["data"]]
+        return pd.DataFrame(rows)
+
+    def fetch_pipe_series(self, series: List[str], start: str = "2018-01",
+                          end: Optional[str] = None, refresh: bool = False) -> pd.DataFrame:
+        """Monthly petroleum/move/pipe rows for the given series ids."""
+        params = {
+            "frequency": "monthly",
+            "data[0]": "value",
+            "facets[series][]": list(series),
+            "start": start,
+            "sort[0][column]": "period",
+            "sort[0][direction]": "desc",
+        }
+        if end is not None:
+            params["end"] = end
+        return self.fetch(PIPE_ROUTE, params, refresh)
+
+
+def fetch_pipeline_kbd(client: EIAClient, start: str = "2018-01", end: Optional[str] = None,
+                       refresh: bool = False) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Gasoline and gasoil PADD 3 -> 1 pipeline volumes in KBD.
+
+    Returns:
+        (gasoline_kbd, gasoil_kbd) shaped like the notebook's clean() output
+    """
+    gasoline = to_kbd(client.fetch_pipe_series(GASOLINE_SERIES, start, end, refresh), group=True)
+    gasoil = to_kbd(client.fetch_pipe_series(GASOIL_SERIES, start, end, refresh), group=False)
+    return gasoline, gasoil
+
+
+def refresh_eia_csvs(out_dir: str = ".", client: Optional[EIAClient] = None,
+                     start: str = "2018-01", end: Optional[str] = None) -> List[str]:
+    """
+    Rewrite gasoline_pipeline_EIA.csv and gasoil_pipline_EIA.csv in out_dir.
+
+    Returns:
+        Paths of the written files
+    """
+    client = client or EIAClient(cache_dir=os.path.join(out_dir, ".eia_cache"))
+    gasoline, gasoil = fetch_pipeline_kbd(client, start, end)
+    paths = [os.path.join(out_dir, "gasoline_pipeline_EIA.csv"),
+             os.path.join(out_dir, "gasoil_pipline_EIA.csv")]
+    gasoline.to_csv(paths[0], index=False)
+    gasoil.to_csv(paths[1], index=False)
+    return paths
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the EIA API v2 data endpoint.
+
+Serves GET <base>/<route>/data/ with the facet, start/end, sort, offset and
+length semantics eia_client relies on, plus ETag / If-None-Match handling.
+The page size is capped (default 12 rows) so pagination is exercised on small
+fixtures. By default the fixture is rebuilt from the committed
+gasoline_pipeline_EIA.csv / gasoil_pipline_EIA.csv, so EIAClient +
+fetch_pipeline_kbd round-trip to those files fully offline.
+"""
+
+import os
+import json
+import hashlib
+import threading
+import pandas as pd
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from typing import List, Dict, Any, Optional
+
+from eia_client import GASOLINE_SERIES, GASOIL_SERIES
+
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def fixture_records(data_dir: str = DATA_DIR) -> List[Dict[str, Any]]:
+    """
+    Raw EIA-style rows (thousand barrels per month) rebuilt from the KBD CSVs.
+
+    Gasoline KBD is split deterministically across its two series so the
+    grouped sum (and /30) reproduces the CSV values.
+    """
+    records = []
+    gasoline = pd.read_csv(os.path.join(data_dir, "gasoline_pipeline_EIA.csv"))
+    for period, value in zip(gasoline["period"], gasoline["value"]):
+        total = value * 30
+        first = round(total * 0.75, 3)
+        records.append({"period": period, "series": GASOLINE_SERIES[0], "value": first, "units": "MBBL"})
+        records.append({"period": period, "series": GASOLINE_SERIES[1], "value": total - first, "units": "MBBL"})
+    gasoil = pd.read_csv(os.path.join(data_dir, "gasoil_pipline_EIA.csv"))
+    for period, value in zip(gasoil["period"], gasoil["value"]):
+        records.append({"period": period, "series": GASOIL_SERIES[0], "value": value * 30, "units": "MBBL"})
+    return records
+
+
+class EIAFakeServer:
+    """Threaded HTTP server answering EIA v2 data queries from in-memory records."""
+
+    def __init__(self, records: Optional[List[Dict[str, Any]]] = None, page_limit: int = 12,
+                 host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialize the server (call start() or use it as a context manager).
+
+        Args:
+            records: Rows with at least period, series and value; defaults to fixture_records()
+            page_limit: Maximum rows returned per request, whatever length asks for
+            host: Interface to bind
+            port: Port to bind; 0 picks a free port
+        """
+        self.records = records if records is not None else fixture_records()
+        self.page_limit = page_limit
+        self.request_log: List[Dict[str, Any]] = []
+        self._httpd = ThreadingHTTPServer((host, port), self._handler())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v2"
+
+    def _query(self, query: Dict[str, List[str]]) -> Dict[str, Any]:
+        rows = self.records
+        series = query.get("facets[series][]")
+        if series:
+            rows = [r for r in rows if r["series"] in series]
+        if "start" in query:
+            rows = [r for r in rows if r["period"] >= query["start"][0]]
+        if "end" in query:
+            rows = [r for r in rows if r["period"] <= query["end"][0]]
+        descending = query.get("sort[0][direction]", ["asc"])[0] == "desc"
+        rows = sorted(rows, key=lambda r: (r["period"], r["series"]), reverse=descending)
+
+        offset = int(query.get("offset", ["0"])[0])
+        length = min(int(query.get("length", [str(self.page_limit)])[0]), self.page_limit)
+        # Like the real API, the total is reported as a string
+        return {"response": {"total": str(len(rows)), "data": rows[offset:offset + length]}}
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                query = parse_qs(parsed.query)
+                server.request_log.append({"path": parsed.path, "query": query})
+                if not query.get("api_key"):
+                    self._send(403, {"error": "No api_key was supplied."})
+                    return
+                if not parsed.path.rstrip("/").endswith("/data"):
+                    self._send(404, {"error": "Unknown route"})
+                    return
+                body = json.dumps(server._query(query)).encode("utf-8")
+                etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+                self._send(200, body, etag)
+
+            def _send(self, status, payload, etag=None):
+                body = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                if etag:
+                    self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "EIAFakeServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "EIAFakeServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def main():
+    """Serve the fixture until interrupted (point EIAClient(base_url=...) at it)."""
+    with EIAFakeServer(port=8765) as server:
+        print(f"🛰️  Fake EIA API at {server.base_url} ({len(server.records)} records)")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,41 +1,78 @@
-"""Utility package for Colonial Pipeline forecasting."""
-
-from .correlation import (
-    analyze_correlation_pair,
-    print_correlation_results,
-    create_transit_correlation_matrix,
-    create_summary_table,
-    create_stats_table,
-)
-from .stationarity import (
-    _test_stationarity,
-    _print_stationarity_results,
-    analyze_pipeline_stationarity,
-)
-from .preparation import _prepare_aligned_data, align_with_l13, impute_missing_l1
-from .cointegration import _estimate_cointegrating_relation
-from .ecm import _build_ecm_model
-from .forecast import _forecast_evaluation
-from .reporting import _display_results, _display_plots, _save_outputs
-from .run_all import run_pipeline_complete
-
-__all__ = [
-    'analyze_correlation_pair',
-    'print_correlation_results',
-    'create_transit_correlation_matrix',
-    'create_summary_table',
-    'create_stats_table',
-    '_test_stationarity',
-    '_print_stationarity_results',
-    'analyze_pipeline_stationarity',
-    '_prepare_aligned_data',
-    'align_with_l13',
-    'impute_missing_l1',
-    '_estimate_cointegrating_relation',
-    '_build_ecm_model',
-    '_forecast_evaluation',
-    '_display_results',
-    '_display_plots',
-    '_save_outputs',
-    'run_pipeline_complete',
-]
+"""Utility package for Colonial Pipeline forecasting.
+
+Public names are resolved lazily: ``import line1_implied`` only builds the
+name -> submodule table below, and a submodule (with its pandas, statsmodels,
+sklearn or matplotlib dependencies) is imported on first attribute access.
+"""
+
+import importlib
+import logging
+
+# Library default: silent until line1_implied.configure_logging() (or the host
+# application) attaches a handler
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+_EXPORTS = {
+    'analyze_correlation_pair': 'correlation',
+    'print_correlation_results': 'correlation',
+    'create_transit_correlation_matrix': 'correlation',
+    'create_summary_table': 'correlation',
+    'create_stats_table': 'correlation',
+    '_test_stationarity': 'stationarity',
+    '_print_stationarity_results': 'stationarity',
+    'analyze_pipeline_stationarity': 'stationarity',
+    '_prepare_aligned_data': 'preparation',
+    'align_with_l13': 'preparation',
+    'impute_missing_l1': 'preparation',
+    '_estimate_cointegrating_relation': 'cointegration',
+    '_build_ecm_model': 'ecm',
+    '_forecast_evaluation': 'forecast',
+    '_display_results': 'reporting',
+    '_display_plots': 'reporting',
+    '_save_outputs': 'reporting',
+    'run_pipeline_complete': 'run_all',
+    'LINE_ROUTES': 'storage',
+    'TransitStore': 'storage',
+    'normalize_transit_frame': 'storage',
+    'load_pipeline_data': 'storage',
+    'import_workbooks': 'storage',
+    'upsert_transit': 'upsert',
+    'latest_transit_rows': 'upsert',
+    'read_transit_file': 'loaders',
+    'load_pipeline_frames': 'loaders',
+    'VintageStore': 'vintage',
+    'PanelCache': 'panel_cache',
+    'load_aligned_panel': 'panel_cache',
+    'MixedFrequencyAligner': 'exogenous',
+    'load_eia_monthly': 'exogenous',
+    'add_exogenous_regressors': 'exogenous',
+    'RunStore': 'runstore',
+    'ArtifactCache': 'artifacts',
+    'StageRunner': 'artifacts',
+    'run_parameter_sweep': 'sweep',
+    'load_route_panel': 'routes',
+    'run_multi_route': 'routes',
+    'Profiler': 'profiling',
+    'FigureRenderer': 'rendering',
+    'write_html_report': 'html_report',
+    'CointegrationResult': 'results',
+    'ECMResult': 'results',
+    'configure_logging': 'log',
+}
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+__all__ = list(_EXPORTS)
@@ -0,0 +1,5 @@
+"""``python -m line1_implied`` – see :mod:`line1_implied.cli`."""
+
+from .cli import main
+
+raise SystemExit(main())
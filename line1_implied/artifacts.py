@@ -0,0 +1,200 @@
+"""Content-addressed stage cache for the ECM pipeline orchestrator.
+
+Each stage output is stored under a key derived from the stage name, its
+version, its parameters and the keys of the stages it consumes, so a rerun
+only recomputes the stages whose inputs changed (e.g. changing ``n_test``
+reuses alignment, cointegration and the ECM fit).
+"""
+
+import hashlib
+import json
+import logging
+import pickle
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .profiling import section
+
+logger = logging.getLogger(__name__)
+
+# Bump when a stage's computation changes so stale artifacts are not reused
+STAGE_VERSION = 2
+
+# Process-wide LRU of pickled artifacts, used when no cache directory is given.
+# Bounded so long notebook sessions and parameter loops do not grow it forever.
+MEMORY_MAX_ENTRIES = 32
+MEMORY_MAX_BYTES = 256 * 2**20
+
+_MEMORY_ARTIFACTS = OrderedDict()
+
+
+def _memory_put(key, blob):
+    if len(blob) > MEMORY_MAX_BYTES:
+        return False
+    _MEMORY_ARTIFACTS[key] = blob
+    _MEMORY_ARTIFACTS.move_to_end(key)
+    total = sum(len(b) for b in _MEMORY_ARTIFACTS.values())
+    while len(_MEMORY_ARTIFACTS) > MEMORY_MAX_ENTRIES or total > MEMORY_MAX_BYTES:
+        _, evicted = _MEMORY_ARTIFACTS.popitem(last=False)
+        total -= len(evicted)
+    return True
+
+
+def clear_memory_cache():
+    """Drop every in-memory stage artifact."""
+    _MEMORY_ARTIFACTS.clear()
+
+
+def input_digest(obj):
+    """Stable SHA-256 of pipeline inputs (frames, arrays, containers, scalars)."""
+    h = hashlib.sha256()
+
+    def _update(value):
+        if isinstance(value, pd.DataFrame):
+            h.update(b'df')
+            h.update(json.dumps([str(c) for c in value.columns]).encode())
+            h.update(json.dumps([str(t) for t in value.dtypes]).encode())
+            h.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+        elif isinstance(value, pd.Series):
+            h.update(b'series' + str(value.name).encode() + str(value.dtype).encode())
+            h.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+        elif isinstance(value, np.ndarray):
+            h.update(b'nd' + str(value.dtype).encode() + str(value.shape).encode())
+            h.update(np.ascontiguousarray(value).tobytes())
+        elif isinstance(value, dict):
+            h.update(b'dict')
+            for key in sorted(value, key=str):
+                h.update(str(key).encode())
+                _update(value[key])
+        elif isinstance(value, (list, tuple)):
+            h.update(b'seq')
+            for item in value:
+                _update(item)
+        elif hasattr(value, 'content_digest'):
+            h.update(value.content_digest().encode())
+        else:
+            h.update(repr(value).encode())
+
+    _update(obj)
+    return h.hexdigest()
+
+
+class ArtifactCache:
+    """Pickled stage artifacts, in memory (shared per process) or on disk.
+
+    Parameters
+    ----------
+    root : path-like, optional
+        Directory for ``<stage>/<key>.pkl`` files; the process-wide memory
+        store (least recently used artifacts evicted beyond
+        :data:`MEMORY_MAX_ENTRIES` entries or :data:`MEMORY_MAX_BYTES`) is
+        used when omitted.
+    """
+
+    def __init__(self, root=None):
+        self.root = Path(root) if root is not None else None
+
+    def _path(self, stage, key):
+        return self.root / stage / f'{key}.pkl'
+
+    def get(self, stage, key):
+        """Return ``(True, value)`` on a hit, ``(False, None)`` otherwise."""
+        if self.root is None:
+            blob = _MEMORY_ARTIFACTS.get((stage, key))
+            if blob is not None:
+                _MEMORY_ARTIFACTS.move_to_end((stage, key))
+        else:
+            path = self._path(stage, key)
+            blob = path.read_bytes() if path.exists() else None
+        if blob is None:
+            return False, None
+        try:
+            return True, pickle.loads(blob)
+        except Exception:
+            return False, None
+
+    def put(self, stage, key, value):
+        """Store an artifact; returns False when it cannot be pickled (or exceeds the memory cap)."""
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return False
+        if self.root is None:
+            return _memory_put((stage, key), blob)
+        path = self._path(stage, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix('.tmp')
+        tmp.write_bytes(blob)
+        tmp.replace(path)
+        return True
+
+
+class StageRunner:
+    """Run named stages in dependency order, caching each by its inputs.
+
+    ``records`` collects, per stage, the artifact key, whether it was a cache
+    ``'hit'``, a ``'miss'`` (computed and stored), ``'uncached'`` (caching
+    disabled or not picklable) and the wall time in seconds.
+    """
+
+    def __init__(self, cache=None, enabled=True):
+        self.cache = cache if cache is not None else ArtifactCache()
+        self.enabled = enabled
+        self.keys = {}
+        self.records = {}
+
+    def stage_key(self, name, deps=(), params=None, inputs=None):
+        parts = {
+            'stage': name,
+            'version': STAGE_VERSION,
+            'deps': [self.keys[d] for d in deps],
+            'params': params or {},
+            'inputs': input_digest(inputs) if inputs is not None else None,
+        }
+        return hashlib.sha256(json.dumps(parts, sort_keys=True, default=repr).encode()).hexdigest()
+
+    def run(self, name, func, deps=(), params=None, inputs=None, cacheable=True):
+        """Return the stage output, computing ``func()`` only on a cache miss.
+
+        Parameters
+        ----------
+        name : str
+            Stage name (also the artifact sub-directory).
+        func : callable
+            Zero-argument callable producing the stage output.
+        deps : sequence of str
+            Names of upstream stages whose keys feed this stage's key.
+        params : dict, optional
+            JSON-serializable parameters of the stage.
+        inputs : object, optional
+            External inputs hashed with :func:`input_digest`.
+        cacheable : bool, default True
+            ``False`` for side-effecting stages (display, save) that always run.
+
+        The stage (cache lookup included) is recorded as a section of the
+        active :class:`~line1_implied.profiling.Profiler`, if any.
+        """
+        key = self.stage_key(name, deps, params, inputs)
+        self.keys[name] = key
+        use_cache = self.enabled and cacheable
+        start = time.perf_counter()
+
+        with section(name, dump=True):
+            if use_cache:
+                hit, value = self.cache.get(name, key)
+                if hit:
+                    self.records[name] = {'key': key, 'status': 'hit', 'seconds': time.perf_counter() - start}
+                    logger.info("♻️  %s: reusing cached artifact %s", name, key[:12])
+                    return value
+
+            value = func()
+            status = 'miss' if use_cache and self.cache.put(name, key, value) else 'uncached'
+        self.records[name] = {'key': key, 'status': status, 'seconds': time.perf_counter() - start}
+        return value
+
+
+__all__ = ['ArtifactCache', 'StageRunner', 'input_digest', 'clear_memory_cache']
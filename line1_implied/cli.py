@@ -0,0 +1,291 @@
+"""Headless batch entry point: ``python -m line1_implied <command> [options]``.
+
+Commands mirror the notebook workflow for scheduled jobs:
+
+* ``extract``  – pull bulletins (Outlook, or a raw archive replay) into a TransitStore.
+* ``prepare``  – build / refresh the aligned panel cache.
+* ``fit``      – estimate the cointegrating relation and the ECM.
+* ``backtest`` – fit, then run the rolling out-of-sample evaluation.
+* ``export``   – backtest and write panel, forecasts and metrics to disk.
+
+Plotting libraries are never imported (the diagnostic plots are skipped and the
+matplotlib backend is forced to ``Agg`` in case a dependency pulls it in).
+The pipeline's log records go to stderr (``--log-level``, or warnings only
+with ``--quiet``); stdout carries exactly one strict JSON document (non-finite
+numbers become ``null``) with the command result and its timings, including
+the interpreter cold start (wall clock since process start where ``/proc`` is
+available, plus CPU time; run with ``python -X importtime`` for a per-module
+breakdown).
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from pathlib import Path
+
+_DATA_DIR = Path(__file__).resolve().parent.parent / 'data'
+
+
+def _scalar(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return value
+
+
+def _json_safe(value):
+    """Replace non-finite floats (NaN, ±inf) with None so the output is strict JSON."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _json_safe(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_json_safe(item) for item in value]
+    return value
+
+
+def _dump_json(payload, fh, **kwargs):
+    """Write ``payload`` as strict JSON (numpy/pandas values converted, NaN/inf as null)."""
+    from .reporting import _json_serializer
+
+    # Round-trip through the serializer first so numpy/pandas values are plain floats here
+    payload = _json_safe(json.loads(json.dumps(payload, default=_json_serializer)))
+    json.dump(payload, fh, allow_nan=False, **kwargs)
+    return payload
+
+
+def _process_age():
+    """Wall-clock seconds since this process started (Linux ``/proc``), or None."""
+    try:
+        with open('/proc/self/stat', encoding='ascii') as fh:
+            # starttime is field 22; fields after the ')' of the command name start at field 3
+            start_ticks = int(fh.read().rsplit(')', 1)[1].split()[19])
+        with open('/proc/uptime', encoding='ascii') as fh:
+            uptime = float(fh.read().split()[0])
+        # Both clocks tick at 1/SC_CLK_TCK (usually 10 ms)
+        return round(uptime - start_ticks / os.sysconf('SC_CLK_TCK'), 2)
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def _panel(args):
+    from .panel_cache import load_aligned_panel
+    return load_aligned_panel(args.source, cache_dir=args.cache_dir, how=args.how)
+
+
+def _fit(args, aligned_data):
+    from .cointegration import _estimate_cointegrating_relation
+    from .ecm import _build_ecm_model
+
+    coint = _estimate_cointegrating_relation(aligned_data, plot=False)
+    if coint is None:
+        raise RuntimeError("Cointegrating relation could not be estimated.")
+    ecm = _build_ecm_model(aligned_data, coint, ic_kind=args.ic, include_L3=not args.no_l3,
+                           max_lags_cap=args.max_lags)
+    if ecm is None:
+        raise RuntimeError("ECM could not be estimated.")
+    return coint, ecm
+
+
+def _fit_summary(coint, ecm):
+    diagnostics = ecm['diagnostics']
+    return {
+        'cointegration': {
+            'coefficients': {k: _scalar(v) for k, v in coint['coefficients'].items()},
+            'r_squared': _scalar(coint['r_squared']),
+            'durbin_watson': _scalar(coint['durbin_watson']),
+        },
+        'ecm': {
+            'lags': ecm['specification']['lags'],
+            'ic_used': ecm['specification']['ic_used'],
+            'sample_size': ecm['specification']['sample_size'],
+            'regressors': ecm['specification']['regressors'],
+            'diagnostics': {k: _scalar(v) for k, v in diagnostics.items() if k != 'residuals'},
+        },
+    }
+
+
+def _backtest(args, aligned_data, coint, ecm):
+    from .forecast import _forecast_evaluation
+
+    vintages = None
+    if args.vintage_store:
+        from .vintage import VintageStore
+        vintages = VintageStore.from_store(args.vintage_store)
+    return _forecast_evaluation(aligned_data.copy(), coint, ecm, n_test=args.n_test,
+                                exog_nowcast=args.exog_nowcast, exog_ma_lookback=args.exog_ma_lookback,
+                                vintages=vintages)
+
+
+def cmd_extract(args):
+    """Extract bulletins for the pipeline routes and append them to a store."""
+    if str(_DATA_DIR) not in sys.path:
+        sys.path.insert(0, str(_DATA_DIR))
+    from ScrapeEmail import extract_colonial_transit_routes, replay_colonial_transit_routes
+    from .storage import TransitStore, line_route_keys
+
+    routes = args.route or line_route_keys()
+    if args.archive:
+        rows = replay_colonial_transit_routes(args.archive, routes, workers=args.workers,
+                                              cache_dir=args.bulletin_cache)
+    else:
+        rows = extract_colonial_transit_routes(routes, state_path=args.state, workers=args.workers,
+                                               cache_dir=args.bulletin_cache)
+    written = TransitStore(args.store).append(rows)
+    return {'store': str(args.store), 'routes': routes, 'rows_extracted': len(rows), 'rows_written': written}
+
+
+def cmd_prepare(args):
+    """Build or refresh the aligned panel cache."""
+    aligned_data = _panel(args)
+    return {
+        'cache_dir': str(args.cache_dir),
+        'rows': len(aligned_data),
+        'start': aligned_data['Date'].min(),
+        'end': aligned_data['Date'].max(),
+        'columns': list(aligned_data.columns),
+    }
+
+
+def cmd_fit(args):
+    """Fit the cointegrating relation and the ECM on the cached panel."""
+    aligned_data = _panel(args)
+    coint, ecm = _fit(args, aligned_data)
+    return {'rows': len(aligned_data), **_fit_summary(coint, ecm)}
+
+
+def cmd_backtest(args):
+    """Fit and run the rolling out-of-sample evaluation."""
+    aligned_data = _panel(args)
+    coint, ecm = _fit(args, aligned_data)
+    eval_out = _backtest(args, aligned_data, coint, ecm)
+    return {
+        'rows': len(aligned_data),
+        'lags': ecm['specification']['lags'],
+        'metrics': eval_out['metrics'],
+        'summary': eval_out['summary'],
+    }
+
+
+def cmd_export(args):
+    """Backtest and write the panel, forecasts and metrics to ``--out``."""
+    aligned_data = _panel(args)
+    coint, ecm = _fit(args, aligned_data)
+    eval_out = _backtest(args, aligned_data, coint, ecm)
+
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    tables = {
+        'aligned_data': aligned_data,
+        'forecasts': eval_out['forecast_results'],
+        'metrics': eval_out['metrics'],
+    }
+    files = {}
+    for name, frame in tables.items():
+        path = out_dir / f'{name}.{args.format}'
+        if args.format == 'parquet':
+            frame.to_parquet(path, index=False)
+        else:
+            frame.to_csv(path, index=False)
+        files[name] = str(path)
+
+    summary_path = out_dir / 'summary.json'
+    with summary_path.open('w', encoding='utf-8') as fh:
+        _dump_json({**_fit_summary(coint, ecm), 'evaluation_summary': eval_out['summary']}, fh, indent=2)
+    files['summary'] = str(summary_path)
+    return {'out': str(out_dir), 'files': files, 'summary': eval_out['summary']}
+
+
+def _add_panel_args(parser):
+    parser.add_argument('--source', action='append', required=True,
+                        help='Workbook or TransitStore root (repeatable)')
+    parser.add_argument('--cache-dir', default='.panel_cache', help='Aligned panel cache directory')
+    parser.add_argument('--how', choices=('common', 'l13'), default='common', help='Panel alignment')
+
+
+def _add_fit_args(parser):
+    _add_panel_args(parser)
+    parser.add_argument('--ic', choices=('AIC', 'BIC', 'AICc'), default='BIC', help='Lag selection criterion')
+    parser.add_argument('--no-l3', action='store_true', help='Exclude ΔL3 terms from the ECM')
+    parser.add_argument('--max-lags', type=int, default=3, help='Cap on p/q/r in the lag search')
+
+
+def _add_backtest_args(parser):
+    _add_fit_args(parser)
+    parser.add_argument('--n-test', type=int, default=26, help='Out-of-sample size')
+    parser.add_argument('--exog-nowcast', choices=('ma', 'ar1'), default='ma')
+    parser.add_argument('--exog-ma-lookback', type=int, default=3)
+    parser.add_argument('--vintage-store', help='TransitStore root for vintage-aware training data')
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m line1_implied',
+                                     description='Headless Colonial Line 1 ECM pipeline.')
+    parser.add_argument('--quiet', action='store_true', help='Only log warnings and errors to stderr')
+    parser.add_argument('--log-level', default='INFO', choices=('DEBUG', 'INFO', 'WARNING', 'ERROR'),
+                        help='Level of the progress log written to stderr')
+    parser.add_argument('--indent', type=int, default=None, help='Indent the JSON result')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    extract = commands.add_parser('extract', help=cmd_extract.__doc__)
+    extract.add_argument('--store', required=True, help='TransitStore root to append to')
+    extract.add_argument('--archive', help='Replay a raw bulletin archive instead of reading Outlook')
+    extract.add_argument('--route', action='append', help='FROM-TO route (repeatable); defaults to the pipeline lines')
+    extract.add_argument('--state', help='Incremental extraction state file (Outlook only)')
+    extract.add_argument('--bulletin-cache', help='Parsed-bulletin cache directory')
+    extract.add_argument('--workers', type=int, default=None, help='Parser processes')
+    extract.set_defaults(func=cmd_extract)
+
+    prepare = commands.add_parser('prepare', help=cmd_prepare.__doc__)
+    _add_panel_args(prepare)
+    prepare.set_defaults(func=cmd_prepare)
+
+    fit = commands.add_parser('fit', help=cmd_fit.__doc__)
+    _add_fit_args(fit)
+    fit.set_defaults(func=cmd_fit)
+
+    backtest = commands.add_parser('backtest', help=cmd_backtest.__doc__)
+    _add_backtest_args(backtest)
+    backtest.set_defaults(func=cmd_backtest)
+
+    export = commands.add_parser('export', help=cmd_export.__doc__)
+    _add_backtest_args(export)
+    export.add_argument('--out', required=True, help='Output directory')
+    export.add_argument('--format', choices=('csv', 'parquet'), default='csv')
+    export.set_defaults(func=cmd_export)
+    return parser
+
+
+def main(argv=None):
+    """Run one command and print its JSON result; returns the exit code."""
+    # Everything before this point (interpreter start, package import) is cold start
+    cold_start = _process_age()
+    cold_start_cpu = time.process_time()
+    os.environ.setdefault('MPLBACKEND', 'Agg')
+    args = build_parser().parse_args(argv)
+
+    from .log import configure_logging
+
+    configure_logging('WARNING' if args.quiet else args.log_level, stream=sys.stderr)
+    start = time.perf_counter()
+    payload = {'command': args.command, 'ok': True}
+    try:
+        payload['result'] = args.func(args)
+    except Exception as err:
+        payload.update(ok=False, error=f"{type(err).__name__}: {err}")
+    payload['timings'] = {
+        'cold_start_seconds': cold_start,
+        'cold_start_cpu_seconds': cold_start_cpu,
+        'command_seconds': time.perf_counter() - start,
+    }
+    payload['plotting_imported'] = 'matplotlib' in sys.modules
+
+    payload = _dump_json(payload, sys.stdout, indent=args.indent)
+    sys.stdout.write('\n')
+    return 0 if payload['ok'] else 1
+
+
+__all__ = ['build_parser', 'main']
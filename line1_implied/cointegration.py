@@ -1,12 +1,93 @@
 """Cointegration estimation utilities."""
 
+import logging
+
 import numpy as np
-import statsmodels.api as sm
-from statsmodels.stats.stattools import durbin_watson
-from scipy import stats
-import matplotlib.pyplot as plt
 
-def _estimate_cointegrating_relation(aligned_data):
+from .results import CointegrationResult
+
+logger = logging.getLogger(__name__)
+
+
+def _draw_diagnostics(fig, y, fitted_values, residuals, dates, r_squared):
+    """Actual vs fitted, residuals vs fitted, u_t over time and residual histogram."""
+    from scipy import stats
+
+    axes = fig.subplots(2, 2)
+
+    # Plot 1: Actual vs Fitted
+    axes[0,0].scatter(fitted_values, y, alpha=0.7, color='blue')
+    axes[0,0].plot([y.min(), y.max()], [y.min(), y.max()], 'r--', alpha=0.8)
+    axes[0,0].set_xlabel('Fitted Values')
+    axes[0,0].set_ylabel('Actual L1 Transit Days')
+    axes[0,0].set_title('Actual vs Fitted Values')
+    axes[0,0].grid(True, alpha=0.3)
+
+    # Add R-squared to the plot
+    axes[0,0].text(0.05, 0.95, f'R² = {r_squared:.3f}', transform=axes[0,0].transAxes,
+                  bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
+
+    # Plot 2: Residuals vs Fitted
+    axes[0,1].scatter(fitted_values, residuals, alpha=0.7, color='red')
+    axes[0,1].axhline(y=0, color='black', linestyle='--', alpha=0.8)
+    axes[0,1].set_xlabel('Fitted Values')
+    axes[0,1].set_ylabel('Residuals')
+    axes[0,1].set_title('Residuals vs Fitted Values')
+    axes[0,1].grid(True, alpha=0.3)
+
+    # Plot 3: Residuals over time
+    if dates is not None:
+        axes[1,0].plot(dates, residuals, color='green', alpha=0.7, marker='o', markersize=4)
+        axes[1,0].set_xlabel('Date')
+        axes[1,0].tick_params(axis='x', rotation=45)
+    else:
+        axes[1,0].plot(residuals, color='green', alpha=0.7, marker='o', markersize=4)
+        axes[1,0].set_xlabel('Time Period')
+    axes[1,0].axhline(y=0, color='black', linestyle='--', alpha=0.8)
+    axes[1,0].set_ylabel('Residuals (Error-Correction Term)')
+    axes[1,0].set_title('Error-Correction Term Over Time')
+    axes[1,0].grid(True, alpha=0.3)
+
+    # Plot 4: Residuals histogram with normal curve
+    axes[1,1].hist(residuals, bins=15, density=True, alpha=0.7, color='purple', edgecolor='black')
+    # Add normal distribution overlay
+    x_norm = np.linspace(residuals.min(), residuals.max(), 100)
+    y_norm = stats.norm.pdf(x_norm, residuals.mean(), residuals.std())
+    axes[1,1].plot(x_norm, y_norm, 'r-', linewidth=2, label='Normal Distribution')
+    axes[1,1].set_xlabel('Residuals')
+    axes[1,1].set_ylabel('Density')
+    axes[1,1].set_title('Residuals Distribution')
+    axes[1,1].legend()
+    axes[1,1].grid(True, alpha=0.3)
+
+    fig.tight_layout()
+
+
+def _diagnostic_args(aligned_data, cointegration_results):
+    residuals = cointegration_results['residuals']
+    y = aligned_data.loc[residuals.index, 'L1']
+    dates = aligned_data.loc[residuals.index, 'Date'] if 'Date' in aligned_data.columns else None
+    return y, y - residuals, residuals, dates, cointegration_results['r_squared']
+
+
+def _submit_diagnostics(renderer, aligned_data, cointegration_results):
+    """Queue the diagnostic figure from an existing (possibly cached) result."""
+    return renderer.submit('cointegration_diagnostics', _draw_diagnostics,
+                           *_diagnostic_args(aligned_data, cointegration_results), figsize=(15, 12))
+
+
+def _show_diagnostics(aligned_data, cointegration_results):
+    """Show the diagnostic figure inline from an existing (possibly cached) result; returns the closed figure."""
+    import matplotlib.pyplot as plt
+
+    fig = plt.figure(figsize=(15, 12))
+    _draw_diagnostics(fig, *_diagnostic_args(aligned_data, cointegration_results))
+    plt.show()
+    plt.close(fig)
+    return fig
+
+
+def _estimate_cointegrating_relation(aligned_data, exog_cols=None, plot=True, keep_model=False, renderer=None):
     """
     Estimate the long-run cointegrating relationship between L1 and L13 transit times.
 
@@ -18,19 +99,31 @@ def _estimate_cointegrating_relation(aligned_data):
     -----------
     aligned_data : pd.DataFrame
         DataFrame with columns ['Date', 'L1', 'L3', 'L13', 'trend'] containing aligned time series
+    exog_cols : list of str, optional
+        Extra long-run regressors already present in aligned_data (e.g. the monthly
+        EIA volumes added by line1_implied.exogenous.add_exogenous_regressors)
+    plot : bool, default True
+        Draw the diagnostic figure; False skips matplotlib entirely (headless/batch use)
+    renderer : line1_implied.rendering.FigureRenderer, optional
+        Render the diagnostic figure off-thread to an image file instead of
+        showing it (takes precedence over ``plot``)
+    keep_model : bool, default False
+        Attach the fitted statsmodels results ('model', which also provides
+        'fitted_values') and the diagnostic figure ('diagnostic_plots'). Off by
+        default: both hold full copies of the regression data.
 
     Returns:
     --------
-    dict
-        Dictionary containing:
-        - 'model': fitted statsmodels OLS model object
+    CointegrationResult
+        Slotted result supporting dict-style access, containing:
         - 'residuals': error-correction term (u_t) for ECM
         - 'coefficients': dict with β0 (intercept), β1 (L13 coef), β2 (trend coef)
-        - 'fitted_values': predicted L1 values from the cointegrating relationship
+        - 'param_names', 'cov_params', 'pvalues': parameter covariance and p-values
         - 'summary': comprehensive model diagnostics and interpretation
         - 'r_squared': coefficient of determination
         - 'f_statistic': F-test results for overall model significance
         - 'durbin_watson': test for serial correlation in residuals
+        - 'model', 'diagnostic_plots': only when keep_model=True
 
     Notes:
     ------
@@ -41,20 +134,18 @@ def _estimate_cointegrating_relation(aligned_data):
     - Creates diagnostic plots for model validation
     """
 
-    import numpy as np
     import statsmodels.api as sm
     from statsmodels.stats.stattools import durbin_watson
     from scipy import stats
-    import matplotlib.pyplot as plt
     # (seaborn import optional)
 
-    print("🔍 Estimating Long-Run Cointegrating Relationship")
-    print("="*65)
-    print("Model: L1_t = β0 + β1*L13_t + β2*trend_t + u_t")
-    print()
+    logger.info("🔍 Estimating Long-Run Cointegrating Relationship")
+    logger.info("="*65)
+    logger.info("Model: L1_t = β0 + β1*L13_t + β2*trend_t + u_t")
 
     # Input validation
-    required_cols = ['L1', 'L13', 'trend']
+    exog_cols = list(exog_cols or [])
+    required_cols = ['L1', 'L13', 'trend'] + exog_cols
     missing_cols = [col for col in required_cols if col not in aligned_data.columns]
     if missing_cols:
         raise ValueError(f"Missing required columns: {missing_cols}")
@@ -62,23 +153,24 @@ def _estimate_cointegrating_relation(aligned_data):
     # Check for missing values
     analysis_data = aligned_data[required_cols].copy()
     if analysis_data.isnull().any().any():
-        print("⚠️  Warning: Missing values detected, removing incomplete observations")
+        logger.warning("⚠️  Warning: Missing values detected, removing incomplete observations")
         analysis_data = analysis_data.dropna()
-        print(f"   Observations after cleaning: {len(analysis_data)}")
+        logger.debug("   Observations after cleaning: %s", len(analysis_data))
 
     if len(analysis_data) < 10:
         raise ValueError(f"Insufficient observations ({len(analysis_data)}) for reliable estimation")
 
-    print(f"📊 Data Summary:")
-    print(f"   • Observations: {len(analysis_data)}")
-    print(f"   • L1 range: [{analysis_data['L1'].min():.2f}, {analysis_data['L1'].max():.2f}] days")
-    print(f"   • L13 range: [{analysis_data['L13'].min():.2f}, {analysis_data['L13'].max():.2f}] days")
-    print(f"   • Trend range: [{analysis_data['trend'].min()}, {analysis_data['trend'].max()}]")
-    print()
+    logger.debug("📊 Data Summary:")
+    logger.debug("   • Observations: %s", len(analysis_data))
+    logger.debug("   • L1 range: [%.2f, %.2f] days", analysis_data['L1'].min(), analysis_data['L1'].max())
+    logger.debug("   • L13 range: [%.2f, %.2f] days", analysis_data['L13'].min(), analysis_data['L13'].max())
+    logger.debug("   • Trend range: [%s, %s]", analysis_data['trend'].min(), analysis_data['trend'].max())
+    for col in exog_cols:
+        logger.debug("   • %s range: [%.2f, %.2f]", col, analysis_data[col].min(), analysis_data[col].max())
 
     # Prepare regression data
     y = analysis_data['L1']  # Dependent variable: Line 1 transit times
-    X = analysis_data[['L13', 'trend']]  # Independent variables: Line 13 + trend
+    X = analysis_data[['L13', 'trend'] + exog_cols]  # Independent variables: Line 13 + trend (+ exogenous)
     X = sm.add_constant(X)  # Add intercept term
 
     # Estimate OLS model
@@ -91,9 +183,10 @@ def _estimate_cointegrating_relation(aligned_data):
             'β1_L13': model.params['L13'], 
             'β2_trend': model.params['trend']
         }
+        for col in exog_cols:
+            coefficients[f'β_{col}'] = model.params[col]
 
         residuals = model.resid
-        fitted_values = model.fittedvalues
 
         # Calculate additional diagnostics
         r_squared = model.rsquared
@@ -115,53 +208,52 @@ def _estimate_cointegrating_relation(aligned_data):
             'log_likelihood': model.llf
         }
 
-        print("📈 Model Estimation Results:")
-        print("-" * 40)
-        print(f"   L1_t = {coefficients['β0_intercept']:.4f} + {coefficients['β1_L13']:.4f}*L13_t + {coefficients['β2_trend']:.4f}*trend_t + u_t")
-        print()
-        print("📊 Coefficient Estimates:")
-        print(f"   • β0 (Intercept): {coefficients['β0_intercept']:.4f} ± {model.bse['const']:.4f}")
-        print(f"     - t-stat: {model.tvalues['const']:.3f}, p-value: {model.pvalues['const']:.4f}")
-        print(f"   • β1 (L13 coefficient): {coefficients['β1_L13']:.4f} ± {model.bse['L13']:.4f}")
-        print(f"     - t-stat: {model.tvalues['L13']:.3f}, p-value: {model.pvalues['L13']:.4f}")
-        print(f"   • β2 (Trend coefficient): {coefficients['β2_trend']:.4f} ± {model.bse['trend']:.4f}")
-        print(f"     - t-stat: {model.tvalues['trend']:.3f}, p-value: {model.pvalues['trend']:.4f}")
-        print()
+        logger.debug("📈 Model Estimation Results:")
+        logger.debug("-" * 40)
+        logger.debug("   L1_t = %.4f + %.4f*L13_t + %.4f*trend_t + u_t", coefficients['β0_intercept'], coefficients['β1_L13'], coefficients['β2_trend'])
+        logger.debug("📊 Coefficient Estimates:")
+        logger.debug("   • β0 (Intercept): %.4f ± %.4f", coefficients['β0_intercept'], model.bse['const'])
+        logger.debug("     - t-stat: %.3f, p-value: %.4f", model.tvalues['const'], model.pvalues['const'])
+        logger.debug("   • β1 (L13 coefficient): %.4f ± %.4f", coefficients['β1_L13'], model.bse['L13'])
+        logger.debug("     - t-stat: %.3f, p-value: %.4f", model.tvalues['L13'], model.pvalues['L13'])
+        logger.debug("   • β2 (Trend coefficient): %.4f ± %.4f", coefficients['β2_trend'], model.bse['trend'])
+        logger.debug("     - t-stat: %.3f, p-value: %.4f", model.tvalues['trend'], model.pvalues['trend'])
+        for col in exog_cols:
+            logger.debug("   • β (%s): %.6f ± %.6f", col, model.params[col], model.bse[col])
+            logger.debug("     - t-stat: %.3f, p-value: %.4f", model.tvalues[col], model.pvalues[col])
 
         # Economic interpretation
-        print("💡 Economic Interpretation:")
-        print("-" * 40)
+        logger.debug("💡 Economic Interpretation:")
+        logger.debug("-" * 40)
         if model.pvalues['L13'] < 0.05:
             direction = "increases" if coefficients['β1_L13'] > 0 else "decreases"
-            print(f"   • L13 Effect: 1-day increase in L13 transit time {direction} L1 by {abs(coefficients['β1_L13']):.3f} days")
-            print(f"     (Statistically significant at 5% level)")
+            logger.debug("   • L13 Effect: 1-day increase in L13 transit time %s L1 by %.3f days", direction, abs(coefficients['β1_L13']))
+            logger.debug("     (Statistically significant at 5% level)")
         else:
-            print(f"   • L13 Effect: No statistically significant relationship detected")
+            logger.debug("   • L13 Effect: No statistically significant relationship detected")
 
         if model.pvalues['trend'] < 0.05:
             trend_direction = "upward" if coefficients['β2_trend'] > 0 else "downward"
             annual_trend = coefficients['β2_trend'] * 365.25  # Approximate annual effect
-            print(f"   • Time Trend: {trend_direction} trend of {coefficients['β2_trend']:.4f} days per period")
-            print(f"     (Approximately {annual_trend:.2f} days per year)")
+            logger.debug("   • Time Trend: %s trend of %.4f days per period", trend_direction, coefficients['β2_trend'])
+            logger.debug("     (Approximately %.2f days per year)", annual_trend)
         else:
-            print(f"   • Time Trend: No significant long-term trend detected")
-        print()
+            logger.debug("   • Time Trend: No significant long-term trend detected")
 
         # Model diagnostics
-        print("🔬 Model Diagnostics:")
-        print("-" * 40)
-        print(f"   • R-squared: {r_squared:.4f} ({r_squared*100:.1f}% of variation explained)")
-        print(f"   • Adjusted R-squared: {adj_r_squared:.4f}")
-        print(f"   • F-statistic: {f_stat:.3f} (p-value: {f_pvalue:.6f})")
-        print(f"   • Durbin-Watson: {dw_stat:.3f}", end="")
+        logger.debug("🔬 Model Diagnostics:")
+        logger.debug("-" * 40)
+        logger.debug("   • R-squared: %.4f (%.1f%% of variation explained)", r_squared, r_squared * 100)
+        logger.debug("   • Adjusted R-squared: %.4f", adj_r_squared)
+        logger.debug("   • F-statistic: %.3f (p-value: %.6f)", f_stat, f_pvalue)
         if 1.5 <= dw_stat <= 2.5:
-            print(" (No significant autocorrelation)")
+            dw_note = "No significant autocorrelation"
         elif dw_stat < 1.5:
-            print(" (Possible positive autocorrelation)")
+            dw_note = "Possible positive autocorrelation"
         else:
-            print(" (Possible negative autocorrelation)")
-        print(f"   • AIC: {model.aic:.2f}, BIC: {model.bic:.2f}")
-        print()
+            dw_note = "Possible negative autocorrelation"
+        logger.debug("   • Durbin-Watson: %.3f (%s)", dw_stat, dw_note)
+        logger.debug("   • AIC: %.2f, BIC: %.2f", model.aic, model.bic)
 
         # Model significance assessment
         if f_pvalue < 0.01:
@@ -173,119 +265,72 @@ def _estimate_cointegrating_relation(aligned_data):
         else:
             significance_level = "not significant (p ≥ 0.10)"
 
-        print(f"🎯 Overall Model Assessment:")
-        print(f"   • Model is {significance_level}")
-        print(f"   • Explains {r_squared*100:.1f}% of L1 transit time variation")
+        logger.debug("🎯 Overall Model Assessment:")
+        logger.debug("   • Model is %s", significance_level)
+        logger.debug("   • Explains %.1f%% of L1 transit time variation", r_squared * 100)
 
         # ECM implications
-        print(f"   • Error-correction term (u_t) ready for ECM modeling")
-        print(f"   • Residuals represent deviations from long-run equilibrium")
-        print()
-
-        # Create diagnostic plots
-        print("📊 Generating Diagnostic Plots...")
-        fig, axes = plt.subplots(2, 2, figsize=(15, 12))
-
-        # Plot 1: Actual vs Fitted
-        axes[0,0].scatter(fitted_values, y, alpha=0.7, color='blue')
-        axes[0,0].plot([y.min(), y.max()], [y.min(), y.max()], 'r--', alpha=0.8)
-        axes[0,0].set_xlabel('Fitted Values')
-        axes[0,0].set_ylabel('Actual L1 Transit Days')
-        axes[0,0].set_title('Actual vs Fitted Values')
-        axes[0,0].grid(True, alpha=0.3)
-
-        # Add R-squared to the plot
-        axes[0,0].text(0.05, 0.95, f'R² = {r_squared:.3f}', transform=axes[0,0].transAxes,
-                      bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
-
-        # Plot 2: Residuals vs Fitted
-        axes[0,1].scatter(fitted_values, residuals, alpha=0.7, color='red')
-        axes[0,1].axhline(y=0, color='black', linestyle='--', alpha=0.8)
-        axes[0,1].set_xlabel('Fitted Values')
-        axes[0,1].set_ylabel('Residuals')
-        axes[0,1].set_title('Residuals vs Fitted Values')
-        axes[0,1].grid(True, alpha=0.3)
-
-        # Plot 3: Residuals over time
-        if 'Date' in aligned_data.columns:
-            time_index = aligned_data['Date'].iloc[:len(residuals)]
-            axes[1,0].plot(time_index, residuals, color='green', alpha=0.7, marker='o', markersize=4)
-            axes[1,0].axhline(y=0, color='black', linestyle='--', alpha=0.8)
-            axes[1,0].set_xlabel('Date')
-            axes[1,0].set_ylabel('Residuals (Error-Correction Term)')
-            axes[1,0].set_title('Error-Correction Term Over Time')
-            axes[1,0].grid(True, alpha=0.3)
-            axes[1,0].tick_params(axis='x', rotation=45)
-        else:
-            axes[1,0].plot(residuals, color='green', alpha=0.7, marker='o', markersize=4)
-            axes[1,0].axhline(y=0, color='black', linestyle='--', alpha=0.8)
-            axes[1,0].set_xlabel('Time Period')
-            axes[1,0].set_ylabel('Residuals (Error-Correction Term)')
-            axes[1,0].set_title('Error-Correction Term Over Time')
-            axes[1,0].grid(True, alpha=0.3)
-
-        # Plot 4: Residuals histogram with normal curve
-        axes[1,1].hist(residuals, bins=15, density=True, alpha=0.7, color='purple', edgecolor='black')
-        # Add normal distribution overlay
-        x_norm = np.linspace(residuals.min(), residuals.max(), 100)
-        y_norm = stats.norm.pdf(x_norm, residuals.mean(), residuals.std())
-        axes[1,1].plot(x_norm, y_norm, 'r-', linewidth=2, label='Normal Distribution')
-        axes[1,1].set_xlabel('Residuals')
-        axes[1,1].set_ylabel('Density')
-        axes[1,1].set_title('Residuals Distribution')
-        axes[1,1].legend()
-        axes[1,1].grid(True, alpha=0.3)
-
-        plt.tight_layout()
-        plt.show()
-
-        # Residual diagnostics
-        print("🔬 Residual Diagnostics:")
-        print("-" * 40)
-
-        # Normality test
-        shapiro_stat, shapiro_p = stats.shapiro(residuals)
-        print(f"   • Shapiro-Wilk normality test: W = {shapiro_stat:.4f}, p = {shapiro_p:.4f}")
-        if shapiro_p > 0.05:
-            print("     Residuals appear normally distributed ✅")
-        else:
-            print("     Residuals may not be normally distributed ⚠️")
-
-        # Residual summary
-        print(f"   • Residual mean: {residuals.mean():.6f} (should be ≈ 0)")
-        print(f"   • Residual std: {residuals.std():.4f}")
-        print(f"   • Min residual: {residuals.min():.4f}")
-        print(f"   • Max residual: {residuals.max():.4f}")
-        print()
-
-        # Prepare return dictionary
-        results = {
-            'model': model,
-            'residuals': residuals,
-            'coefficients': coefficients,
-            'fitted_values': fitted_values,
-            'summary': summary_stats,
-            'r_squared': r_squared,
-            'f_statistic': {'value': f_stat, 'p_value': f_pvalue},
-            'durbin_watson': dw_stat,
-            'diagnostic_plots': fig,
-            'interpretation': {
+        logger.debug("   • Error-correction term (u_t) ready for ECM modeling")
+        logger.debug("   • Residuals represent deviations from long-run equilibrium")
+
+        # Residual diagnostics (report only; skipped unless debug logging is on)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔬 Residual Diagnostics:")
+            logger.debug("-" * 40)
+
+            # Normality test
+            shapiro_stat, shapiro_p = stats.shapiro(residuals)
+            logger.debug("   • Shapiro-Wilk normality test: W = %.4f, p = %.4f", shapiro_stat, shapiro_p)
+            if shapiro_p > 0.05:
+                logger.debug("     Residuals appear normally distributed ✅")
+            else:
+                logger.debug("     Residuals may not be normally distributed ⚠️")
+
+            # Residual summary
+            logger.debug("   • Residual mean: %.6f (should be ≈ 0)", residuals.mean())
+            logger.debug("   • Residual std: %.4f", residuals.std())
+            logger.debug("   • Min residual: %.4f", residuals.min())
+            logger.debug("   • Max residual: %.4f", residuals.max())
+
+        # Compact result: the OLS results and the figure hold full data copies
+        results = CointegrationResult(
+            coefficients={k: float(v) for k, v in coefficients.items()},
+            param_names=tuple(model.params.index),
+            cov_params=model.cov_params().to_numpy(),
+            pvalues={k: float(v) for k, v in model.pvalues.items()},
+            residuals=residuals,
+            exog_columns=exog_cols,
+            summary={k: float(v) if k != 'n_observations' else v for k, v in summary_stats.items()},
+            r_squared=float(r_squared),
+            f_statistic={'value': float(f_stat), 'p_value': float(f_pvalue)},
+            durbin_watson=float(dw_stat),
+            interpretation={
                 'equation': f"L1_t = {coefficients['β0_intercept']:.4f} + {coefficients['β1_L13']:.4f}*L13_t + {coefficients['β2_trend']:.4f}*trend_t + u_t",
-                'l13_effect_significant': model.pvalues['L13'] < 0.05,
-                'trend_effect_significant': model.pvalues['trend'] < 0.05,
-                'model_significant': f_pvalue < 0.05,
-                'variance_explained': r_squared
-            }
-        }
-
-        print("✅ Cointegrating relationship estimation complete!")
-        print(f"📋 Error-correction term (u_t) extracted for ECM modeling")
-        print(f"📊 Model explains {r_squared*100:.1f}% of L1 transit time variation")
+                'l13_effect_significant': bool(model.pvalues['L13'] < 0.05),
+                'trend_effect_significant': bool(model.pvalues['trend'] < 0.05),
+                'model_significant': bool(f_pvalue < 0.05),
+                'variance_explained': float(r_squared)
+            },
+            model=model if keep_model else None,
+        )
+
+        # Same figure path as the display step: residuals keep their own index, so dropped rows stay aligned
+        if renderer is not None:
+            _submit_diagnostics(renderer, aligned_data, results)
+        elif plot:
+            logger.debug("📊 Generating Diagnostic Plots...")
+            fig = _show_diagnostics(aligned_data, results)
+            if keep_model:
+                results.diagnostic_plots = fig
+
+        logger.info("✅ Cointegrating relationship estimation complete!")
+        logger.debug("📋 Error-correction term (u_t) extracted for ECM modeling")
+        logger.info("📊 Model explains %.1f%% of L1 transit time variation", r_squared * 100)
 
         return results
 
     except Exception as e:
-        print(f"❌ Error in model estimation: {str(e)}")
+        logger.error("❌ Error in model estimation: %s", str(e))
         raise e
 
 __all__ = ['_estimate_cointegrating_relation']
@@ -1,12 +1,16 @@
 """Correlation and summary utilities for Colonial Pipeline analysis."""
 
+import logging
+
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.stats import pearsonr, spearmanr
-from statsmodels.tsa.stattools import coint
 
-def analyze_correlation_pair(data1, data2, name1, name2, date_col='Date', value_col='Gas Transit Days'):
+from .log import console
+
+logger = logging.getLogger(__name__)
+
+def analyze_correlation_pair(data1, data2, name1, name2, date_col='Date', value_col='Gas Transit Days',
+                             keep_data=False):
     """
     Analyze correlation between two pipeline datasets
 
@@ -15,10 +19,15 @@ def analyze_correlation_pair(data1, data2, name1, name2, date_col='Date', value_
     - name1, name2: Names for the pipeline lines
     - date_col: Column name for dates
     - value_col: Column name for transit days
+    - keep_data: Also return the merged overlap frame as 'merged_data' (off by
+      default; create_transit_correlation_matrix rebuilds it when needed)
 
     Returns:
-    - Dictionary with correlation results and pipeline data
+    - Dictionary with correlation results (plus pipeline data if keep_data)
     """
+    from scipy.stats import pearsonr, spearmanr
+    from statsmodels.tsa.stattools import coint
+
     # Find overlapping period
     start_date = max(data1[date_col].min(), data2[date_col].min())
     end_date = min(data1[date_col].max(), data2[date_col].max())
@@ -38,8 +47,9 @@ def analyze_correlation_pair(data1, data2, name1, name2, date_col='Date', value_
         'start_date': start_date,
         'end_date': end_date,
         'n_observations': len(merged),
-        'merged_data': merged
     }
+    if keep_data:
+        results['merged_data'] = merged
 
     if len(merged) > 2:
         # FIXED: Use correct column names that match the suffixes
@@ -78,22 +88,23 @@ def analyze_correlation_pair(data1, data2, name1, name2, date_col='Date', value_
 
     return results
 
+@console()
 def print_correlation_results(results):
     """Print formatted correlation analysis results"""
     name1, name2 = results['name1'], results['name2']
-    print(f"\n{'='*60}")
-    print(f"ANALYSIS: {name1} vs {name2}")
-    print(f"{'='*60}")
-    print(f"Period: {results['start_date'].date()} to {results['end_date'].date()}")
-    print(f"Total paired observations: {results['n_observations']}")
+    logger.info("\n" + "=" * 60)
+    logger.info("ANALYSIS: %s vs %s", name1, name2)
+    logger.info("=" * 60)
+    logger.info("Period: %s to %s", results['start_date'].date(), results['end_date'].date())
+    logger.info("Total paired observations: %s", results['n_observations'])
 
     if 'clean_observations' in results:
-        print(f"Clean observations (no NaN): {results['clean_observations']}")
+        logger.info("Clean observations (no NaN): %s", results['clean_observations'])
 
     if 'pearson_r' in results:
-        print(f"\nCorrelation Results:")
-        print(f"  • Pearson:  r = {results['pearson_r']:.4f} (p = {results['pearson_p']:.4f})")
-        print(f"  • Spearman: ρ = {results['spearman_r']:.4f} (p = {results['spearman_p']:.4f})")
+        logger.info("\nCorrelation Results:")
+        logger.info("  • Pearson:  r = %.4f (p = %.4f)", results['pearson_r'], results['pearson_p'])
+        logger.info("  • Spearman: ρ = %.4f (p = %.4f)", results['spearman_r'], results['spearman_p'])
 
         # Interpret strength
         r = abs(results['pearson_r'])
@@ -104,30 +115,26 @@ def print_correlation_results(results):
         else:
             strength = "Weak"
         direction = "positive" if results['pearson_r'] > 0 else "negative"
-        print(f"  • Relationship: {strength} {direction} correlation")
+        logger.info("  • Relationship: %s %s correlation", strength, direction)
 
         # Cointegration results
         if 'coint_stat' in results:
-            print(f"\nCointegration Test:")
-            print(f"  • ADF Statistic: {results['coint_stat']:.4f}")
-            print(f"  • P-value: {results['coint_p']:.4f}")
+            logger.info("\nCointegration Test:")
+            logger.info("  • ADF Statistic: %.4f", results['coint_stat'])
+            logger.info("  • P-value: %.4f", results['coint_p'])
             if results['is_cointegrated']:
-                print(f"  • Result: 🎯 COINTEGRATED (long-term equilibrium exists)")
+                logger.info("  • Result: 🎯 COINTEGRATED (long-term equilibrium exists)")
             else:
-                print(f"  • Result: ❌ Not cointegrated")
+                logger.info("  • Result: ❌ Not cointegrated")
         elif 'coint_error' in results:
-            print(f"\nCointegration Test: Failed ({results['coint_error']})")
+            logger.info("\nCointegration Test: Failed (%s)", results['coint_error'])
     elif 'insufficient_clean_data' in results:
-        print(f"\n⚠️  {results['insufficient_clean_data']}")
+        logger.warning("\n⚠️  %s", results['insufficient_clean_data'])
     else:
-        print("\n⚠️  Insufficient overlapping data for correlation analysis")
-
-def create_transit_correlation_matrix(correlation_results, pipeline_data):
-    """Create a comprehensive pairwise plot matrix with the function resul"""
-
-    # Set up the plot grid (4x4 for comprehensive view)
-    fig = plt.figure(figsize=(16, 16))
+        logger.warning("\n⚠️  Insufficient overlapping data for correlation analysis")
 
+def _draw_correlation_matrix(fig, correlation_results, pipeline_data):
+    """Series, distributions, pairwise scatters and overlay on a 4x3 grid."""
     # Define line info for labeling
     line_info = {
         'Line1': {'name': 'Line 1', 'route': 'HTN→GBJ', 'color': 'blue'},
@@ -137,7 +144,7 @@ def create_transit_correlation_matrix(correlation_results, pipeline_data):
 
     # Row 1: Individual time series
     for i, (line_key, line_data) in enumerate(pipeline_data.items()):
-        ax = plt.subplot(4, 3, i + 1)
+        ax = fig.add_subplot(4, 3, i + 1)
         # Filter out NaN values for plotting
         clean_data = line_data.dropna(subset=['Gas Transit Days'])
         if len(clean_data) > 0:
@@ -151,7 +158,7 @@ def create_transit_correlation_matrix(correlation_results, pipeline_data):
 
     # Row 2: Distribution histograms
     for i, (line_key, line_data) in enumerate(pipeline_data.items()):
-        ax = plt.subplot(4, 3, i + 4)
+        ax = fig.add_subplot(4, 3, i + 4)
         # Filter out NaN values for histogram
         clean_values = line_data['Gas Transit Days'].dropna()
         if len(clean_values) > 0:
@@ -171,22 +178,20 @@ def create_transit_correlation_matrix(correlation_results, pipeline_data):
     pair_keys = ['Line1_vs_Line3', 'Line1_vs_Line13', 'Line3_vs_Line13']
 
     for pos, key in zip(scatter_positions, pair_keys):
-        ax = plt.subplot(4, 3, pos)
+        ax = fig.add_subplot(4, 3, pos)
         results = correlation_results[key]
 
-        # First, ensure we have proper merged data
-        if 'merged_data' not in results or len(results['merged_data']) == 0:
-            # Create merged data if missing
+        # Use the stored merged data, or rebuild it locally (not stored back on the results)
+        merged = results.get('merged_data')
+        if merged is None or len(merged) == 0:
             line1_key = results['name1']
             line2_key = results['name2']
             if line1_key in pipeline_data and line2_key in pipeline_data:
-                data1 = pipeline_data[line1_key][['Date', 'Gas Transit Days']].copy()
-                data2 = pipeline_data[line2_key][['Date', 'Gas Transit Days']].copy()
+                data1 = pipeline_data[line1_key][['Date', 'Gas Transit Days']]
+                data2 = pipeline_data[line2_key][['Date', 'Gas Transit Days']]
                 merged = pd.merge(data1, data2, on='Date', suffixes=(f'_{line1_key}', f'_{line2_key}'))
-                results['merged_data'] = merged
 
-        if 'merged_data' in results and len(results['merged_data']) > 0:
-            merged = results['merged_data']
+        if merged is not None and len(merged) > 0:
             col1 = f"Gas Transit Days_{results['name1']}"
             col2 = f"Gas Transit Days_{results['name2']}"
 
@@ -208,9 +213,9 @@ def create_transit_correlation_matrix(correlation_results, pipeline_data):
                         # Update the results dictionary
                         results['pearson_r'] = r
                         results['pearson_p'] = p_val
-                        print(f"Recalculated correlation for {results['name1']} vs {results['name2']}: r = {r:.3f}")
+                        logger.debug("Recalculated correlation for %s vs %s: r = %.3f", results['name1'], results['name2'], r)
                     except Exception as e:
-                        print(f"Failed to recalculate correlation for {results['name1']} vs {results['name2']}: {e}")
+                        logger.warning("Failed to recalculate correlation for %s vs %s: %s", results['name1'], results['name2'], e)
                         r, p_val = np.nan, np.nan
 
                 # Add regression line with error handling
@@ -225,10 +230,10 @@ def create_transit_correlation_matrix(correlation_results, pipeline_data):
                         x_line = np.linspace(x_vals.min(), x_vals.max(), 100)
                         ax.plot(x_line, p(x_line), "r--", alpha=0.8, linewidth=2)
                     else:
-                        print(f"Warning: Insufficient variation in {results['name1']} data for regression")
+                        logger.warning("Insufficient variation in %s data for regression", results['name1'])
 
                 except (np.linalg.LinAlgError, np.RankWarning) as e:
-                    print(f"Warning: Could not fit regression line for {results['name1']} vs {results['name2']}: {e}")
+                    logger.warning("Could not fit regression line for %s vs %s: %s", results['name1'], results['name2'], e)
 
                 ax.set_xlabel(f"{results['name1']} Transit Days")
                 ax.set_ylabel(f"{results['name2']} Transit Days")
@@ -260,7 +265,7 @@ def create_transit_correlation_matrix(correlation_results, pipeline_data):
         ax.grid(True, alpha=0.3)
 
     # Row 4: Combined time series overlay
-    ax = plt.subplot(4, 1, 4)
+    ax = fig.add_subplot(4, 1, 4)
 
     # Find common date range for overlay (only for lines with data)
     valid_data = {}
@@ -300,7 +305,23 @@ def create_transit_correlation_matrix(correlation_results, pipeline_data):
     ax.grid(True, alpha=0.3)
     ax.tick_params(axis='x', rotation=45)
 
-    plt.tight_layout()
+    fig.tight_layout()
+
+
+def create_transit_correlation_matrix(correlation_results, pipeline_data, renderer=None):
+    """Create a comprehensive pairwise plot matrix with the function resul
+
+    With a renderer (line1_implied.rendering.FigureRenderer) the matrix is
+    drawn off-thread to an image file and a future of its path is returned.
+    """
+    if renderer is not None:
+        return renderer.submit('transit_correlation_matrix', _draw_correlation_matrix,
+                               correlation_results, pipeline_data, figsize=(16, 16))
+
+    import matplotlib.pyplot as plt
+
+    fig = plt.figure(figsize=(16, 16))
+    _draw_correlation_matrix(fig, correlation_results, pipeline_data)
     plt.show()
 
     return fig
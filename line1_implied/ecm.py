@@ -1,11 +1,15 @@
 """Error Correction Model (ECM) construction utilities."""
 
+import logging
+import warnings
+
 import numpy as np
 import pandas as pd
-import statsmodels.api as sm
-from statsmodels.stats.diagnostic import acorr_ljungbox, het_breuschpagan
-from scipy import stats
-import warnings
+
+from .profiling import count, section
+from .results import ECMResult
+
+logger = logging.getLogger(__name__)
 
 def _build_ecm_model(
     aligned_data,
@@ -14,7 +18,9 @@ def _build_ecm_model(
     allow_contemporaneous=False,   # set False to force q,r ≥ 1 (forecast-friendly)
     ic_kind="BIC",                 # "AIC", "BIC", or "AICc" for lag selection
     include_L3=True,               # include ΔL3 terms in the short run
-    max_lags_cap=3                 # small-sample guard for max p/q/r
+    max_lags_cap=3,                # small-sample guard for max p/q/r
+    exog_cols=None,                # extra regressors (e.g. monthly EIA volumes) entering as Δx_{t-1}
+    keep_model=False               # attach the fitted statsmodels results (holds the design matrix)
 ):
     """
     Build Error Correction Model (ECM) with information-criterion lag selection and diagnostics.
@@ -25,16 +31,16 @@ def _build_ecm_model(
 
     Where u_{t-1} is from cointegration of L1 ~ L13 (+ optional trend).
     If allow_contemporaneous=False, q_start=r_start=1 (no contemporaneous Δ exogs).
+    Each column in exog_cols adds a fixed Δx_{t-1} term (outside the lag search); pass
+    the same columns used in the cointegrating relation so u_{t-1} lines up.
 
     Returns:
-      dict with 'model', 'specification', 'diagnostics', 'summary'
+      ECMResult (dict-style access) with 'params', 'cov_params', 'pvalues', 'specification',
+      'diagnostics', 'summary' and 'residuals'; 'model' only when keep_model=True
     """
-    import numpy as np
-    import pandas as pd
     import statsmodels.api as sm
     from statsmodels.stats.diagnostic import acorr_ljungbox, het_breuschpagan
     from scipy import stats
-    import warnings
     warnings.filterwarnings("ignore")
 
     # ---- helpers ----
@@ -69,18 +75,19 @@ def _build_ecm_model(
     if "residuals" not in cointegration_results:
         raise ValueError("Missing 'residuals' in cointegration_results")
 
-    required_cols = ["Date", "L1", "L3", "L13"]
+    exog_cols = list(exog_cols or [])
+    required_cols = ["Date", "L1", "L3", "L13"] + exog_cols
     if not all(c in aligned_data.columns for c in required_cols):
         missing = [c for c in required_cols if c not in aligned_data.columns]
         raise ValueError(f"Missing required columns in aligned_data: {missing}")
 
-    print("=" * 80)
-    print("🔧 BUILDING ERROR CORRECTION MODEL (ECM)")
-    print("=" * 80)
+    logger.info("=" * 80)
+    logger.info("🔧 BUILDING ERROR CORRECTION MODEL (ECM)")
+    logger.info("=" * 80)
 
     # ---- Step 1: Clean, index, differences, align u_{t-1} ----
-    print("📈 Step 1: Index Alignment & First Differences")
-    print("-" * 40)
+    logger.debug("📈 Step 1: Index Alignment & First Differences")
+    logger.debug("-" * 40)
     clean_data = aligned_data[required_cols].dropna().copy().set_index("Date")
     residuals_indexed = cointegration_results["residuals"]
     # Ensure same index on residuals
@@ -91,37 +98,42 @@ def _build_ecm_model(
         residuals_indexed.index = clean_data.index
 
     diff_data = clean_data.diff().dropna()
-    diff_data.columns = ["dL1", "dL3", "dL13"]
+    diff_data = diff_data.rename(columns={c: f"d{c}" for c in diff_data.columns})
+    for col in exog_cols:
+        diff_data[f"d{col}_lag1"] = diff_data.pop(f"d{col}").shift(1)
+    if not include_L3:
+        # Keep ΔL3 out of the lag-search design when it is not part of the short run
+        diff_data = diff_data.drop(columns="dL3")
     u_lag1 = residuals_indexed.shift(1).rename("u_lag1")
 
     model_data_base = diff_data.join(u_lag1).dropna()
-    print(f"   ✅ Created differences: {len(model_data_base)} observations")
-    print(f"   ✅ Error correction term u_{{t-1}} aligned: {len(model_data_base)} observations")
+    logger.debug("   ✅ Created differences: %s observations", len(model_data_base))
+    logger.debug("   ✅ Error correction term u_{t-1} aligned: %s observations", len(model_data_base))
 
     # ---- Step 2: Basic validation ----
-    print("Step 2: Data Validation")
-    print("-" * 40)
-    stds = model_data_base[["dL1", "dL13", "dL3"]].std()
+    logger.debug("Step 2: Data Validation")
+    logger.debug("-" * 40)
+    stds = model_data_base[[c for c in ("dL1", "dL13", "dL3") if c in model_data_base]].std()
     for k, v in stds.items():
-        print(f"   {k} std: {v:.6f}")
+        logger.debug("   %s std: %.6f", k, v)
     if any(stds < 1e-8):
         z = list(stds[stds < 1e-8].index)
         raise ValueError(f"Differenced series near-constant: {z}")
 
     # ---- Step 3: HAC setup ----
-    print("⚙️  Step 3: HAC Covariance Configuration")
-    print("-" * 40)
+    logger.debug("⚙️  Step 3: HAC Covariance Configuration")
+    logger.debug("-" * 40)
     if hac_maxlags is None:
         T = len(model_data_base)
         hac_lags = max(1, min(8, int(4 * (T / 100.0) ** (2 / 9))))
-        print(f"   📊 Auto-computed HAC maxlags: {hac_lags} (based on T={T})")
+        logger.debug("   📊 Auto-computed HAC maxlags: %s (based on T=%s)", hac_lags, T)
     else:
         hac_lags = int(hac_maxlags)
-        print(f"   📊 Using provided HAC maxlags: {hac_lags}")
+        logger.debug("   📊 Using provided HAC maxlags: %s", hac_lags)
 
     # ---- Step 4: IC-based lag selection ----
-    print("🔍 Step 4: IC-Based Lag Selection")
-    print("-" * 40)
+    logger.debug("🔍 Step 4: IC-Based Lag Selection")
+    logger.debug("-" * 40)
     T_eff = len(model_data_base)
     max_lags = min(int(max_lags_cap), max(1, T_eff // 8))  # conservative cap for small T
     p_range = range(1, max_lags + 1)
@@ -135,8 +147,8 @@ def _build_ecm_model(
     else:
         r_range = [-1]  # sentinel = no ΔL3 in short run
 
-    print(f"   🔎 Search grid: p∈{list(p_range)}, q∈{list(q_range)}, r∈{list(r_range)}")
-    print(f"   📐 Selection criterion: {ic_kind.upper()}")
+    logger.debug("   🔎 Search grid: p∈%s, q∈%s, r∈%s", list(p_range), list(q_range), list(r_range))
+    logger.debug("   📐 Selection criterion: %s", ic_kind.upper())
 
     best_ic = np.inf
     best_lags = None
@@ -182,9 +194,11 @@ def _build_ecm_model(
                     # rank check
                     if np.linalg.matrix_rank(X) < X.shape[1]:
                         singular_skipped += 1
+                        count("ecm.singular_skipped")
                         continue
 
-                    model = sm.OLS(y, X).fit(cov_type="HAC", cov_kwds={"maxlags": hac_lags})
+                    with section("ecm.lag_candidate_fit"):
+                        model = sm.OLS(y, X).fit(cov_type="HAC", cov_kwds={"maxlags": hac_lags})
                     k_params = len(model.params)
                     ic_val = _ic_stat(model, nobs=len(model_data), k=k_params, kind=ic_kind)
                     tested += 1
@@ -199,13 +213,13 @@ def _build_ecm_model(
         raise ValueError("No valid lag combination found. Try relaxing settings or check data quality.")
 
     p_opt, q_opt, r_opt = best_lags
-    print(f"   ✅ Optimal lags: (p={p_opt}, q={q_opt}, r={r_opt})  (q/r=-1 means term excluded)")
-    print(f"   🔄 Combinations tested: {tested}, singular skipped: {singular_skipped}")
-    print(f"   🏅 Best {ic_kind.upper()}: {best_ic:.4f}")
+    logger.info("   ✅ Optimal lags: (p=%s, q=%s, r=%s)  (q/r=-1 means term excluded)", p_opt, q_opt, r_opt)
+    logger.debug("   🔄 Combinations tested: %s, singular skipped: %s", tested, singular_skipped)
+    logger.debug("   🏅 Best %s: %.4f", ic_kind.upper(), best_ic)
 
     # ---- Step 5: Final model with optimal lags ----
-    print("🎯 Step 5: Final ECM Model Estimation")
-    print("-" * 40)
+    logger.debug("🎯 Step 5: Final ECM Model Estimation")
+    logger.debug("-" * 40)
     model_data = model_data_base.copy()
 
     # ΔL1 lags
@@ -238,30 +252,30 @@ def _build_ecm_model(
         X_vars += [f"dL13_lag{j}" for j in range(q_start, q_opt + 1)]
     if include_L3 and r_opt >= 0:
         X_vars += [f"dL3_lag{m}" for m in range(r_start, r_opt + 1)]
+    X_vars += [f"d{col}_lag1" for col in exog_cols]
     X_vars += ["u_lag1"]
 
     X_final = sm.add_constant(model_data[X_vars])
     final_model = sm.OLS(y_final, X_final).fit(cov_type="HAC", cov_kwds={"maxlags": hac_lags})
 
-    print("✅ Final ECM Model Specification:")
-    print(f"   • Dependent variable: ΔL1_t")
-    print(f"   • Sample size: {len(model_data)} observations")
-    print(f"   • Variables included: {len(X_final.columns)} (incl. intercept)")
-    print(f"   • R-squared: {final_model.rsquared:.4f}, Adj R²: {final_model.rsquared_adj:.4f}")
-    print(f"   • HAC maxlags: {hac_lags}")
+    logger.info("✅ Final ECM Model Specification:")
+    logger.debug("   • Dependent variable: ΔL1_t")
+    logger.debug("   • Sample size: %s observations", len(model_data))
+    logger.debug("   • Variables included: %s (incl. intercept)", len(X_final.columns))
+    logger.debug("   • R-squared: %.4f, Adj R²: %.4f", final_model.rsquared, final_model.rsquared_adj)
+    logger.debug("   • HAC maxlags: %s", hac_lags)
 
     # ---- Step 6: Diagnostics ----
-    print("🔬 Step 6: Model Diagnostics")
-    print("-" * 40)
+    logger.debug("🔬 Step 6: Model Diagnostics")
+    logger.debug("-" * 40)
     resid = final_model.resid
-    fitted = final_model.fittedvalues
 
     # Ljung-Box
     lb = _ljung_box_safe(resid)
     if lb["status"] == "ok":
-        print(f"      • Ljung-Box (lag={lb['lag']}): {lb['stat']:.4f} (p={lb['pvalue']:.4f})")
+        logger.debug("      • Ljung-Box (lag=%s): %.4f (p=%.4f)", lb['lag'], lb['stat'], lb['pvalue'])
     else:
-        print(f"      • Ljung-Box: skipped (T too small)")
+        logger.debug("      • Ljung-Box: skipped (T too small)")
 
     # Breusch-Pagan
     try:
@@ -280,18 +294,18 @@ def _build_ecm_model(
     ec_pvalue = float(final_model.pvalues["u_lag1"])
     ec_tstat = float(final_model.tvalues["u_lag1"])
 
-    print(f"      • Error Correction (γ): {ec_coeff:.6f} (t={ec_tstat:.3f}, p={ec_pvalue:.4f})")
+    logger.debug("      • Error Correction (γ): %.6f (t=%.3f, p=%.4f)", ec_coeff, ec_tstat, ec_pvalue)
     if not np.isnan(bp_lm):
-        print(f"      • Breusch-Pagan: LM={bp_lm:.4f} (p={bp_lm_pvalue:.4f})")
+        logger.debug("      • Breusch-Pagan: LM=%.4f (p=%.4f)", bp_lm, bp_lm_pvalue)
     if not np.isnan(jb_stat):
-        print(f"      • Jarque-Bera: JB={jb_stat:.4f} (p={jb_pvalue:.4f})")
+        logger.debug("      • Jarque-Bera: JB=%.4f (p=%.4f)", jb_stat, jb_pvalue)
 
     if ec_coeff < 0 and ec_pvalue < 0.05:
-        print("   ✅ Error correction mechanism is valid (negative & significant)")
+        logger.info("   ✅ Error correction mechanism is valid (negative & significant)")
     elif ec_coeff < 0:
-        print("   ⚠️  Error correction coefficient negative but not significant")
+        logger.warning("   ⚠️  Error correction coefficient negative but not significant")
     else:
-        print("   ❌ Error correction coefficient is positive (mechanism invalid)")
+        logger.warning("   ❌ Error correction coefficient is positive (mechanism invalid)")
 
     # cointegration coefficients (if present) for convenience in forecasting
     coint_coeffs = cointegration_results.get("coefficients", {})
@@ -301,9 +315,12 @@ def _build_ecm_model(
     if (-1.0 < ec_coeff < 0.0):
         half_life = -np.log(2) / np.log(1 + ec_coeff)
 
-    results = {
-        "model": final_model,
-        "specification": {
+    results = ECMResult(
+        params={k: float(v) for k, v in final_model.params.items()},
+        param_names=tuple(final_model.params.index),
+        cov_params=np.asarray(final_model.cov_params()),
+        pvalues={k: float(v) for k, v in final_model.pvalues.items()},
+        specification={
             "lags": {"p": p_opt, "q": q_opt, "r": r_opt},
             "sample_size": len(model_data),
             "aic": final_model.aic,
@@ -313,10 +330,11 @@ def _build_ecm_model(
             "regressors": list(X_final.columns),
             "allow_contemporaneous": bool(allow_contemporaneous),
             "include_L3": bool(include_L3),
+            "exog_columns": exog_cols,
             "q_start": q_start if q_opt >= 0 else None,
             "r_start": (r_start if include_L3 and r_opt >= 0 else None),
         },
-        "diagnostics": {
+        diagnostics={
             "r_squared": final_model.rsquared,
             "adj_r_squared": final_model.rsquared_adj,
             "error_correction_coeff": ec_coeff,
@@ -329,11 +347,9 @@ def _build_ecm_model(
             "breusch_pagan_pvalue": bp_lm_pvalue,
             "jarque_bera_stat": jb_stat,
             "jarque_bera_pvalue": jb_pvalue,
-            "residuals": resid,
-            "fitted_values": fitted,
             "coint_coefficients": coint_coeffs,
         },
-        "summary": {
+        summary={
             "model_valid": ec_coeff < 0 and ec_pvalue < 0.05,
             "interpretation": (
                 f"ECM with p={p_opt} lags of ΔL1, "
@@ -343,11 +359,13 @@ def _build_ecm_model(
             "error_correction_speed": abs(ec_coeff) if ec_coeff < 0 else 0.0,
             "half_life": half_life,
         },
-    }
+        residuals=resid,
+        model=final_model if keep_model else None,
+    )
 
-    print("🎉" + "=" * 80)
-    print("✅ ECM MODEL BUILDING COMPLETED SUCCESSFULLY")
-    print("=" * 80)
+    logger.info("🎉" + "=" * 80)
+    logger.info("✅ ECM MODEL BUILDING COMPLETED SUCCESSFULLY")
+    logger.info("=" * 80)
     return results
 
 __all__ = ['_build_ecm_model']
@@ -0,0 +1,164 @@
+"""Mixed-frequency alignment of monthly EIA pipeline volumes onto the transit panel.
+
+``data/gasoline_pipeline_EIA.csv`` and ``data/gasoil_pipline_EIA.csv`` (written
+by ``max_vol_test.ipynb``) hold monthly PADD 3→1 pipeline movements in KBD.
+The transit panel is observed per bulletin/cycle, so each panel date is mapped
+to the monthly series either by step-holding the month's value or by linear
+interpolation between mid-month anchors. The index/weight mapping is cached
+per (source content, panel dates, method) so it is computed once per refresh.
+"""
+
+import hashlib
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Default exogenous sources: column name -> CSV (relative to the repository root)
+EIA_SOURCES = {
+    'gasoline_kbd': 'data/gasoline_pipeline_EIA.csv',
+    'gasoil_kbd': 'data/gasoil_pipline_EIA.csv',
+}
+
+_NS_PER_DAY = 86_400 * 10**9
+
+
+def load_eia_monthly(path):
+    """Read an EIA ``period,value[,units]`` CSV into a month-start indexed Series (KBD)."""
+    df = pd.read_csv(path)
+    if not {'period', 'value'}.issubset(df.columns):
+        raise ValueError(f"{path} must contain 'period' and 'value' columns")
+    months = pd.to_datetime(df['period'].astype(str), format='%Y-%m', errors='coerce')
+    series = pd.Series(pd.to_numeric(df['value'], errors='coerce').to_numpy(), index=months)
+    series = series[series.index.notna()].dropna()
+    series = series.groupby(level=0).sum().sort_index()
+    series.index.name = 'period'
+    return series
+
+
+def _digest(*arrays):
+    h = hashlib.sha256()
+    for array in arrays:
+        h.update(np.ascontiguousarray(array).tobytes())
+    return h.hexdigest()
+
+
+class MixedFrequencyAligner:
+    """Map monthly series onto arbitrary panel dates with a cached mapping.
+
+    Parameters
+    ----------
+    method : {'step', 'linear'}, default 'step'
+        ``'step'`` holds each month's value for every date in that month;
+        ``'linear'`` interpolates between values anchored mid-month.
+    lag_months : int, default 2
+        Publication lag: a panel date only sees months at least this many
+        months old (EIA releases volumes roughly two months after the fact),
+        so a backtest origin never uses volumes published after it.
+    max_hold_months : int, optional
+        How many months past the last available month the final value is held
+        before the regressor becomes NaN. By default the last published value
+        is held indefinitely, which is what a forecaster at that date knows.
+    """
+
+    def __init__(self, method='step', lag_months=2, max_hold_months=None):
+        if method not in {'step', 'linear'}:
+            raise ValueError("method must be one of {'step','linear'}")
+        self.method = method
+        self.lag_months = int(lag_months)
+        self.max_hold_months = None if max_hold_months is None else int(max_hold_months)
+        self._mappings = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def _mapping(self, months, dates):
+        """(left index, right index, right weight, valid) for each panel date."""
+        key = (_digest(months, dates), self.method, self.lag_months, self.max_hold_months)
+        cached = self._mappings.get(key)
+        if cached is not None:
+            self.cache_hits += 1
+            return cached
+        self.cache_misses += 1
+
+        month_ns = months.view('int64')
+        # Shift panel dates back by the publication lag, in calendar months
+        shifted = (pd.DatetimeIndex(dates) - pd.DateOffset(months=self.lag_months)).to_numpy(dtype='datetime64[ns]')
+        shifted_ns = shifted.view('int64')
+        if self.max_hold_months is None:
+            hold_until = np.iinfo('int64').max
+        else:
+            hold_until = (pd.Timestamp(months[-1]) + pd.DateOffset(months=self.max_hold_months + 1)).value
+
+        if self.method == 'step':
+            left = np.searchsorted(month_ns, shifted_ns, side='right') - 1
+            right = left
+            weight = np.zeros(len(dates))
+        else:
+            mids = month_ns + 14 * _NS_PER_DAY
+            right = np.searchsorted(mids, shifted_ns, side='right')
+            left = right - 1
+            inside = (left >= 0) & (right < len(mids))
+            left = np.clip(left, 0, len(mids) - 1)
+            right = np.clip(right, 0, len(mids) - 1)
+            span = (mids[right] - mids[left]).astype('float64')
+            weight = np.where(inside & (span > 0), (shifted_ns - mids[left]) / np.where(span > 0, span, 1), 0.0)
+
+        valid = (shifted_ns >= month_ns[0]) & (shifted_ns < hold_until)
+        mapping = (np.clip(left, 0, None), np.clip(right, 0, None), weight, valid)
+        self._mappings[key] = mapping
+        return mapping
+
+    def align(self, monthly, dates):
+        """Values of a monthly Series at ``dates`` (float array, NaN where unavailable)."""
+        monthly = monthly.dropna().sort_index()
+        if monthly.empty:
+            return np.full(len(dates), np.nan)
+        months = monthly.index.to_numpy(dtype='datetime64[ns]')
+        dates = pd.to_datetime(pd.Series(dates)).to_numpy(dtype='datetime64[ns]')
+        left, right, weight, valid = self._mapping(months, dates)
+        values = monthly.to_numpy(dtype='float64')
+        out = values[left] * (1.0 - weight) + values[right] * weight
+        return np.where(valid, out, np.nan)
+
+
+_DEFAULT_ALIGNER = {}
+
+
+def add_exogenous_regressors(aligned_data, sources=None, method='step', lag_months=2,
+                             max_hold_months=None, root='.', aligner=None):
+    """Append monthly EIA volumes to an aligned panel as extra regressor columns.
+
+    Parameters
+    ----------
+    aligned_data : pandas.DataFrame
+        Panel with a ``Date`` column (output of :func:`_prepare_aligned_data`).
+    sources : dict, optional
+        Column name -> CSV path or monthly Series; defaults to :data:`EIA_SOURCES`.
+    method, lag_months, max_hold_months
+        See :class:`MixedFrequencyAligner`.
+    root : path-like, default '.'
+        Base directory for relative CSV paths.
+    aligner : MixedFrequencyAligner, optional
+        Reuse a specific aligner (and its mapping cache); a shared aligner per
+        configuration is used otherwise.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Copy of ``aligned_data`` with one column per source. Pass
+        ``exog_cols=list(sources)`` to :func:`_estimate_cointegrating_relation`
+        and :func:`_build_ecm_model` to use them.
+    """
+    sources = sources or EIA_SOURCES
+    if aligner is None:
+        config = (method, int(lag_months), None if max_hold_months is None else int(max_hold_months))
+        aligner = _DEFAULT_ALIGNER.setdefault(config, MixedFrequencyAligner(*config))
+
+    out = aligned_data.copy()
+    for column, source in sources.items():
+        monthly = source if isinstance(source, pd.Series) else load_eia_monthly(Path(root) / source)
+        out[column] = aligner.align(monthly, out['Date'])
+    return out
+
+
+__all__ = ['EIA_SOURCES', 'load_eia_monthly', 'MixedFrequencyAligner', 'add_exogenous_regressors']
@@ -1,11 +1,14 @@
 """Forecast evaluation routines for ECM pipeline."""
 
+import logging
+import warnings
+
 import numpy as np
 import pandas as pd
-from sklearn.metrics import mean_squared_error, mean_absolute_error
-from statsmodels.tsa.arima.model import ARIMA
-import statsmodels.api as sm
-import warnings
+
+from .profiling import count, section
+
+logger = logging.getLogger(__name__)
 
 def _forecast_evaluation(
     aligned_data,
@@ -13,7 +16,9 @@ def _forecast_evaluation(
     ecm_results,
     n_test=26,
     exog_nowcast="ma",       # "ma" (moving average) or "ar1"
-    exog_ma_lookback=3       # lookback window if exog_nowcast == "ma"
+    exog_ma_lookback=3,      # lookback window if exog_nowcast == "ma"
+    vintages=None,           # optional VintageStore for real-time (as-of) training data
+    progress=None            # optional callback(done, total, origin_date) after each origin
 ):
     """
     Comprehensive ECM forecast evaluation with rolling window methodology.
@@ -37,6 +42,15 @@ def _forecast_evaluation(
         How to nowcast ΔL13_{t+1}, ΔL3_{t+1} for horizon h=1 when the ECM uses contemporaneous exogs.
     exog_ma_lookback : int
         Window for moving-average nowcast of exog differences.
+    vintages : VintageStore, optional
+        When given, each origin trains on the panel as it was published on the
+        origin date (``vintages.aligned_as_of``) instead of the final revised
+        values; forecasts are still scored against the final values. Origins
+        with fewer than 10 as-of observations are skipped (never trained on
+        revised data) and counted in ``summary['vintage_skipped_origins']``.
+    progress : callable, optional
+        Called as ``progress(done, total, origin_date)`` after each forecast
+        origin (e.g. to drive a progress bar).
 
     Returns
     -------
@@ -46,17 +60,13 @@ def _forecast_evaluation(
         - 'plots'            : None (placeholder)
         - 'summary'          : Dict with best-per-horizon RMSE and counts
     """
-    print("🔮 STARTING ECM FORECAST EVALUATION")
-    print("="*60)
+    logger.info("🔮 STARTING ECM FORECAST EVALUATION")
+    logger.info("="*60)
 
     # Imports
-    import numpy as np
-    import pandas as pd
     from sklearn.metrics import mean_squared_error, mean_absolute_error
-    from scipy import stats   # noqa: F401 (kept for parity with earlier code)
     import statsmodels.api as sm
     from statsmodels.tsa.arima.model import ARIMA
-    import warnings
     warnings.filterwarnings('ignore')
 
     # --- Helpers ---
@@ -81,10 +91,10 @@ def _forecast_evaluation(
         return phi * last
 
     # --- Data overview ---
-    print(f"📊 Data Overview:")
-    print(f"  • Total observations: {len(aligned_data)}")
-    print(f"  • Test period: {n_test} observations")
-    print(f"  • Training period: {len(aligned_data) - n_test} observations")
+    logger.debug("📊 Data Overview:")
+    logger.debug("  • Total observations: %s", len(aligned_data))
+    logger.debug("  • Test period: %s observations", n_test)
+    logger.debug("  • Training period: %s observations", len(aligned_data) - n_test)
 
     if len(aligned_data) < n_test + 10:
         raise ValueError(f"Insufficient data: need at least {n_test + 10} observations")
@@ -102,6 +112,21 @@ def _forecast_evaluation(
     if 'trend' not in aligned_data.columns:
         aligned_data['trend'] = np.arange(len(aligned_data))
 
+    if vintages is not None and not isinstance(aligned_data.index, pd.DatetimeIndex):
+        raise ValueError("Vintage-aware evaluation requires a 'Date' column in aligned_data.")
+
+    def _vintage_train_data(origin_date):
+        # Panel as published on the origin date; trend is the position on the final timeline.
+        # None when too little was published: revised data would reintroduce look-ahead.
+        panel = vintages.aligned_as_of(origin_date)
+        if len(panel) < 10:
+            return None
+        panel['trend'] = np.searchsorted(aligned_data.index.values, panel['Date'].values, side='right')
+        for col in exog_cols:
+            # Exogenous regressors are not vintaged; carry the panel's values forward onto vintage dates
+            panel[col] = aligned_data[col].reindex(pd.DatetimeIndex(panel['Date']), method='ffill').to_numpy()
+        return panel.set_index('Date')
+
     # Extract cointegration coefficients (with sensible fallbacks)
     beta = cointegration_results.get('coefficients', {})
     if not beta:
@@ -111,38 +136,71 @@ def _forecast_evaluation(
     beta_L13       = float(beta.get('β1_L13', beta.get('L13', -1.0)))   # fallback sign only
     beta_trend     = float(beta.get('β2_trend', beta.get('trend', 0.0)))
 
-    print(f"\n🧭 Cointegrating equation used for ECT:")
+    # Optional exogenous regressors (long run from cointegration, Δx_{t-1} from the ECM)
+    coint_exog = list(cointegration_results.get('exog_columns') or [])
+    beta_exog = {c: float(beta[f'β_{c}']) for c in coint_exog}
+    ecm_exog = list(ecm_results['specification'].get('exog_columns') or [])
+    exog_cols = list(dict.fromkeys(coint_exog + ecm_exog))
+    missing_exog = [c for c in exog_cols if c not in aligned_data.columns]
+    if missing_exog:
+        raise ValueError(f"Exogenous regressors used by the fitted models are missing from aligned_data: {missing_exog}")
+    gaps = {c: aligned_data.index[aligned_data[c].isna()] for c in exog_cols}
+    gaps = {c: idx for c, idx in gaps.items() if len(idx)}
+    if gaps:
+        detail = '; '.join(f"{c}: {len(idx)} row(s) from {idx[0]}" for c, idx in gaps.items())
+        raise ValueError(f"Exogenous regressors contain NaN ({detail}). Every origin needs a value; "
+                         "align them with add_exogenous_regressors (which holds the last published month) "
+                         "or drop those rows.")
+
+    def _exog_long_run(frame):
+        return sum(beta_exog[c] * frame[c] for c in coint_exog) if coint_exog else 0.0
+
+    logger.debug("\n🧭 Cointegrating equation used for ECT:")
     trend_txt = f" + {beta_trend:.4f}*trend_t" if beta_trend != 0 else ""
-    print(f"  L1_t = {beta_intercept:.4f} + {beta_L13:.4f}*L13_t{trend_txt} + u_t")
+    logger.debug("  L1_t = %.4f + %.4f*L13_t%s + u_t", beta_intercept, beta_L13, trend_txt)
 
     # Read chosen lags from ECM results
     p_opt = int(ecm_results['specification']['lags']['p'])
     q_opt = int(ecm_results['specification']['lags']['q'])
     r_opt = int(ecm_results['specification']['lags']['r'])
 
-    print(f"\n🎛️ ECM lag structure from training:")
-    print(f"  • (p,q,r) = ({p_opt},{q_opt},{r_opt})")
-    print("  • Equation: ΔL1_t = α + Σ φ_i ΔL1_{t-i} + Σ θ_j ΔL13_{t-j} + Σ ψ_m ΔL3_{t-m} + γ u_{t-1} + ε_t")
+    logger.debug("\n🎛️ ECM lag structure from training:")
+    logger.debug("  • (p,q,r) = (%s,%s,%s)", p_opt, q_opt, r_opt)
+    logger.debug("  • Equation: ΔL1_t = α + Σ φ_i ΔL1_{t-i} + Σ θ_j ΔL13_{t-j} + Σ ψ_m ΔL3_{t-m} + γ u_{t-1} + ε_t")
 
     horizons = [1, 2, 3, 4]
     n_train = len(aligned_data) - n_test
     forecast_results = []
 
-    print(f"\n🎯 Rolling Window Forecast Setup:")
-    print(f"  • Forecast origins: {n_test}")
-    print(f"  • Forecast horizons: {horizons}")
-    print(f"  • Exog nowcast method: {exog_nowcast.upper()}")
+    logger.debug("\n🎯 Rolling Window Forecast Setup:")
+    logger.debug("  • Forecast origins: %s", n_test)
+    logger.debug("  • Forecast horizons: %s", horizons)
+    logger.debug("  • Exog nowcast method: %s", exog_nowcast.upper())
+    logger.debug("  • Training data: %s", 'as-of vintages' if vintages is not None else 'final revised values')
 
-    printed_design_matrix = False
+    printed_design_matrix = not logger.isEnabledFor(logging.DEBUG)
+    skipped_origins = []
+    n_origins = len(aligned_data) - max(horizons) + 1 - n_train
 
     # Iterate forecast origins; require enough room for max horizon
     for i in range(n_train, len(aligned_data) - max(horizons) + 1):
         origin_idx = i - 1
         origin_date = dates[origin_idx]
         date_str = origin_date.strftime('%Y-%m') if hasattr(origin_date, 'strftime') else str(origin_date)
-        print(f"\rForecast origin: {date_str} ({i - n_train + 1}/{len(aligned_data) - max(horizons) + 1 - n_train})", end="")
-
-        train_data = aligned_data.iloc[:i].copy()
+        logger.debug("Forecast origin: %s (%s/%s)", date_str, i - n_train + 1, n_origins)
+
+        count('backtest.origins')
+        if vintages is not None:
+            with section('backtest.vintage_train_data'):
+                train_data = _vintage_train_data(origin_date)
+            if train_data is None:
+                count('backtest.vintage_skipped')
+                skipped_origins.append(origin_date)
+                if progress is not None:
+                    progress(i - n_train + 1, n_origins, origin_date)
+                continue
+        else:
+            train_data = aligned_data.iloc[:i].copy()
 
         # Actual L1 values to verify at horizons
         y_actual = {}
@@ -154,7 +212,8 @@ def _forecast_evaluation(
         # ----- ECM one- through four-step forecasts -----
         try:
             # Construct ECT from cointegration: u_t = L1_t - (β0 + β1 L13_t + β2 trend_t)
-            ect = train_data['L1'] - (beta_intercept + beta_L13 * train_data['L13'] + beta_trend * train_data['trend'])
+            ect = train_data['L1'] - (beta_intercept + beta_L13 * train_data['L13'] + beta_trend * train_data['trend']
+                                      + _exog_long_run(train_data))
 
             # Differences for design matrix
             dL1  = train_data['L1'].diff()
@@ -182,6 +241,10 @@ def _forecast_evaluation(
                 else:
                     ecm_df[f'dL3_lag{lag_m}'] = dL3.shift(lag_m)
 
+            # Exogenous Δx_{t-1} terms
+            for col in ecm_exog:
+                ecm_df[f'd{col}_lag1'] = train_data[col].diff().shift(1)
+
             ecm_df = ecm_df.dropna()
 
             min_required = 1 + p_opt + max(q_opt, r_opt)
@@ -193,24 +256,29 @@ def _forecast_evaluation(
                 expected_cols.extend([f'dL1_lag{lag_i}' for lag_i in range(1, p_opt + 1)])
                 expected_cols.extend([f'dL13_lag{lag_j}' for lag_j in range(0, q_opt + 1)])
                 expected_cols.extend([f'dL3_lag{lag_m}'  for lag_m in range(0, r_opt + 1)])
-                print("\n🔍 ECM Design Matrix Validation:")
-                print(f"  • Expected columns: {expected_cols}")
-                print(f"  • Actual columns:   {list(ecm_df.columns)}")
-                print(f"  • (p,q,r) = ({p_opt},{q_opt},{r_opt})")
-                print(f"  • Min required obs: {min_required + 3}, Available: {len(ecm_df)}")
+                expected_cols.extend([f'd{col}_lag1' for col in ecm_exog])
+                logger.debug("\n🔍 ECM Design Matrix Validation:")
+                logger.debug("  • Expected columns: %s", expected_cols)
+                logger.debug("  • Actual columns:   %s", list(ecm_df.columns))
+                logger.debug("  • (p,q,r) = (%s,%s,%s)", p_opt, q_opt, r_opt)
+                logger.debug("  • Min required obs: %s, Available: %s", min_required + 3, len(ecm_df))
                 printed_design_matrix = True
 
             # Fit ECM (OLS is fine; HAC affects inference not point forecasts)
             y_ecm = ecm_df['dL1']
             X_cols = [c for c in ecm_df.columns if c != 'dL1']
             X_ecm  = sm.add_constant(ecm_df[X_cols])
-            ecm_model = sm.OLS(y_ecm, X_ecm).fit()
+            with section('backtest.ecm_fit'):
+                ecm_model = sm.OLS(y_ecm, X_ecm).fit()
 
             # Prepare paths for recursion
             current_L1    = float(train_data['L1'].iloc[-1])
             current_L13   = float(train_data['L13'].iloc[-1])
             current_L3    = float(train_data['L3'].iloc[-1])
             current_trend = float(train_data['trend'].iloc[-1])
+            # Exogenous levels are held (monthly data), so they shift the ECT by a constant
+            exog_long_run_last = float(_exog_long_run(train_data.iloc[[-1]]).iloc[0]) if coint_exog else 0.0
+            exog_last_diff = {c: float(train_data[c].diff().iloc[-1]) for c in ecm_exog}
 
             L1_path    = [current_L1]
             L13_path   = [current_L13]
@@ -240,7 +308,8 @@ def _forecast_evaluation(
                     continue
 
                 # Compute ECT at t+h-1 using level paths
-                ect_h = L1_path[h-1] - (beta_intercept + beta_L13 * L13_path[h-1] + beta_trend * trend_path[h-1])
+                ect_h = L1_path[h-1] - (beta_intercept + beta_L13 * L13_path[h-1] + beta_trend * trend_path[h-1]
+                                        + exog_long_run_last)
 
                 # Build forecast feature vector aligned to training design
                 X_forecast = {'const': 1.0, 'ECT_lag': ect_h}
@@ -276,6 +345,10 @@ def _forecast_evaluation(
                     else:
                         X_forecast[col] = 0.0
 
+                # Δx_{t-1}: last observed change at h=1, zero afterwards (held levels)
+                for col in ecm_exog:
+                    X_forecast[f'd{col}_lag1'] = exog_last_diff[col] if h == 1 else 0.0
+
                 # Predict ΔL1_{t+h}
                 X_forecast_df = pd.DataFrame([X_forecast], columns=X_ecm.columns)
                 dL1_forecast = float(ecm_model.predict(X_forecast_df).iloc[0])
@@ -296,7 +369,8 @@ def _forecast_evaluation(
                 ecm_forecasts[h] = L1_next
 
         except Exception as e:
-            print(f"\nECM forecast error at {date_str}: {e}")
+            logger.warning("\nECM forecast error at %s: %s", date_str, e)
+            count('backtest.ecm_fallbacks')
             # Fallback: persistence
             ecm_forecasts = {h: float(train_data['L1'].iloc[-1]) for h in horizons if h in y_actual}
 
@@ -304,11 +378,13 @@ def _forecast_evaluation(
         rw_forecasts = {h: float(train_data['L1'].iloc[-1]) for h in y_actual}
 
         try:
-            arima_model = ARIMA(train_data['L1'], order=(0,1,0), trend='c')
-            arima_fit = arima_model.fit()
+            with section('backtest.arima_fit'):
+                arima_model = ARIMA(train_data['L1'], order=(0,1,0), trend='c')
+                arima_fit = arima_model.fit()
             arima_vals = arima_fit.forecast(steps=max(y_actual.keys()))
             arima_forecasts = {h: float(arima_vals[h-1]) for h in y_actual}
         except Exception:
+            count('backtest.arima_fallbacks')
             arima_forecasts = rw_forecasts.copy()
 
         # Store rows
@@ -324,19 +400,26 @@ def _forecast_evaluation(
                 'forecast_origin': origin_date
             })
 
-    print("\n✅ Rolling window forecasts completed!")
+        if progress is not None:
+            progress(i - n_train + 1, n_origins, origin_date)
+
+    logger.info("\n✅ Rolling window forecasts completed!")
+    if skipped_origins:
+        logger.warning("⚠️  Skipped %s origin(s) with fewer than 10 as-of observations (%s to %s)",
+                       len(skipped_origins), skipped_origins[0], skipped_origins[-1])
 
     # Results -> DataFrame
     forecast_df = pd.DataFrame(forecast_results)
     if len(forecast_df) == 0:
         raise ValueError("No forecasts generated - check data and parameters")
 
-    print("\n📈 Forecast Results Summary:")
-    print(f"  • Total forecasts generated: {len(forecast_df)}")
-    print(f"  • By horizon: {dict(forecast_df.groupby('horizon').size())}")
+    logger.debug("\n📈 Forecast Results Summary:")
+    logger.debug("  • Total forecasts generated: %s", len(forecast_df))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("  • By horizon: %s", dict(forecast_df.groupby('horizon').size()))
 
     # Metrics
-    print("\n📊 Computing performance metrics...")
+    logger.debug("\n📊 Computing performance metrics...")
     models = ['ecm_forecast', 'rw_forecast', 'arima_forecast']
     model_names = ['ECM', 'Random Walk', 'ARIMA(0,1,0)']
 
@@ -373,12 +456,14 @@ def _forecast_evaluation(
         'total_forecasts': int(len(forecast_df)),
         'horizons_evaluated': horizons,
         'exog_nowcast': exog_nowcast,
-        'exog_ma_lookback': exog_ma_lookback
+        'exog_ma_lookback': exog_ma_lookback,
+        'vintage_aware': vintages is not None,
+        'vintage_skipped_origins': len(skipped_origins)
     }
 
-    print("\n🏆 Best models by horizon (RMSE):")
+    logger.info("\n🏆 Best models by horizon (RMSE):")
     for item in summary_list:
-        print(f"  • Horizon {item['horizon']}: {item['best_model_rmse']} (RMSE: {item['best_rmse']:.4f})")
+        logger.info("  • Horizon %s: %s (RMSE: %.4f)", item['horizon'], item['best_model_rmse'], item['best_rmse'])
 
     return {
         'forecast_results': forecast_df,
@@ -0,0 +1,243 @@
+"""Single-file HTML report of one pipeline run.
+
+:func:`write_html_report` turns the ``pipeline_results`` dictionary returned by
+:func:`line1_implied.run_all.run_pipeline_complete` into one self-contained
+HTML file: run parameters, key metrics, the model-by-horizon metrics table,
+cointegration and ECM coefficient summaries, and interactive plotly charts of
+forecasts vs actuals, the aligned panel and the error-correction term.
+
+Every chart trace longer than ``max_points`` is downsampled with
+Largest-Triangle-Three-Buckets (LTTB), which keeps the visual peaks and
+troughs of a series while bounding the size of the embedded JSON.
+"""
+
+import html
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+_STYLE = """
+body { font-family: -apple-system, Segoe UI, Helvetica, Arial, sans-serif; margin: 2em auto; max-width: 1200px; color: #222; }
+h1 { font-size: 1.6em; } h2 { font-size: 1.25em; border-bottom: 1px solid #ddd; padding-bottom: .2em; margin-top: 2em; }
+table { border-collapse: collapse; margin: .5em 0 1em; font-size: .9em; }
+th, td { border: 1px solid #ddd; padding: .3em .6em; text-align: right; }
+th { background: #f4f4f4; } td:first-child, th:first-child { text-align: left; }
+.meta { color: #666; font-size: .9em; }
+"""
+
+
+def lttb_indices(x, y, threshold):
+    """Indices of the points kept by Largest-Triangle-Three-Buckets downsampling.
+
+    Parameters
+    ----------
+    x, y : array-like
+        Series coordinates (``x`` increasing; datetimes are allowed).
+    threshold : int
+        Number of points to keep; series that are not longer are returned whole.
+
+    Returns
+    -------
+    numpy.ndarray
+        Sorted integer positions, always including the first and last point.
+    """
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        x = x.astype('datetime64[ns]').astype('int64')
+    x = x.astype('float64')
+    y = np.asarray(y, dtype='float64')
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    every = (n - 2) / (threshold - 2)
+    kept = np.empty(threshold, dtype='int64')
+    kept[0], kept[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        # Triangle with the previous pick and the next bucket's centroid
+        avg_x, avg_y = x[end:next_end].mean(), y[end:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        kept[i + 1] = a
+    return kept
+
+
+def _downsample(x, y, max_points):
+    x, y = pd.Series(x).reset_index(drop=True), pd.Series(y).reset_index(drop=True)
+    valid = y.notna() & x.notna()
+    x, y = x[valid].reset_index(drop=True), y[valid].reset_index(drop=True)
+    keep = lttb_indices(x.to_numpy(), y.to_numpy(), max_points)
+    return x.iloc[keep], y.iloc[keep]
+
+
+def _table(frame, float_format='{:.4f}'.format, index=True):
+    if frame is None or len(frame) == 0:
+        return '<p class="meta">(none)</p>'
+    return frame.to_html(float_format=float_format, index=index, border=0, na_rep='–')
+
+
+def _kv_table(mapping):
+    rows = {str(k): (v if np.isscalar(v) or v is None else json.dumps(v, default=str)) for k, v in mapping.items()}
+    return _table(pd.DataFrame({'value': pd.Series(rows, dtype=object)}))
+
+
+def _coefficients_table(result, keys):
+    from .runstore import _coefficient_rows
+
+    rows = _coefficient_rows('', result) if result is not None else []
+    if not rows:
+        return '<p class="meta">(none)</p>'
+    frame = pd.DataFrame(rows).drop(columns='stage').set_index('term')
+    if keys is not None and len(keys) == len(frame):
+        frame.index = list(keys)
+    return _table(frame)
+
+
+def _forecast_figure(forecast_df, max_points):
+    from plotly.subplots import make_subplots
+    import plotly.graph_objects as go
+
+    horizons = sorted(forecast_df['horizon'].unique())
+    fig = make_subplots(rows=len(horizons), cols=1, shared_xaxes=True, vertical_spacing=0.04,
+                        subplot_titles=[f'H{h}' for h in horizons])
+    series = [('y_actual', 'Actual', '#222'), ('ecm_forecast', 'ECM', '#1f77b4'),
+              ('rw_forecast', 'Random Walk', '#ff7f0e'), ('arima_forecast', 'ARIMA', '#2ca02c')]
+    for row, h in enumerate(horizons, start=1):
+        sub = forecast_df[forecast_df['horizon'] == h].sort_values('date')
+        for col, name, color in series:
+            if col not in sub.columns:
+                continue
+            x, y = _downsample(pd.to_datetime(sub['date']), sub[col], max_points)
+            fig.add_trace(go.Scatter(x=x, y=y, name=name, legendgroup=name, showlegend=row == 1,
+                                     mode='lines+markers' if len(x) <= 60 else 'lines',
+                                     line=dict(color=color, width=1.5)), row=row, col=1)
+    fig.update_layout(height=260 * len(horizons), margin=dict(l=40, r=20, t=40, b=30), hovermode='x unified')
+    return fig
+
+
+def _series_figure(frame, columns, max_points, title):
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    for col in columns:
+        if col in frame.columns:
+            x, y = _downsample(pd.to_datetime(frame['Date']), frame[col], max_points)
+            fig.add_trace(go.Scatter(x=x, y=y, name=col, mode='lines'))
+    fig.update_layout(title=title, height=380, margin=dict(l=40, r=20, t=50, b=30), hovermode='x unified')
+    return fig
+
+
+def write_html_report(pipeline_results, path, max_points=500, include_plotlyjs=True, title=None):
+    """Write one self-contained HTML report for a pipeline run.
+
+    Parameters
+    ----------
+    pipeline_results : dict
+        Output of :func:`run_pipeline_complete` (uses ``aligned_data``,
+        ``cointegration_results``, ``ecm_results``, ``forecast_evaluation``,
+        ``key_metrics``, ``model_summary`` and ``execution_metadata``; missing
+        parts are skipped).
+    path : path-like
+        Destination ``.html`` file.
+    max_points : int, default 500
+        Maximum points per chart trace (LTTB downsampling above that).
+    include_plotlyjs : bool or str, default True
+        ``True`` embeds plotly.js so the file works offline; ``'cdn'`` links
+        it instead (a much smaller file that needs network access).
+    title : str, optional
+        Report title.
+
+    Returns
+    -------
+    pathlib.Path
+        The written file.
+    """
+    import plotly.offline
+
+    eval_out = pipeline_results.get('forecast_evaluation') or {}
+    coint = pipeline_results.get('cointegration_results')
+    ecm = pipeline_results.get('ecm_results')
+    aligned = pipeline_results.get('aligned_data')
+    meta = pipeline_results.get('execution_metadata') or {}
+    title = title or f"ECM pipeline run — {meta.get('start_time', datetime.now().isoformat(timespec='seconds'))}"
+
+    sections = [f'<h1>{html.escape(title)}</h1>',
+                f'<p class="meta">Status: {html.escape(str(meta.get("status", "unknown")))}'
+                f' · run time {meta.get("execution_time_seconds", float("nan")):.1f}s'
+                + (f' · run id {html.escape(str(meta["run_id"]))}' if meta.get('run_id') else '') + '</p>']
+
+    sections.append('<h2>Key metrics</h2>')
+    sections.append(_kv_table({**(pipeline_results.get('key_metrics') or {}),
+                               **(pipeline_results.get('model_summary') or {})}))
+
+    metrics = eval_out.get('metrics')
+    if isinstance(metrics, pd.DataFrame) and not metrics.empty:
+        sections.append('<h2>Out-of-sample metrics</h2>')
+        value_cols = [c for c in metrics.columns if c not in ('model', 'horizon')]
+        sections.append(_table(metrics.pivot_table(index='model', columns='horizon', values=value_cols)))
+
+    if coint is not None:
+        sections.append('<h2>Cointegrating relation</h2>')
+        sections.append(f'<p>{html.escape(str((coint.get("interpretation") or {}).get("equation", "")))}</p>')
+        sections.append(_coefficients_table(coint, list(coint.get('coefficients', {}))))
+        sections.append(_kv_table(coint.get('summary') or {}))
+
+    if ecm is not None:
+        sections.append('<h2>Error correction model</h2>')
+        sections.append(f'<p>{html.escape(str((ecm.get("summary") or {}).get("interpretation", "")))}</p>')
+        sections.append(_coefficients_table(ecm, None))
+        spec = {k: v for k, v in (ecm.get('specification') or {}).items() if k != 'regressors'}
+        diagnostics = {k: v for k, v in (ecm.get('diagnostics') or {}).items() if np.isscalar(v)}
+        sections.append(_kv_table({**spec, **diagnostics}))
+
+    figures = []
+    forecast_df = eval_out.get('forecast_results')
+    if isinstance(forecast_df, pd.DataFrame) and not forecast_df.empty:
+        figures.append(('Forecasts vs actuals', _forecast_figure(forecast_df, max_points)))
+    if isinstance(aligned, pd.DataFrame) and 'Date' in aligned.columns:
+        figures.append(('Aligned panel', _series_figure(aligned, ['L1', 'L3', 'L13'], max_points,
+                                                        'Transit days (aligned panel)')))
+        residuals = coint.get('residuals') if coint is not None else None
+        if residuals is not None and len(residuals) == len(aligned):
+            ect = pd.DataFrame({'Date': aligned['Date'].to_numpy(), 'u_t': np.asarray(residuals)})
+            figures.append(('Error-correction term', _series_figure(ect, ['u_t'], max_points,
+                                                                    'Cointegration residual u_t')))
+    for heading, fig in figures:
+        sections.append(f'<h2>{html.escape(heading)}</h2>')
+        sections.append(fig.to_html(full_html=False, include_plotlyjs=False))
+
+    parameters = meta.get('parameters') or {}
+    if parameters:
+        sections.append('<h2>Run parameters</h2>')
+        sections.append(_kv_table(parameters))
+
+    if include_plotlyjs == 'cdn':
+        script = f'<script src="https://cdn.plot.ly/plotly-{plotly.offline.get_plotlyjs_version()}.min.js"></script>'
+    elif include_plotlyjs:
+        script = f'<script type="text/javascript">{plotly.offline.get_plotlyjs()}</script>'
+    else:
+        script = ''
+
+    document = (
+        '<!DOCTYPE html>\n<html lang="en"><head><meta charset="utf-8">'
+        f'<title>{html.escape(title)}</title><style>{_STYLE}</style>{script}</head>\n'
+        '<body>\n' + '\n'.join(sections) + '\n</body></html>\n'
+    )
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(document, encoding='utf-8')
+    logger.info("📄 HTML report written to %s (%.0f KB)", path, path.stat().st_size / 1024)
+    return path
+
+
+__all__ = ['lttb_indices', 'write_html_report']
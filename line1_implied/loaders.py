@@ -0,0 +1,151 @@
+"""Typed readers for bulletin rows kept in xlsx, CSV or Parquet files.
+
+Files are read with an explicit column list and dtypes and ``Date`` is parsed
+once by the reader. The rows are then normalized, ``Gas Transit Days`` is
+derived and the latest bulletin per (route, year, cycle) is kept, all in
+vectorized form (see :func:`line1_implied.upsert.latest_transit_rows`). Parsed
+files are cached in memory by path, mtime and size, so repeated pipeline runs
+on an unchanged file skip the parse.
+"""
+
+import logging
+from collections import OrderedDict
+from pathlib import Path
+
+import pandas as pd
+
+from .panel_cache import SHEET_LINES
+from .storage import LINE_ROUTES, VALUE_COLUMNS, split_line_rows
+from .upsert import latest_transit_rows
+
+logger = logging.getLogger(__name__)
+
+_READ_COLUMNS = ['Date', 'From', 'To', 'Cycle'] + VALUE_COLUMNS
+_DTYPES = {'From': str, 'To': str, 'Cycle': 'float64', **{col: 'float64' for col in VALUE_COLUMNS}}
+
+_CACHE_SIZE = 16
+_CACHE = OrderedDict()
+
+
+def _read_csv(path):
+    return pd.read_csv(path, usecols=lambda col: col in _READ_COLUMNS, dtype=_DTYPES, parse_dates=['Date'])
+
+
+def _read_parquet(path):
+    import pyarrow.parquet as pq
+
+    names = pq.read_schema(path).names
+    return pd.read_parquet(path, columns=[col for col in _READ_COLUMNS if col in names])
+
+
+def _read_excel(path):
+    # Integer cells with gaps come back as floats; normalize_transit_frame re-types them
+    sheets = pd.read_excel(path, sheet_name=None, usecols=lambda col: col in _READ_COLUMNS,
+                           dtype={'From': str, 'To': str})
+    frames, line_routes = [], {}
+    for sheet_name, sheet in sheets.items():
+        if not {'Date', 'From', 'To', 'Cycle'}.issubset(sheet.columns):
+            continue
+        frames.append(sheet)
+        line = SHEET_LINES.get(sheet_name.lower())
+        if line is not None:
+            routes = (sheet['From'].str.upper() + '-' + sheet['To'].str.upper()).dropna().unique()
+            line_routes.setdefault(line, []).extend(routes)
+    if not frames:
+        raise ValueError(f"{path}: no sheet with bulletin columns {_READ_COLUMNS}")
+    rows = pd.concat(frames, ignore_index=True)
+    rows.attrs['line_routes'] = line_routes
+    return rows
+
+
+_READERS = {
+    '.csv': _read_csv,
+    '.parquet': _read_parquet,
+    '.pq': _read_parquet,
+    '.xlsx': _read_excel,
+    '.xlsm': _read_excel,
+    '.xls': _read_excel,
+}
+
+
+def read_transit_file(path):
+    """Latest-cycle bulletin rows from an xlsx, CSV or Parquet file.
+
+    Parameters
+    ----------
+    path : path-like
+        Workbook (every sheet with ``Date``/``From``/``To``/``Cycle`` columns
+        is read), CSV or Parquet file with the bulletin columns.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Wide rows with ``Route`` and ``Gas Transit Days``, one per
+        (route, year, cycle), sorted by route and date. A copy of the cached
+        parse, reused until the file's mtime or size changes. For workbooks
+        with ``line1``/``line3``/``line13`` sheets, ``attrs['line_routes']``
+        records the routes found on each line's sheet.
+    """
+    path = Path(path).resolve()
+    reader = _READERS.get(path.suffix.lower())
+    if reader is None:
+        raise ValueError(f"Unsupported file type {path.suffix!r}; expected one of {sorted(_READERS)}")
+
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        _CACHE.move_to_end(path)
+        logger.debug("📂 %s unchanged; using cached parse", path.name)
+        return cached[1].copy()
+
+    raw = reader(path)
+    rows = latest_transit_rows(raw)
+    rows.attrs.update(raw.attrs)
+    _CACHE[path] = (stamp, rows)
+    _CACHE.move_to_end(path)
+    while len(_CACHE) > _CACHE_SIZE:
+        _CACHE.popitem(last=False)
+    logger.info("📂 Loaded %s: %s latest-cycle rows over %s route(s)", path.name, len(rows), rows['Route'].nunique())
+    return rows.copy()
+
+
+def load_pipeline_frames(df_or_path, line_routes=None):
+    """``pipeline_data`` (``Line1``/``Line3``/``Line13`` frames) from rows or a file.
+
+    Parameters
+    ----------
+    df_or_path : pandas.DataFrame or path-like
+        Bulletin rows (``Date``, ``From``, ``To``, ``Cycle`` and the day/hour
+        columns; ``Gas Transit Days`` is recomputed), or a file accepted by
+        :func:`read_transit_file`.
+    line_routes : dict, optional
+        Line name -> route mapping as in
+        :func:`line1_implied.storage.line_route_keys`. Defaults to the workbook's
+        line sheets when present (as in :mod:`line1_implied.panel_cache`),
+        otherwise :data:`LINE_ROUTES`.
+
+    Returns
+    -------
+    dict
+        ``pipeline_data`` ready for :func:`_prepare_aligned_data`.
+    """
+    if isinstance(df_or_path, pd.DataFrame):
+        rows = latest_transit_rows(df_or_path)
+    else:
+        rows = read_transit_file(df_or_path)
+
+    line_routes = line_routes or rows.attrs.get('line_routes') or LINE_ROUTES
+    pipeline_data = split_line_rows(rows, line_routes)
+    for line_name, line_df in pipeline_data.items():
+        if line_df.empty:
+            raise ValueError(f"No rows for {line_name} (routes {line_routes[line_name]})")
+    return pipeline_data
+
+
+def clear_cache():
+    """Drop every cached file parse."""
+    _CACHE.clear()
+
+
+__all__ = ['read_transit_file', 'load_pipeline_frames', 'clear_cache']
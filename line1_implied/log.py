@@ -0,0 +1,106 @@
+"""Logging setup for the ``line1_implied`` logger hierarchy.
+
+Every module logs to ``logging.getLogger(__name__)``. The package logger only
+has a ``NullHandler``, so library calls are silent (and skip message
+formatting) until an application or notebook opts in::
+
+    import line1_implied
+    line1_implied.configure_logging()          # progress banners and results
+    line1_implied.configure_logging('DEBUG')   # plus per-step diagnostics/tables
+
+Levels: INFO carries stage banners and results, DEBUG carries diagnostic
+detail (``describe()`` tables, coefficient tests, design matrices,
+per-origin progress), WARNING/ERROR carry problems.
+
+Explicit presentation helpers (``print_correlation_results``,
+``_display_results``, ...) are wrapped in :func:`console`, so they print their
+INFO output to stdout even when logging was never configured.
+"""
+
+import contextlib
+import logging
+import sys
+
+PACKAGE_LOGGER = 'line1_implied'
+
+_HANDLER_NAME = 'line1_implied.console'
+
+
+def configure_logging(level=logging.INFO, stream=None, fmt='%(message)s'):
+    """Send the package's log records to a stream (stdout by default).
+
+    Calling it again replaces the previously configured console handler.
+
+    Parameters
+    ----------
+    level : int or str, default logging.INFO
+        Minimum level for the package loggers.
+    stream : file-like, optional
+        Destination; defaults to ``sys.stdout`` so notebook output looks like
+        the former ``print`` output.
+    fmt : str, default '%(message)s'
+        :class:`logging.Formatter` format string.
+
+    Returns
+    -------
+    logging.Logger
+        The ``line1_implied`` package logger.
+    """
+    logger = logging.getLogger(PACKAGE_LOGGER)
+    for handler in list(logger.handlers):
+        if handler.get_name() == _HANDLER_NAME:
+            logger.removeHandler(handler)
+    handler = logging.StreamHandler(stream if stream is not None else sys.stdout)
+    handler.set_name(_HANDLER_NAME)
+    handler.setFormatter(logging.Formatter(fmt))
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    return logger
+
+
+def _has_output_handler(logger):
+    while logger is not None:
+        if any(not isinstance(h, logging.NullHandler) for h in logger.handlers):
+            return True
+        logger = logger.parent if logger.propagate else None
+    return False
+
+
+@contextlib.contextmanager
+def console(level=logging.INFO, stream=None):
+    """Print package records to stdout for the duration of the block (also a decorator).
+
+    Does nothing when a handler is already configured (``configure_logging``
+    or the application's own logging setup) and keeps an explicit level, so
+    :func:`quiet` still silences the block.
+    """
+    logger = logging.getLogger(PACKAGE_LOGGER)
+    if _has_output_handler(logger):
+        yield logger
+        return
+    handler = logging.StreamHandler(stream if stream is not None else sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    previous = logger.level
+    logger.addHandler(handler)
+    if previous == logging.NOTSET:
+        logger.setLevel(level)
+    try:
+        yield logger
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(previous)
+
+
+@contextlib.contextmanager
+def quiet(level=logging.WARNING, name=PACKAGE_LOGGER):
+    """Temporarily raise a logger's level (e.g. around nested pipeline calls)."""
+    logger = logging.getLogger(name)
+    previous = logger.level
+    logger.setLevel(max(level, logger.getEffectiveLevel()))
+    try:
+        yield logger
+    finally:
+        logger.setLevel(previous)
+
+
+__all__ = ['configure_logging', 'console', 'quiet']
@@ -0,0 +1,246 @@
+"""Memory-mapped cache of the aligned L1/L3/L13 panel.
+
+The first call reads the source workbooks (or transit store), keeps the latest
+bulletin per cycle, derives ``Gas Transit Days`` and aligns the lines. The
+resulting dates, values and observation masks are written as ``.npy`` files
+next to a JSON manifest of the sources' mtimes, sizes and SHA-256 hashes and
+the builder that produced the panel. Later calls memory-map the arrays and only
+rebuild when a source or the builder changed.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .log import quiet
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = 'manifest.json'
+# 2: store sources resolve Line 3 across its GBJ-HTN -> GBJ-LNJ route switch
+CACHE_VERSION = 2
+
+# Workbook sheet name -> pipeline line name
+SHEET_LINES = {'line1': 'Line1', 'line3': 'Line3', 'line13': 'Line13'}
+
+
+def _file_digest(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as fh:
+        for chunk in iter(lambda: fh.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _source_files(sources):
+    """Files whose content defines the panel (a store directory maps to its snapshot)."""
+    from .storage import TransitStore
+
+    files = []
+    for source in sources:
+        if isinstance(source, TransitStore) or Path(source).is_dir():
+            store = source if isinstance(source, TransitStore) else TransitStore(source)
+            if not store.latest_path.exists():
+                store.rebuild_latest()
+            files.append(store.latest_path)
+        else:
+            files.append(Path(source))
+    return files
+
+
+def _read_pipeline_data(sources):
+    """Default builder: ``pipeline_data`` from workbooks and/or transit stores."""
+    from .storage import TransitStore, load_pipeline_data
+    from .upsert import latest_transit_rows
+
+    frames = {line: [] for line in SHEET_LINES.values()}
+    for source in sources:
+        if isinstance(source, TransitStore) or Path(source).is_dir():
+            for line, df in load_pipeline_data(source).items():
+                frames[line].append(df)
+            continue
+        for sheet_name, sheet in pd.read_excel(source, sheet_name=None).items():
+            line = SHEET_LINES.get(sheet_name.lower())
+            if line is not None and {'Date', 'From', 'To', 'Cycle', 'Gas Days', 'Gas Hours'}.issubset(sheet.columns):
+                frames[line].append(sheet)
+    return {
+        line: latest_transit_rows(*dfs).drop(columns='Route')
+        for line, dfs in frames.items()
+    }
+
+
+def _builder_id(builder):
+    """Manifest identity of a custom builder (``None`` for the default reader)."""
+    if builder is None:
+        return None
+    return f"{builder.__module__}.{getattr(builder, '__qualname__', type(builder).__qualname__)}"
+
+
+class PanelCache:
+    """Aligned panel persisted as memory-mapped NumPy arrays.
+
+    Parameters
+    ----------
+    cache_dir : path-like
+        Directory holding ``manifest.json``, ``dates.npy``, ``values.npy`` and
+        ``masks.npy``.
+    how : {'common', 'l13'}, default 'common'
+        Alignment: :func:`_prepare_aligned_data` (common dates only) or
+        :func:`align_with_l13` (Line 13 timeline with observation flags).
+    """
+
+    def __init__(self, cache_dir, how='common'):
+        if how not in {'common', 'l13'}:
+            raise ValueError("how must be one of {'common','l13'}")
+        self.cache_dir = Path(cache_dir)
+        self.how = how
+        self.manifest_path = self.cache_dir / MANIFEST_FILE
+
+    def _read_manifest(self):
+        if not self.manifest_path.exists():
+            return None
+        with open(self.manifest_path, 'r', encoding='utf-8') as fh:
+            return json.load(fh)
+
+    def _write_manifest(self, manifest):
+        tmp = self.manifest_path.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as fh:
+            json.dump(manifest, fh, indent=2)
+        os.replace(tmp, self.manifest_path)
+
+    @staticmethod
+    def _describe(files, known=None):
+        """Source fingerprints; the hash is reused when mtime and size are unchanged."""
+        known = {entry['path']: entry for entry in (known or [])}
+        described = []
+        for path in files:
+            stat = path.stat()
+            entry = {'path': str(path.resolve()), 'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+            previous = known.get(entry['path'])
+            if previous and previous['mtime_ns'] == entry['mtime_ns'] and previous['size'] == entry['size']:
+                entry['sha256'] = previous['sha256']
+            else:
+                entry['sha256'] = _file_digest(path)
+            described.append(entry)
+        return described
+
+    def is_fresh(self, sources, builder=None):
+        """True when the cache was built by this version/alignment/builder from identical sources."""
+        manifest = self._read_manifest()
+        if manifest is None or manifest.get('version') != CACHE_VERSION or manifest.get('how') != self.how:
+            return False
+        if manifest.get('builder') != _builder_id(builder):
+            return False
+        files = _source_files(sources)
+        current = self._describe(files, manifest['sources'])
+        if [(e['path'], e['sha256']) for e in current] != [(e['path'], e['sha256']) for e in manifest['sources']]:
+            return False
+        if current != manifest['sources']:
+            # Touched but unchanged content: record the new mtimes so the next check skips hashing
+            manifest['sources'] = current
+            self._write_manifest(manifest)
+        return True
+
+    def build(self, sources, builder=None):
+        """Rebuild the panel from ``sources`` and write the arrays and manifest."""
+        from .preparation import _prepare_aligned_data, align_with_l13
+
+        files = _source_files(sources)
+        pipeline_data = (builder or _read_pipeline_data)(sources)
+        with quiet():
+            if self.how == 'common':
+                panel = _prepare_aligned_data(pipeline_data, {})
+            else:
+                panel = align_with_l13(pipeline_data)
+        if panel is None or panel.empty:
+            raise ValueError("Aligned panel is empty; nothing to cache.")
+
+        value_columns = ['L1', 'L3', 'L13', 'trend']
+        flag_columns = {f'{col}_observed': col for col in ['L1', 'L3'] if f'{col}_observed' in panel.columns}
+        values = panel[value_columns].to_numpy(dtype='float64')
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        arrays = {
+            'dates': pd.to_datetime(panel['Date']).to_numpy(dtype='datetime64[ns]').view('int64'),
+            'values': values,
+            'masks': ~np.isnan(values),
+        }
+        for name, array in arrays.items():
+            tmp = self.cache_dir / f'{name}.tmp.npy'
+            out = np.lib.format.open_memmap(tmp, mode='w+', dtype=array.dtype, shape=array.shape)
+            out[...] = array
+            out.flush()
+            del out
+            os.replace(tmp, self.cache_dir / f'{name}.npy')
+
+        self._write_manifest({
+            'version': CACHE_VERSION,
+            'how': self.how,
+            'builder': _builder_id(builder),
+            'built_at': datetime.now().isoformat(),
+            'n_rows': int(len(panel)),
+            'value_columns': value_columns,
+            'flag_columns': flag_columns,
+            'sources': self._describe(files),
+        })
+        logger.info("🗂️  Cached aligned panel (%s rows) in %s", len(panel), self.cache_dir)
+
+    def arrays(self):
+        """Memory-mapped ``(dates, values, masks)``; read-only, no copy."""
+        return tuple(
+            np.load(self.cache_dir / f'{name}.npy', mmap_mode='r')
+            for name in ('dates', 'values', 'masks')
+        )
+
+    def frame(self):
+        """The cached panel as a DataFrame shaped like the alignment output."""
+        manifest = self._read_manifest()
+        dates, values, masks = self.arrays()
+        panel = pd.DataFrame(values, columns=manifest['value_columns'], copy=False)
+        panel.insert(0, 'Date', pd.DatetimeIndex(dates.view('datetime64[ns]')))
+        panel['trend'] = panel['trend'].astype('int64')
+        col_index = {col: j for j, col in enumerate(manifest['value_columns'])}
+        for flag, col in manifest['flag_columns'].items():
+            panel[flag] = np.asarray(masks[:, col_index[col]])
+        return panel
+
+    def load(self, sources, builder=None):
+        """Map the cached panel, rebuilding first when any source changed."""
+        if not self.is_fresh(sources, builder):
+            self.build(sources, builder)
+        return self.frame()
+
+
+def load_aligned_panel(sources, cache_dir='.panel_cache', how='common', builder=None):
+    """Aligned panel for ``run_pipeline_complete``, served from the memory-mapped cache.
+
+    Parameters
+    ----------
+    sources : list of path-like or TransitStore
+        Workbooks (``colonial_transit_time.xlsx``) and/or transit store roots.
+    cache_dir : path-like, default '.panel_cache'
+        Cache directory.
+    how : {'common', 'l13'}, default 'common'
+        Alignment passed to :class:`PanelCache`.
+    builder : callable, optional
+        ``builder(sources) -> pipeline_data`` replacing the default reader. The
+        builder's qualified name is part of the manifest, so switching builders
+        on one ``cache_dir`` rebuilds instead of serving the other's panel.
+
+    Returns
+    -------
+    pandas.DataFrame
+        ``Date``, ``L1``, ``L3``, ``L13``, ``trend`` (plus observation flags for
+        ``how='l13'``).
+    """
+    sources = list(sources) if isinstance(sources, (list, tuple)) else [sources]
+    return PanelCache(cache_dir, how=how).load(sources, builder)
+
+
+__all__ = ['PanelCache', 'load_aligned_panel']
@@ -1,8 +1,13 @@
 """Data alignment helpers for ECM pipeline."""
 
+import logging
+
 import numpy as np
 import pandas as pd
 
+logger = logging.getLogger(__name__)
+
+
 def _prepare_aligned_data(pipeline_data, correlation_results):
     """
     Prepare aligned time series data for ECM forecasting from existing pipeline data.
@@ -38,8 +43,8 @@ def _prepare_aligned_data(pipeline_data, correlation_results):
     - Leverages existing correlation analysis results for context
     """
 
-    print("🔄 Preparing aligned data for ECM forecasting...")
-    print("="*60)
+    logger.info("🔄 Preparing aligned data for ECM forecasting...")
+    logger.info("="*60)
 
     # Extract time series from pipeline_data dictionary
     extraction_results = {}
@@ -56,25 +61,23 @@ def _prepare_aligned_data(pipeline_data, correlation_results):
                 'original_count': len(line_data),
                 'clean_count': len(clean_data),
                 'date_range': (clean_data['Date'].min(), clean_data['Date'].max()),
-                'transit_stats': clean_data['Gas Transit Days'].describe()
             }
 
-            print(f"✅ {line_name}: {len(clean_data)} clean records ({clean_data['Date'].min().date()} to {clean_data['Date'].max().date()})")
+            logger.info("✅ %s: %s clean records (%s to %s)", line_name, len(clean_data), clean_data['Date'].min().date(), clean_data['Date'].max().date())
         else:
-            print(f"❌ {line_name}: Missing required columns")
+            logger.error("❌ %s: Missing required columns", line_name)
             return None
 
     # Verify we have all three datasets
     required_lines = ['Line1', 'Line3', 'Line13']
     if not all(line in extraction_results for line in required_lines):
         missing = [line for line in required_lines if line not in extraction_results]
-        print(f"❌ Missing required datasets: {missing}")
+        logger.error("❌ Missing required datasets: %s", missing)
         return None
 
-    print(f"\n📊 Data extraction summary:")
+    logger.debug("\n📊 Data extraction summary:")
     for line_name, info in extraction_results.items():
-        print(f"  • {line_name}: {info['clean_count']}/{info['original_count']} records, "
-              f"mean transit = {info['transit_stats']['mean']:.2f} days")
+        logger.debug("  • %s: %s/%s records, mean transit = %.2f days", line_name, info['clean_count'], info['original_count'], info['data']['Gas Transit Days'].mean())
 
     # Find common date period across all three series
     all_dates = []
@@ -86,17 +89,17 @@ def _prepare_aligned_data(pipeline_data, correlation_results):
     common_dates = set.intersection(*all_dates)
     common_dates = sorted(list(common_dates))
 
-    print(f"\n🔗 Common period analysis:")
-    print(f"  • Line1 dates: {len(all_dates[0])}")
-    print(f"  • Line3 dates: {len(all_dates[1])}")
-    print(f"  • Line13 dates: {len(all_dates[2])}")
-    print(f"  • Common dates: {len(common_dates)}")
+    logger.debug("\n🔗 Common period analysis:")
+    logger.debug("  • Line1 dates: %s", len(all_dates[0]))
+    logger.debug("  • Line3 dates: %s", len(all_dates[1]))
+    logger.debug("  • Line13 dates: %s", len(all_dates[2]))
+    logger.debug("  • Common dates: %s", len(common_dates))
 
     if len(common_dates) == 0:
-        print("❌ No common dates found across all three series")
+        logger.error("❌ No common dates found across all three series")
         return None
 
-    print(f"  • Common period: {min(common_dates)} to {max(common_dates)}")
+    logger.info("  • Common period: %s to %s", min(common_dates), max(common_dates))
 
     # Create aligned dataset using only common dates
     aligned_data = pd.DataFrame({'Date': pd.to_datetime(common_dates)})
@@ -131,33 +134,33 @@ def _prepare_aligned_data(pipeline_data, correlation_results):
     # Final validation - ensure no missing values
     missing_check = aligned_data[['L1', 'L3', 'L13']].isna().sum()
     if missing_check.sum() > 0:
-        print(f"⚠️  Warning: Missing values detected after alignment: {missing_check.to_dict()}")
+        logger.warning("⚠️  Warning: Missing values detected after alignment: %s", missing_check.to_dict())
         aligned_data = aligned_data.dropna()
-        print(f"  • Removed rows with missing values, final count: {len(aligned_data)}")
+        logger.info("  • Removed rows with missing values, final count: %s", len(aligned_data))
 
-    print(f"\n📋 Final dataset validation:")
-    print(f"  • Final dataset shape: {aligned_data.shape}")
-    print(f"  • Columns: {list(aligned_data.columns)}")
-    print(f"  • Date range: {aligned_data['Date'].min().date()} to {aligned_data['Date'].max().date()}")
-    print(f"  • Complete observations (no missing values): {len(aligned_data)}")
+    logger.debug("\n📋 Final dataset validation:")
+    logger.debug("  • Final dataset shape: %s", aligned_data.shape)
+    logger.debug("  • Columns: %s", list(aligned_data.columns))
+    logger.debug("  • Date range: %s to %s", aligned_data['Date'].min().date(), aligned_data['Date'].max().date())
+    logger.debug("  • Complete observations (no missing values): %s", len(aligned_data))
 
     # Check for sufficient variation in each series
     for col in ['L1', 'L3', 'L13']:
         std_dev = aligned_data[col].std()
         unique_vals = aligned_data[col].nunique()
-        print(f"  • {col}: std={std_dev:.3f}, unique_values={unique_vals}")
+        logger.debug("  • %s: std=%.3f, unique_values=%s", col, std_dev, unique_vals)
         if std_dev < 0.001:
-            print(f"    ⚠️  Warning: {col} has very low variation")
+            logger.warning("    ⚠️  Warning: %s has very low variation", col)
         if unique_vals < 3:
-            print(f"    ⚠️  Warning: {col} has very few unique values")
+            logger.warning("    ⚠️  Warning: %s has very few unique values", col)
 
     # Summary statistics
-    print(f"\n📊 Summary statistics (common period only):")
-    summary_stats = aligned_data[['L1', 'L3', 'L13']].describe()
-    print(summary_stats.round(3))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("\n📊 Summary statistics (common period only):\n%s",
+                     aligned_data[['L1', 'L3', 'L13']].describe().round(3))
 
     # Reference correlation results for context
-    print(f"\n🔍 Leveraging existing correlation analysis:")
+    logger.debug("\n🔍 Leveraging existing correlation analysis:")
     significant_pairs = []
     cointegrated_pairs = []
 
@@ -167,34 +170,34 @@ def _prepare_aligned_data(pipeline_data, correlation_results):
         if results.get('is_cointegrated', False):
             cointegrated_pairs.append(pair_name)
 
-    print(f"  • Significant correlations: {len(significant_pairs)}")
+    logger.debug("  • Significant correlations: %s", len(significant_pairs))
     for pair in significant_pairs:
-        print(f"    - {pair}")
+        logger.debug("    - %s", pair)
 
-    print(f"  • Cointegrated pairs: {len(cointegrated_pairs)}")
+    logger.debug("  • Cointegrated pairs: %s", len(cointegrated_pairs))
     for pair in cointegrated_pairs:
-        print(f"    - {pair}")
+        logger.debug("    - %s", pair)
 
     # ECM readiness assessment
-    print(f"\n🎯 ECM Forecasting Readiness Assessment:")
-    print(f"  • ✅ Data alignment: Complete (common period approach)")
-    print(f"  • ✅ Missing value handling: Disposed of incomplete periods") 
-    print(f"  • ✅ Trend variable: Added")
-    print(f"  • ✅ Data validation: Passed")
+    logger.debug("\n🎯 ECM Forecasting Readiness Assessment:")
+    logger.debug("  • ✅ Data alignment: Complete (common period approach)")
+    logger.debug("  • ✅ Missing value handling: Disposed of incomplete periods") 
+    logger.debug("  • ✅ Trend variable: Added")
+    logger.debug("  • ✅ Data validation: Passed")
 
     if len(cointegrated_pairs) > 0:
-        print(f"  • ✅ Cointegration detected: Ready for ECM modeling")
+        logger.debug("  • ✅ Cointegration detected: Ready for ECM modeling")
     else:
-        print(f"  • ⚠️  No cointegration detected: Consider VAR modeling")
+        logger.warning("  • ⚠️  No cointegration detected: Consider VAR modeling")
 
     if len(aligned_data) >= 30:
-        print(f"  • ✅ Sample size: Adequate ({len(aligned_data)} observations)")
+        logger.debug("  • ✅ Sample size: Adequate (%s observations)", len(aligned_data))
     else:
-        print(f"  • ⚠️  Sample size: Limited ({len(aligned_data)} observations)")
+        logger.warning("  • ⚠️  Sample size: Limited (%s observations)", len(aligned_data))
 
-    print(f"\n✅ Data preparation complete! Ready for ECM forecasting pipeline.")
-    print(f"📋 Use only common period: {aligned_data['Date'].min().date()} to {aligned_data['Date'].max().date()}")
-    print(f"📋 Robust approach: No missing value interpolation, complete data only")
+    logger.info("\n✅ Data preparation complete! Ready for ECM forecasting pipeline.")
+    logger.debug("📋 Use only common period: %s to %s", aligned_data['Date'].min().date(), aligned_data['Date'].max().date())
+    logger.debug("📋 Robust approach: No missing value interpolation, complete data only")
 
     return aligned_data
 
@@ -229,8 +232,8 @@ def align_with_l13(pipeline_data, correlation_results=None):
     - Keeps :func:`_prepare_aligned_data` unchanged for existing pipelines
     """
 
-    print("🔄 Anchoring alignment on Line 13...")
-    print("=" * 60)
+    logger.info("🔄 Anchoring alignment on Line 13...")
+    logger.info("=" * 60)
 
     required_columns = {'Date', 'Gas Transit Days'}
 
@@ -253,7 +256,7 @@ def align_with_l13(pipeline_data, correlation_results=None):
     if line13.empty:
         raise ValueError("Line13 contains no valid observations after cleaning")
 
-    print(f"✅ Line13 anchor: {len(line13)} records from {line13['Date'].min().date()} to {line13['Date'].max().date()}")
+    logger.info("✅ Line13 anchor: %s records from %s to %s", len(line13), line13['Date'].min().date(), line13['Date'].max().date())
 
     base_df = line13.rename(columns={'Gas Transit Days': 'L13'}).reset_index(drop=True)
     base_df['Date'] = base_df['Date'].dt.normalize()
@@ -264,9 +267,9 @@ def align_with_l13(pipeline_data, correlation_results=None):
         try:
             cleaned = _clean_line(line_name).dropna(subset=['Gas Transit Days'])
             cleaned = cleaned.rename(columns={'Gas Transit Days': col_name})
-            print(f"✅ {line_name}: {len(cleaned)} observed records")
+            logger.info("✅ %s: %s observed records", line_name, len(cleaned))
         except ValueError as err:
-            print(f"⚠️  {err}; treating as unavailable for alignment")
+            logger.warning("⚠️  %s; treating as unavailable for alignment", err)
             cleaned = pd.DataFrame(columns=['Date', col_name])
         return base_df.merge(cleaned[['Date', col_name]], on='Date', how='left')
 
@@ -277,19 +280,20 @@ def align_with_l13(pipeline_data, correlation_results=None):
     base_df['L3_observed'] = base_df['L3'].notna()
 
     # Summary diagnostics
-    print("\n📋 Alignment summary (Line 13 anchor):")
-    print(f"  • Total timeline length: {len(base_df)} observations")
-    print(f"  • L1 observed: {int(base_df['L1_observed'].sum())} ({base_df['L1_observed'].mean():.1%})")
-    print(f"  • L3 observed: {int(base_df['L3_observed'].sum())} ({base_df['L3_observed'].mean():.1%})")
+    logger.debug("\n📋 Alignment summary (Line 13 anchor):")
+    logger.debug("  • Total timeline length: %s observations", len(base_df))
+    logger.debug("  • L1 observed: %s (%.1f%%)", int(base_df['L1_observed'].sum()), (base_df['L1_observed'].mean()) * 100)
+    logger.debug("  • L3 observed: %s (%.1f%%)", int(base_df['L3_observed'].sum()), (base_df['L3_observed'].mean()) * 100)
 
-    for col in ['L13', 'L1', 'L3']:
-        stats = base_df[col].dropna().describe()
-        print(f"  • {col} stats (observed only): count={stats.get('count', 0):.0f}, mean={stats.get('mean', float('nan')):.3f}")
+    if logger.isEnabledFor(logging.DEBUG):
+        for col in ['L13', 'L1', 'L3']:
+            observed = base_df[col].dropna()
+            logger.debug("  • %s stats (observed only): count=%s, mean=%.3f", col, len(observed), observed.mean())
 
     ordered_columns = ['Date', 'L1', 'L3', 'L13', 'trend', 'L1_observed', 'L3_observed']
     base_df = base_df[ordered_columns]
 
-    print("\n✅ Alignment complete (Line 13 preserved, observation flags added)")
+    logger.info("\n✅ Alignment complete (Line 13 preserved, observation flags added)")
     return base_df
 
 def impute_missing_l1(aligned_data, cointegration_results, residual_mode="zero"):
@@ -346,15 +350,15 @@ def impute_missing_l1(aligned_data, cointegration_results, residual_mode="zero")
     else:
         residual_series = pd.Series(dtype=float)
 
-    print("🔄 Imputing missing Line 1 observations")
-    print("=" * 60)
-    print(f"  • Residual mode: {residual_mode}")
+    logger.info("🔄 Imputing missing Line 1 observations")
+    logger.info("=" * 60)
+    logger.info("  • Residual mode: %s", residual_mode)
 
     if residual_mode not in {'zero', 'mean', 'sampled'}:
         raise ValueError("residual_mode must be one of {'zero','mean','sampled'}")
 
     if residual_mode in {'mean', 'sampled'} and residual_series.empty:
-        print("⚠️  No residuals provided; falling back to zero adjustment")
+        logger.warning("⚠️  No residuals provided; falling back to zero adjustment")
         residual_mode = 'zero'
 
     aligned = aligned_data.copy()
@@ -386,15 +390,15 @@ def impute_missing_l1(aligned_data, cointegration_results, residual_mode="zero")
 
     imputed_count = int(missing_mask.sum())
     observed_count = int(observed_mask.sum())
-    print(f"  • Observed L1 values preserved: {observed_count}")
-    print(f"  • Imputed L1 values created: {imputed_count}")
+    logger.info("  • Observed L1 values preserved: %s", observed_count)
+    logger.info("  • Imputed L1 values created: %s", imputed_count)
 
     if imputed_count:
-        stats = aligned.loc[missing_mask, 'L1_implied'].describe()
-        print("  • Imputed stats:")
-        print(stats[['count', 'mean', 'std', 'min', 'max']].round(4).to_dict())
+        if logger.isEnabledFor(logging.DEBUG):
+            stats = aligned.loc[missing_mask, 'L1_implied'].describe()
+            logger.debug("  • Imputed stats: %s", stats[['count', 'mean', 'std', 'min', 'max']].round(4).to_dict())
     else:
-        print("  • No missing values detected; L1_implied matches original L1")
+        logger.info("  • No missing values detected; L1_implied matches original L1")
 
     return aligned
 
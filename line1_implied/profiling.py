@@ -0,0 +1,158 @@
+"""Lightweight stage profiling for the ECM pipeline.
+
+A :class:`Profiler` is activated with ``with profiler:``; while it is active,
+:func:`section` and :func:`count` calls anywhere in the package (pipeline
+stages, the per-candidate lag fits in the ECM, the per-origin fits in the
+backtest) record into it. With no active profiler they cost one list lookup,
+so the hooks stay in the hot loops permanently.
+"""
+
+import contextlib
+import cProfile
+import functools
+import time
+import tracemalloc
+from pathlib import Path
+
+# Stack of active profilers; section()/count() record into the innermost one
+_ACTIVE = []
+
+_NULL_SECTION = contextlib.nullcontext()
+
+
+class Profiler:
+    """Aggregate wall time, CPU time, peak traced memory and call counts per section.
+
+    Parameters
+    ----------
+    trace_memory : bool, default True
+        Track peak Python allocations per section with :mod:`tracemalloc`
+        (slows allocation-heavy code while active).
+    cprofile_dir : path-like, optional
+        Write a ``<stage>.prof`` cProfile dump for every top-level stage
+        (``pstats``/snakeviz compatible).
+    """
+
+    def __init__(self, trace_memory=True, cprofile_dir=None):
+        self.trace_memory = trace_memory
+        self.cprofile_dir = Path(cprofile_dir) if cprofile_dir is not None else None
+        self.sections = {}
+        self.counters = {}
+        self.cprofile_files = {}
+        self._frames = []
+        self._started_tracing = False
+
+    def __enter__(self):
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        _ACTIVE.append(self)
+        return self
+
+    def __exit__(self, *exc):
+        _ACTIVE.remove(self)
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def count(self, name, n=1):
+        """Increment a named counter."""
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    @contextlib.contextmanager
+    def section(self, name, dump=False):
+        """Time a block; ``dump=True`` also writes a cProfile file for top-level sections."""
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        frame = {'carried': 0, 'base': 0}
+        if tracing:
+            current, peak = tracemalloc.get_traced_memory()
+            # tracemalloc has a single peak; fold the enclosing section's peak
+            # so far into it before resetting for this one
+            if self._frames:
+                self._frames[-1]['carried'] = max(self._frames[-1]['carried'], peak)
+            tracemalloc.reset_peak()
+            frame['base'] = current
+
+        profiler = None
+        if dump and self.cprofile_dir is not None and not self._frames:
+            profiler = cProfile.Profile()
+        self._frames.append(frame)
+
+        wall, cpu = time.perf_counter(), time.process_time()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield self
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            self._frames.pop()
+
+            peak_bytes = None
+            if tracing:
+                peak = max(tracemalloc.get_traced_memory()[1], frame['carried'])
+                if self._frames:
+                    self._frames[-1]['carried'] = max(self._frames[-1]['carried'], peak)
+                peak_bytes = max(0, peak - frame['base'])
+
+            stats = self.sections.setdefault(name, {'calls': 0, 'wall_seconds': 0.0, 'cpu_seconds': 0.0,
+                                                    'max_wall_seconds': 0.0, 'peak_memory_bytes': None})
+            stats['calls'] += 1
+            stats['wall_seconds'] += wall
+            stats['cpu_seconds'] += cpu
+            stats['max_wall_seconds'] = max(stats['max_wall_seconds'], wall)
+            if peak_bytes is not None:
+                stats['peak_memory_bytes'] = max(stats['peak_memory_bytes'] or 0, peak_bytes)
+
+            if profiler is not None:
+                self.cprofile_dir.mkdir(parents=True, exist_ok=True)
+                path = self.cprofile_dir / f'{name}.prof'
+                profiler.dump_stats(str(path))
+                self.cprofile_files[name] = str(path)
+
+    def report(self):
+        """Plain-dict summary for ``execution_metadata['profile']``."""
+        sections = {}
+        for name, stats in self.sections.items():
+            sections[name] = {**stats, 'mean_wall_seconds': stats['wall_seconds'] / stats['calls']}
+        return {
+            'sections': sections,
+            'counters': dict(self.counters),
+            'memory_traced': self.trace_memory,
+            'cprofile_files': dict(self.cprofile_files),
+        }
+
+
+def active_profiler():
+    """The innermost active :class:`Profiler`, or None."""
+    return _ACTIVE[-1] if _ACTIVE else None
+
+
+def section(name, dump=False):
+    """Context manager timing a block in the active profiler (no-op when none is active)."""
+    if not _ACTIVE:
+        return _NULL_SECTION
+    return _ACTIVE[-1].section(name, dump=dump)
+
+
+def count(name, n=1):
+    """Increment a counter in the active profiler (no-op when none is active)."""
+    if _ACTIVE:
+        _ACTIVE[-1].count(name, n)
+
+
+def profiled(name=None):
+    """Decorator recording every call of a function as a profiling section."""
+    def decorator(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with section(label):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+__all__ = ['Profiler', 'active_profiler', 'section', 'count', 'profiled']
@@ -0,0 +1,132 @@
+"""Background, non-interactive figure rendering with an on-disk cache.
+
+Plotting code is written as draw functions ``draw(fig, *args)`` that only use
+the object-oriented matplotlib API on the figure they are given. The same
+function serves both paths:
+
+* notebooks: ``fig = plt.figure(...); draw(fig, ...); plt.show()``;
+* pipelines / batch jobs: :class:`FigureRenderer` draws on an Agg
+  :class:`matplotlib.figure.Figure` in a worker process and writes the image
+  to disk, never touching ``pyplot`` or a GUI backend.
+
+Images are named after a hash of the draw function, its arguments (frames and
+arrays are hashed by content), the figure size and the output format, so a
+figure whose data did not change is never redrawn.
+"""
+
+import logging
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+
+from .artifacts import input_digest
+
+logger = logging.getLogger(__name__)
+
+# Bump when a draw function changes so cached images are not reused
+RENDER_VERSION = 1
+
+
+def _init_worker():
+    os.environ['MPLBACKEND'] = 'Agg'
+
+
+def _render(draw, args, figsize, path, fmt, dpi):
+    """Draw on a fresh Agg figure and write it atomically to ``path``."""
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize)
+    draw(fig, *args)
+    path = Path(path)
+    tmp = path.with_name(f'.{path.name}.tmp')
+    fig.savefig(tmp, format=fmt, dpi=dpi)
+    os.replace(tmp, path)
+    return path
+
+
+class FigureRenderer:
+    """Render figures in a background process pool, cached by plotted data.
+
+    Parameters
+    ----------
+    out_dir : path-like, default 'outputs/figures'
+        Image directory (also the cache).
+    workers : int, optional
+        Renderer processes (default: up to 4, bounded by the CPU count);
+        ``0`` renders synchronously in the calling process.
+    fmt : str, default 'png'
+        Image format passed to ``savefig``.
+    dpi : int, default 100
+    """
+
+    def __init__(self, out_dir='outputs/figures', workers=None, fmt='png', dpi=100):
+        self.out_dir = Path(out_dir)
+        self.workers = min(4, os.cpu_count() or 1) if workers is None else int(workers)
+        self.fmt = fmt
+        self.dpi = dpi
+        self.figures = {}
+        self.hits = 0
+        self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def key(self, draw, args, figsize):
+        """Cache key of one figure."""
+        ident = f'{draw.__module__}.{draw.__qualname__}'
+        return input_digest([RENDER_VERSION, ident, list(args), list(figsize), self.fmt, self.dpi])
+
+    def submit(self, name, draw, *args, figsize=(14, 11)):
+        """Queue ``draw(fig, *args)``; returns a future of the image path.
+
+        ``draw`` must be a module-level function and ``args`` picklable (they
+        are sent to the worker process).
+        """
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        path = self.out_dir / f'{name}-{self.key(draw, args, figsize)[:16]}.{self.fmt}'
+        if path.exists():
+            self.hits += 1
+            logger.debug("🖼️  %s unchanged; reusing %s", name, path.name)
+            future = Future()
+            future.set_result(path)
+        elif self.workers == 0:
+            future = Future()
+            try:
+                future.set_result(_render(draw, args, figsize, path, self.fmt, self.dpi))
+            except Exception as err:
+                future.set_exception(err)
+        else:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+            future = self._pool.submit(_render, draw, args, figsize, path, self.fmt, self.dpi)
+        self.figures[name] = future
+        return future
+
+    def wait(self):
+        """Block until every queued figure is written; returns ``{name: path}``.
+
+        A figure that failed to render is logged and maps to ``None``.
+        """
+        paths = {}
+        for name, future in self.figures.items():
+            try:
+                paths[name] = future.result()
+            except Exception as err:
+                logger.warning("⚠️  Figure %s failed to render: %s", name, err)
+                paths[name] = None
+        return paths
+
+    def close(self):
+        """Wait for pending figures and shut the worker pool down."""
+        paths = self.wait()
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        return paths
+
+
+__all__ = ['FigureRenderer']
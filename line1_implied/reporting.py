@@ -1,14 +1,20 @@
 """Reporting helpers for ECM pipeline."""
 
 import json
+import logging
 from pathlib import Path
 from datetime import datetime
 
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-from scipy import stats
 
+from .log import console
+from .results import CointegrationResult, ECMResult
+
+logger = logging.getLogger(__name__)
+
+
+@console()
 def _display_results(cointegration_results, ecm_results, eval_out):
     """
     Console-only summary of the ECM pipeline using your actual objects:
@@ -16,12 +22,10 @@ def _display_results(cointegration_results, ecm_results, eval_out):
       - ecm_results: {'specification': {'lags', 'aic', 'bic'}, 'diagnostics': {...}, 'summary': {...}}
       - eval_out: {'forecast_results': long DF, 'metrics': DF, 'summary': dict}
     """
-    import numpy as np
-    import pandas as pd
 
-    print("="*60)
-    print("                ECM FORECASTING RESULTS SUMMARY")
-    print("="*60)
+    logger.info("="*60)
+    logger.info("                ECM FORECASTING RESULTS SUMMARY")
+    logger.info("="*60)
 
     # --- Cointegration bits ---
     coeffs = cointegration_results.get("coefficients", {})
@@ -47,67 +51,45 @@ def _display_results(cointegration_results, ecm_results, eval_out):
     metrics_df = eval_out["metrics"].copy()
 
     # --- Print cointegration ---
-    print("\n📊 COINTEGRATING RELATIONSHIP")
+    logger.info("\n📊 COINTEGRATING RELATIONSHIP")
     trend_txt = f" + {beta_trend:.4f}×trend" if np.isfinite(beta_trend) and abs(beta_trend) > 0 else ""
-    print(f"  L1 = {intercept:.4f} + {beta_L13:.4f}×L13{trend_txt} + u_t")
+    logger.info("  L1 = %.4f + %.4f×L13%s + u_t", intercept, beta_L13, trend_txt)
     r2_txt = f"{r2:.4f}" if np.isfinite(r2) else "N/A"
-    print(f"  R² = {r2_txt}  |  Residual σ = {resid_std:.4f}")
+    logger.info("  R² = %s  |  Residual σ = %.4f", r2_txt, resid_std)
 
     # --- Print ECM spec ---
-    print("\n⚙️  ECM MODEL SPECIFICATION")
-    print(f"  Lags (p,q,r) = ({p},{q},{r})")
-    print(f"  AIC = {aic:.3f}, BIC = {bic:.3f}")
-    print(f"  γ (ECT coeff) = {gamma:.4f}  |  Half-life = {half_life if np.isfinite(half_life) else 'N/A'}")
+    logger.info("\n⚙️  ECM MODEL SPECIFICATION")
+    logger.info("  Lags (p,q,r) = (%s,%s,%s)", p, q, r)
+    logger.info("  AIC = %.3f, BIC = %.3f", aic, bic)
+    logger.info("  γ (ECT coeff) = %.4f  |  Half-life = %s", gamma, half_life if np.isfinite(half_life) else 'N/A')
 
     # --- Performance table (RMSE) ---
-    print("\n📈 RMSE BY MODEL & HORIZON")
+    logger.info("\n📈 RMSE BY MODEL & HORIZON")
     rmse_table = metrics_df.pivot(index="model", columns="horizon", values="RMSE")
     # Order rows nicely if present
     order = [m for m in ["ECM","Random Walk","ARIMA(0,1,0)"] if m in rmse_table.index]
     rmse_table = rmse_table.loc[order] if order else rmse_table
-    print(rmse_table.round(4).to_string())
+    logger.info("%s", rmse_table.round(4))
 
     # --- Rankings per horizon ---
-    print("\n🏆 RANKINGS BY HORIZON (lower RMSE is better)")
+    logger.info("\n🏆 RANKINGS BY HORIZON (lower RMSE is better)")
     for h in sorted(metrics_df["horizon"].unique()):
         sub = metrics_df[metrics_df["horizon"] == h].sort_values("RMSE")
         best_model = sub.iloc[0]["model"]; best_rmse = sub.iloc[0]["RMSE"]
-        print(f"  H{h}: {best_model} (RMSE {best_rmse:.4f})")
+        logger.info("  H%s: %s (RMSE %.4f)", h, best_model, best_rmse)
         if "ECM" in sub["model"].values:
             ecm_rmse = float(sub[sub["model"] == "ECM"]["RMSE"].iloc[0])
             if np.isfinite(ecm_rmse) and np.isfinite(best_rmse):
                 diff = (ecm_rmse - best_rmse) / best_rmse * 100
                 tag = "ahead of" if diff < 0 else "behind"
-                print(f"      ECM is {abs(diff):.1f}% {tag} the best model")
+                logger.info("      ECM is %.1f%% %s the best model", abs(diff), tag)
 
-    print("\n✅ DISPLAY COMPLETE")
+    logger.info("\n✅ DISPLAY COMPLETE")
     return rmse_table
 
-def _display_plots(aligned_data, cointegration_results, ecm_results, eval_out):
-    """
-    Inline plots only (no saving). Uses:
-      eval_out['forecast_results'] long DF with columns:
-        ['date','horizon','y_actual','ecm_forecast','rw_forecast','arima_forecast', ...]
-    """
-    import numpy as np
-    import pandas as pd
-    import matplotlib.pyplot as plt
-
-    print("="*60)
-    print("                GENERATING ECM VISUALIZATIONS")
-    print("="*60)
-
-    forecast_df = eval_out["forecast_results"].copy()
-
-    # Ensure datetime for nice plotting
-    if "date" in forecast_df.columns:
-        forecast_df["date"] = pd.to_datetime(forecast_df["date"])
-
-    # 1) Actual vs Predicted (time series) per horizon
-    print("\n📈 Actual vs Predicted (time series) per horizon")
-    fig, axes = plt.subplots(2, 2, figsize=(14, 11))
-    axes = axes.ravel()
-    horizons = sorted(forecast_df["horizon"].unique())
+def _draw_forecast_paths(fig, forecast_df):
+    """Actual vs predicted time series, one panel per horizon."""
+    axes = fig.subplots(2, 2).ravel()
     for idx, h in enumerate([1,2,3,4]):
         ax = axes[idx]
         sub = forecast_df[forecast_df["horizon"] == h].copy()
@@ -123,12 +105,12 @@ def _display_plots(aligned_data, cointegration_results, ecm_results, eval_out):
             ax.plot(sub["date"], sub["arima_forecast"], marker="x", linewidth=1.0, label="ARIMA", alpha=0.7)
         ax.set_title(f"H{h}"); ax.grid(alpha=0.3); ax.legend(fontsize=9)
         ax.tick_params(axis="x", labelrotation=45)
-    plt.tight_layout(); plt.show()
+    fig.tight_layout()
+
 
-    # 2) Actual vs Predicted scatter per horizon (ECM)
-    print("\n🔍 Actual vs Predicted (scatter) per horizon — ECM")
-    fig, axes = plt.subplots(2, 2, figsize=(14, 11))
-    axes = axes.ravel()
+def _draw_forecast_scatter(fig, forecast_df):
+    """ECM actual vs predicted scatter, one panel per horizon."""
+    axes = fig.subplots(2, 2).ravel()
     for idx, h in enumerate([1,2,3,4]):
         ax = axes[idx]
         sub = forecast_df[forecast_df["horizon"] == h].copy()
@@ -142,39 +124,92 @@ def _display_plots(aligned_data, cointegration_results, ecm_results, eval_out):
         ax.plot([lo, hi], [lo, hi], linestyle="--")
         ax.set_title(f"ECM H{h}: Actual vs Predicted")
         ax.set_xlabel("Actual"); ax.set_ylabel("Predicted"); ax.grid(alpha=0.3)
-    plt.tight_layout(); plt.show()
-
-    # 3) Residual diagnostics (ECM residuals)
-    print("\n🔬 Residual diagnostics (ECM final model)")
-    resid = ecm_results.get("diagnostics", {}).get("residuals", None)
-    if resid is not None:
-        r = np.asarray(resid).ravel()
-        fig, axes = plt.subplots(2, 2, figsize=(14, 11))
-        # Time series
-        axes[0,0].plot(r); axes[0,0].axhline(0, linestyle="--"); axes[0,0].grid(alpha=0.3)
-        axes[0,0].set_title("Residuals (Time Series)")
-        # Histogram
-        axes[0,1].hist(r, bins=20, density=True, alpha=0.8); axes[0,1].grid(alpha=0.3)
-        axes[0,1].set_title("Residuals Distribution")
-        # QQ plot
-        from scipy import stats as _stats
-        _stats.probplot(r, dist="norm", plot=axes[1,0]); axes[1,0].set_title("Q-Q Plot (Normal)")
-        # ACF
-        from statsmodels.tsa.stattools import acf
-        L = max(5, min(20, len(r)//4)); acf_vals = acf(r, nlags=L, fft=True)
-        axes[1,1].bar(range(len(acf_vals)), acf_vals)
-        ci = 1.96/np.sqrt(len(r))
-        axes[1,1].axhline(0, color="k"); axes[1,1].axhline(ci, linestyle="--"); axes[1,1].axhline(-ci, linestyle="--")
-        axes[1,1].set_title("ACF of Residuals"); axes[1,1].grid(alpha=0.3)
-        plt.tight_layout(); plt.show()
-    else:
-        print("   (No ECM residuals found.)")
-
-    print("\n✅ VISUALS COMPLETE")
-    return None
-
-def _save_outputs(aligned_data, cointegration_results, ecm_results, eval_out, output_root="outputs/ecm_pipeline"):
-    """Save key pipeline artifacts to disk and return the output directory."""
+    fig.tight_layout()
+
+
+def _draw_residual_diagnostics(fig, r):
+    """ECM residual time series, histogram, normal Q-Q plot and ACF."""
+    from scipy import stats as _stats
+    from statsmodels.tsa.stattools import acf
+
+    axes = fig.subplots(2, 2)
+    # Time series
+    axes[0,0].plot(r); axes[0,0].axhline(0, linestyle="--"); axes[0,0].grid(alpha=0.3)
+    axes[0,0].set_title("Residuals (Time Series)")
+    # Histogram
+    axes[0,1].hist(r, bins=20, density=True, alpha=0.8); axes[0,1].grid(alpha=0.3)
+    axes[0,1].set_title("Residuals Distribution")
+    # QQ plot
+    _stats.probplot(r, dist="norm", plot=axes[1,0]); axes[1,0].set_title("Q-Q Plot (Normal)")
+    # ACF
+    L = max(5, min(20, len(r)//4)); acf_vals = acf(r, nlags=L, fft=True)
+    axes[1,1].bar(range(len(acf_vals)), acf_vals)
+    ci = 1.96/np.sqrt(len(r))
+    axes[1,1].axhline(0, color="k"); axes[1,1].axhline(ci, linestyle="--"); axes[1,1].axhline(-ci, linestyle="--")
+    axes[1,1].set_title("ACF of Residuals"); axes[1,1].grid(alpha=0.3)
+    fig.tight_layout()
+
+
+def _display_plots(aligned_data, cointegration_results, ecm_results, eval_out, renderer=None):
+    """
+    Inline plots only (no saving). Uses:
+      eval_out['forecast_results'] long DF with columns:
+        ['date','horizon','y_actual','ecm_forecast','rw_forecast','arima_forecast', ...]
+
+    With a renderer (line1_implied.rendering.FigureRenderer) the figures are
+    drawn off-thread to image files instead, and {name: future} is returned.
+    """
+    logger.info("="*60)
+    logger.info("                GENERATING ECM VISUALIZATIONS")
+    logger.info("="*60)
+
+    forecast_df = eval_out["forecast_results"].copy()
+
+    # Ensure datetime for nice plotting
+    if "date" in forecast_df.columns:
+        forecast_df["date"] = pd.to_datetime(forecast_df["date"])
+
+    resid = ecm_results.get("residuals", None)
+    figures = [
+        ("forecast_paths", "\n📈 Actual vs Predicted (time series) per horizon", _draw_forecast_paths, forecast_df),
+        ("forecast_scatter", "\n🔍 Actual vs Predicted (scatter) per horizon — ECM", _draw_forecast_scatter, forecast_df),
+        ("ecm_residuals", "\n🔬 Residual diagnostics (ECM final model)", _draw_residual_diagnostics,
+         None if resid is None else np.asarray(resid).ravel()),
+    ]
+
+    futures = {}
+    for name, banner, draw, data in figures:
+        logger.info(banner)
+        if data is None:
+            logger.info("   (No ECM residuals found.)")
+            continue
+        if renderer is not None:
+            futures[name] = renderer.submit(name, draw, data, figsize=(14, 11))
+            continue
+        import matplotlib.pyplot as plt
+
+        fig = plt.figure(figsize=(14, 11))
+        draw(fig, data)
+        plt.show()
+        plt.close(fig)
+
+    logger.info("\n✅ VISUALS COMPLETE")
+    return futures if renderer is not None else None
+
+def _save_outputs(aligned_data, cointegration_results, ecm_results, eval_out, output_root="outputs/ecm_pipeline",
+                  run_store=None, params=None):
+    """Save key pipeline artifacts to disk and return the output directory.
+
+    With ``run_store`` (a :class:`line1_implied.runstore.RunStore` or its root)
+    the forecasts, metrics and coefficients are appended to that store instead
+    and the new run id is returned.
+    """
+    if run_store is not None:
+        from .runstore import RunStore
+
+        store = run_store if isinstance(run_store, RunStore) else RunStore(run_store)
+        return store.append(eval_out, cointegration_results, ecm_results, aligned_data, params=params)
+
     output_root = Path(output_root)
     timestamp_dir = output_root / datetime.now().strftime("%Y%m%d_%H%M%S")
     timestamp_dir.mkdir(parents=True, exist_ok=True)
@@ -210,14 +245,12 @@ def _json_serializer(value):
         return value.tolist()
     if isinstance(value, pd.DataFrame):
         return value.to_dict(orient='records')
-    try:
-        import numpy as _np
-        if isinstance(value, _np.ndarray):
-            return value.tolist()
-        if isinstance(value, _np.generic):
-            return value.item()
-    except ImportError:
-        pass
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (CointegrationResult, ECMResult)):
+        return value.to_dict()
     if hasattr(value, 'isoformat'):
         return value.isoformat()
     return str(value)
@@ -0,0 +1,101 @@
+"""Compact result types for the cointegration and ECM stages.
+
+Fitted statsmodels results keep references to the full design matrices,
+fitted values and residuals, and diagnostic figures hold every plotted array.
+These slotted dataclasses keep only what downstream steps and reports read
+(coefficients, covariance, chosen lags, summary statistics and one residual
+series); the heavy objects are attached only when ``keep_model=True``.
+
+Both types also support the mapping access used throughout the package
+(``result['coefficients']``, ``result.get('summary', {})``), so code written
+against the previous dictionaries keeps working.
+"""
+
+from dataclasses import dataclass, field, fields
+
+import numpy as np
+import pandas as pd
+
+
+class _MappingAccess:
+    """Read-only ``dict``-style access to dataclass fields."""
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except (AttributeError, TypeError):
+            raise KeyError(key) from None
+
+    def __contains__(self, key):
+        return isinstance(key, str) and hasattr(self, key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return [f.name for f in fields(self)]
+
+    @property
+    def bse(self):
+        """Standard errors from the stored covariance matrix."""
+        return dict(zip(self.param_names, np.sqrt(np.diag(self.cov_params))))
+
+    def to_dict(self):
+        """JSON-friendly summary: scalars, dicts and the covariance as nested lists.
+
+        Residual series and the opt-in heavy objects are left out.
+        """
+        out = {}
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if f.name in ('model', 'diagnostic_plots') or isinstance(value, (pd.Series, pd.DataFrame)):
+                continue
+            out[f.name] = value.tolist() if isinstance(value, np.ndarray) else value
+        return out
+
+
+@dataclass(slots=True, eq=False)
+class CointegrationResult(_MappingAccess):
+    """Long-run relation ``L1_t = β0 + β1·L13_t + β2·trend_t (+ β·x_t) + u_t``."""
+
+    coefficients: dict
+    param_names: tuple
+    cov_params: np.ndarray = field(repr=False)
+    pvalues: dict
+    residuals: pd.Series = field(repr=False)
+    exog_columns: list
+    summary: dict
+    r_squared: float
+    f_statistic: dict
+    durbin_watson: float
+    interpretation: dict
+    model: object = field(default=None, repr=False)
+    diagnostic_plots: object = field(default=None, repr=False)
+
+    @property
+    def fitted_values(self):
+        """Fitted long-run values (only available when the model was kept)."""
+        return None if self.model is None else self.model.fittedvalues
+
+
+@dataclass(slots=True, eq=False)
+class ECMResult(_MappingAccess):
+    """Short-run error-correction model with its selected lag structure."""
+
+    params: dict
+    param_names: tuple
+    cov_params: np.ndarray = field(repr=False)
+    pvalues: dict
+    specification: dict
+    diagnostics: dict
+    summary: dict
+    residuals: pd.Series = field(repr=False)
+    model: object = field(default=None, repr=False)
+
+
+__all__ = ['CointegrationResult', 'ECMResult']
@@ -0,0 +1,208 @@
+"""Concurrent cointegration → ECM → backtest runs for many Colonial routes.
+
+The core pipeline is written for one target (``L1``, HTN-GBJ) with Line 13
+and Line 3 as drivers. :func:`run_multi_route` maps every target route onto
+that layout (target → ``L1``, first driver → ``L13``, optional second driver →
+``L3``), runs the chain for each target in a process pool, and stacks the
+per-route forecasts and metrics into one store. A failing route is reported
+in the ``routes`` table and never stops the others.
+"""
+
+import logging
+import os
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from .log import quiet
+from .storage import LINE_ROUTES, TransitStore, line_route_keys, split_line_rows
+from .sweep import split_pipeline_options
+
+logger = logging.getLogger(__name__)
+
+# The single-target pipeline expressed as a driver mapping over the line
+# columns of load_route_panel (Line 3 follows its route switch)
+DEFAULT_DRIVERS = {'Line1': ('Line13', 'Line3')}
+
+
+def load_route_panel(store, routes=None, start=None, end=None, line_routes=None):
+    """Wide ``Gas Transit Days`` panel (``Date`` + one column per route and line) from a store.
+
+    Parameters
+    ----------
+    store : TransitStore or path-like
+        Store to read the latest bulletin per (route, year, cycle) from.
+    routes : list of str, optional
+        Route keys (``'HTN-GBJ'``, ...); every stored route when omitted.
+    start, end : date-like, optional
+        Inclusive bounds on the bulletin ``Date``.
+    line_routes : dict, optional
+        Pipeline lines added as columns (``Line1``, ``Line3``, ``Line13``),
+        resolved like :func:`line1_implied.storage.load_pipeline_data`;
+        defaults to :data:`LINE_ROUTES`.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Sorted by ``Date``; a route without a bulletin on a date is NaN there.
+    """
+    store = store if isinstance(store, TransitStore) else TransitStore(store)
+    line_routes = line_routes or LINE_ROUTES
+    read_routes = None if routes is None else list(dict.fromkeys(list(routes) + line_route_keys(line_routes)))
+    rows = store.latest(routes=read_routes, start=start, end=end)
+    panel = rows.pivot_table(index='Date', columns='Route', values='Gas Transit Days', aggfunc='last')
+    if routes is not None:
+        panel = panel.reindex(columns=list(routes))
+    for line_name, line_df in split_line_rows(rows, line_routes).items():
+        panel[line_name] = line_df.groupby('Date')['Gas Transit Days'].last()
+    panel.columns.name = None
+    return panel.reset_index().sort_values('Date').reset_index(drop=True)
+
+
+def target_panel(route_panel, target, drivers):
+    """Aligned panel for one target in the pipeline layout (``Date, L1, L3, L13, trend``).
+
+    Keeps only dates where the target and every driver are observed, like
+    :func:`line1_implied.preparation._prepare_aligned_data`. With a single
+    driver the ``L3`` slot repeats it; the ECM then runs without ΔL3 terms.
+    """
+    drivers = [drivers] if isinstance(drivers, str) else list(drivers)
+    if not 1 <= len(drivers) <= 2:
+        raise ValueError(f"{target}: expected one or two driver routes, got {drivers}")
+    missing = [route for route in [target] + drivers if route not in route_panel.columns]
+    if missing:
+        raise ValueError(f"{target}: routes missing from the panel: {missing}")
+
+    panel = route_panel[['Date', target] + drivers].dropna()
+    panel = pd.DataFrame({
+        'Date': pd.to_datetime(panel['Date']).to_numpy(),
+        'L1': panel[target].to_numpy(dtype='float64'),
+        'L3': panel[drivers[-1]].to_numpy(dtype='float64'),
+        'L13': panel[drivers[0]].to_numpy(dtype='float64'),
+    })
+    panel['trend'] = range(1, len(panel) + 1)
+    return panel
+
+
+def _run_route(target, drivers, panel, ecm_kwargs, forecast_kwargs):
+    """Fit and backtest one target; errors are returned, not raised."""
+    from .cointegration import _estimate_cointegrating_relation
+    from .ecm import _build_ecm_model
+    from .forecast import _forecast_evaluation
+
+    record = {'target': target, 'drivers': ', '.join(drivers), 'n_obs': len(panel),
+              'status': 'ok', 'error': None}
+    if len(drivers) == 1:
+        ecm_kwargs = {**ecm_kwargs, 'include_L3': False}
+    stage = 'cointegration'
+    try:
+        with quiet():
+            coint = _estimate_cointegrating_relation(panel, plot=False)
+            stage = 'ecm'
+            ecm = _build_ecm_model(panel, coint, **ecm_kwargs)
+            stage = 'backtest'
+            eval_out = _forecast_evaluation(panel.copy(), coint, ecm, **forecast_kwargs)
+    except Exception as err:
+        record.update(status='failed', error=f"{stage}: {type(err).__name__}: {err}",
+                      traceback=traceback.format_exc())
+        return record, None, None
+
+    record.update(
+        r_squared=coint['r_squared'],
+        gamma=ecm['diagnostics']['error_correction_coeff'],
+        half_life=ecm['summary']['half_life'],
+        lags=str(tuple(ecm['specification']['lags'].values())),
+        **{f'coint_{name}': value for name, value in coint['coefficients'].items()},
+    )
+    return record, eval_out['forecast_results'], eval_out['metrics']
+
+
+def run_multi_route(route_panel, drivers=None, workers=None, out_dir=None, **kwargs):
+    """Run the cointegration → ECM → backtest chain for every target route concurrently.
+
+    Parameters
+    ----------
+    route_panel : pandas.DataFrame
+        ``Date`` plus one transit-days column per route, e.g. from
+        :func:`load_route_panel`.
+    drivers : dict, optional
+        Target column -> one or two driver columns (the ``L13`` and ``L3``
+        roles); routes or the line columns of :func:`load_route_panel`.
+        Defaults to :data:`DEFAULT_DRIVERS` (Line 1 on Line 13 and Line 3).
+    workers : int, optional
+        Worker processes (default: CPU count); ``1`` runs in-process.
+    out_dir : path-like, optional
+        Also write ``forecasts.parquet``, ``metrics.parquet`` and
+        ``routes.parquet`` there.
+    **kwargs
+        ECM and backtest options applied to every route; the same names as
+        :func:`line1_implied.sweep.run_parameter_sweep` (``sweep.ECM_PARAMS``
+        and ``sweep.FORECAST_PARAMS``).
+
+    Returns
+    -------
+    dict
+        - ``'forecasts'``: stacked ``forecast_results`` with a ``target`` column
+        - ``'metrics'``: stacked metrics indexed by ``target``, ``model``, ``horizon``
+        - ``'routes'``: one row per target (drivers, status, error, fit summary)
+    """
+    drivers = dict(drivers or DEFAULT_DRIVERS)
+    drivers = {target: [d] if isinstance(d, str) else list(d) for target, d in drivers.items()}
+    ecm_kwargs, forecast_kwargs = split_pipeline_options(kwargs)
+
+    logger.info("🛤️  Multi-route run: %s targets", len(drivers))
+    tasks, records = {}, []
+    for target, target_drivers in drivers.items():
+        try:
+            tasks[target] = (target_drivers, target_panel(route_panel, target, target_drivers))
+        except ValueError as err:
+            records.append({'target': target, 'drivers': ', '.join(target_drivers), 'status': 'failed',
+                            'error': f"panel: {err}"})
+
+    workers = workers or os.cpu_count() or 1
+    outputs = []
+    if workers <= 1 or len(tasks) <= 1:
+        for target, (target_drivers, panel) in tasks.items():
+            outputs.append(_run_route(target, target_drivers, panel, ecm_kwargs, forecast_kwargs))
+    elif tasks:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            futures = {target: pool.submit(_run_route, target, target_drivers, panel, ecm_kwargs, forecast_kwargs)
+                       for target, (target_drivers, panel) in tasks.items()}
+            for target, future in futures.items():
+                try:
+                    outputs.append(future.result())
+                except Exception as err:  # worker died (e.g. BrokenProcessPool)
+                    outputs.append(({'target': target, 'drivers': ', '.join(tasks[target][0]),
+                                     'status': 'failed', 'error': f"worker: {type(err).__name__}: {err}"},
+                                    None, None))
+
+    forecasts, metrics = [], []
+    for record, forecast_df, metrics_df in outputs:
+        records.append(record)
+        if record['status'] == 'ok':
+            forecasts.append(forecast_df.assign(target=record['target']))
+            metrics.append(metrics_df.assign(target=record['target']))
+            logger.info("  ✅ %s: %s origins", record['target'], len(forecast_df))
+        else:
+            logger.warning("  ❌ %s failed: %s", record['target'], record['error'])
+
+    routes_df = pd.DataFrame(records).set_index('target').reindex(list(drivers))
+    forecasts_df = pd.concat(forecasts, ignore_index=True) if forecasts else pd.DataFrame(columns=['target'])
+    metrics_df = (pd.concat(metrics, ignore_index=True).set_index(['target', 'model', 'horizon']).sort_index()
+                  if metrics else pd.DataFrame())
+
+    if out_dir is not None:
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        forecasts_df.to_parquet(out_dir / 'forecasts.parquet', index=False)
+        metrics_df.reset_index().to_parquet(out_dir / 'metrics.parquet', index=False)
+        routes_df.reset_index().to_parquet(out_dir / 'routes.parquet', index=False)
+
+    n_failed = int((routes_df['status'] != 'ok').sum())
+    logger.info("✅ Multi-route run complete: %s succeeded, %s failed", len(routes_df) - n_failed, n_failed)
+    return {'forecasts': forecasts_df, 'metrics': metrics_df, 'routes': routes_df}
+
+
+__all__ = ['DEFAULT_DRIVERS', 'load_route_panel', 'target_panel', 'run_multi_route']
@@ -6,19 +6,28 @@ This module wires the feature-specific helpers together in the following order:
 3. line1_implied.ecm._build_ecm_model – build the short-run ECM.
 4. line1_implied.forecast._forecast_evaluation – roll forecasts and metrics.
 5. line1_implied.reporting._display_results/_display_plots/_save_outputs – present and persist outputs.
+
+Stages 1-4 run through line1_implied.artifacts.StageRunner: each output is keyed by
+its inputs and parameters, so reruns recompute only the stages whose inputs changed.
 """
 
 from datetime import datetime
+import logging
 import time
 
 import numpy as np
 import pandas as pd
 
 from .preparation import _prepare_aligned_data
-from .cointegration import _estimate_cointegrating_relation
+from .cointegration import _estimate_cointegrating_relation, _show_diagnostics, _submit_diagnostics
 from .ecm import _build_ecm_model
 from .forecast import _forecast_evaluation
 from .reporting import _display_results, _display_plots, _save_outputs
+from .artifacts import ArtifactCache, StageRunner
+from .profiling import Profiler, section
+from .rendering import FigureRenderer
+
+logger = logging.getLogger(__name__)
 
 
 def run_pipeline_complete(
@@ -30,23 +39,81 @@ def run_pipeline_complete(
     exog_ma_lookback=3,
     save_outputs=True,
     display_results=True,
+    vintages=None,
+    aligned_data=None,
+    cache_dir=None,
+    use_cache=True,
+    profile=False,
+    profile_dir=None,
+    progress=None,
+    keep_models=False,
+    run_store=None,
+    render_dir=None,
+    report_path=None,
 ):
-    """Run the full Colonial ECM workflow using the helper modules listed above."""
-
-    if pipeline_data is None or correlation_results is None:
-        raise ValueError("'pipeline_data' and 'correlation_results' must be provided.")
-
-    if df_or_path is not None:
-        raise NotImplementedError("Loading from external file not yet implemented.")
+    """Run the full Colonial ECM workflow using the helper modules listed above.
+
+    ``vintages`` (a :class:`line1_implied.vintage.VintageStore`) makes the
+    rolling backtest train on the data as published at each forecast origin.
+    ``aligned_data`` (e.g. from :func:`line1_implied.panel_cache.load_aligned_panel`)
+    skips step 1; ``pipeline_data`` and ``correlation_results`` may then be None.
+    ``df_or_path`` (bulletin rows, or an xlsx/CSV/Parquet file read by
+    :func:`line1_implied.loaders.read_transit_file`) replaces ``pipeline_data``;
+    file parses are cached by mtime across calls.
+
+    Alignment, cointegration, ECM and backtest outputs are cached by content
+    (in memory, or under ``cache_dir`` when given); ``use_cache=False`` forces a
+    full recompute. Per-stage hit/miss status and timings are reported in
+    ``execution_metadata['stages']``.
+
+    ``profile=True`` records wall time, CPU time, peak traced memory and call
+    counts for every stage and for the inner fits (per lag candidate, per
+    forecast origin) in ``execution_metadata['profile']``; ``profile_dir``
+    additionally writes one cProfile dump per stage there (and implies
+    ``profile``).
+
+    Progress is reported through the ``line1_implied`` loggers, which are
+    silent unless configured (see :func:`line1_implied.log.configure_logging`);
+    ``progress(done, total, origin_date)`` is called after each backtest origin.
+
+    Cointegration and ECM results are compact (coefficients, covariance, lags,
+    summary statistics, residuals); ``keep_models=True`` also keeps the fitted
+    statsmodels results on them. Figures are only drawn in the display step
+    (``display_results`` or ``render_dir``), also when the fits are cached.
+
+    ``run_store`` (a :class:`line1_implied.runstore.RunStore` or its root)
+    makes ``save_outputs`` append the run to that Parquet store instead of a
+    timestamped directory; the id is in ``execution_metadata['run_id']``.
+
+    ``render_dir`` switches the figures to non-interactive rendering: they are
+    drawn with Agg in background worker processes while the pipeline goes on,
+    written there, and cached by a hash of the plotted data (paths in
+    ``execution_metadata['figures']``). Nothing is shown inline.
+
+    ``report_path`` writes a self-contained HTML report of the run there
+    (see :func:`line1_implied.html_report.write_html_report`).
+    """
+
+    if aligned_data is None and df_or_path is not None:
+        from .loaders import load_pipeline_frames
+
+        pipeline_data = load_pipeline_frames(df_or_path)
+        correlation_results = correlation_results if correlation_results is not None else {}
+
+    if aligned_data is None and (pipeline_data is None or correlation_results is None):
+        raise ValueError("'pipeline_data' and 'correlation_results' (or 'df_or_path') must be provided.")
 
     if n_test < 1:
         raise ValueError(f"n_test must be positive, got {n_test}")
 
     start_time = time.time()
+    runner = StageRunner(ArtifactCache(cache_dir), enabled=use_cache)
+    profiler = Profiler(cprofile_dir=profile_dir) if profile or profile_dir is not None else None
+    renderer = FigureRenderer(render_dir) if render_dir is not None else None
 
-    print("🚀" + "=" * 80)
-    print("           EXECUTING COMPLETE ECM FORECASTING PIPELINE")
-    print("🚀" + "=" * 80)
+    logger.info("🚀" + "=" * 80)
+    logger.info("           EXECUTING COMPLETE ECM FORECASTING PIPELINE")
+    logger.info("🚀" + "=" * 80)
 
     pipeline_results = {
         "aligned_data": None,
@@ -63,36 +130,67 @@ def run_pipeline_complete(
                 "exog_ma_lookback": exog_ma_lookback,
                 "save_outputs": save_outputs,
                 "display_results": display_results,
+                "vintage_aware": vintages is not None,
+                "prealigned": aligned_data is not None,
+                "source": (None if df_or_path is None else
+                           "DataFrame" if isinstance(df_or_path, pd.DataFrame) else str(df_or_path)),
+                "cache_dir": str(cache_dir) if cache_dir is not None else None,
+                "use_cache": use_cache,
+                "profile": profiler is not None,
+                "keep_models": keep_models,
+                "run_store": str(getattr(run_store, "root", run_store)) if run_store is not None else None,
+                "render_dir": str(render_dir) if render_dir is not None else None,
+                "report_path": str(report_path) if report_path is not None else None,
             },
             "status": "initialized",
         },
     }
 
+    if profiler is not None:
+        profiler.__enter__()
     try:
-        print("\n📋 STEP 1: DATA ALIGNMENT AND PREPARATION")
-        print("=" * 60)
-        aligned_data = _prepare_aligned_data(pipeline_data, correlation_results)
+        logger.info("\n📋 STEP 1: DATA ALIGNMENT AND PREPARATION")
+        logger.info("=" * 60)
+        if aligned_data is None:
+            aligned_data = runner.run(
+                "align",
+                lambda: _prepare_aligned_data(pipeline_data, correlation_results),
+                inputs=pipeline_data,
+            )
+        else:
+            logger.info("✅ Using pre-aligned panel: %s observations", len(aligned_data))
+            prealigned = aligned_data
+            aligned_data = runner.run("align", lambda: prealigned, inputs=prealigned, cacheable=False)
         if aligned_data is None or aligned_data.empty:
             raise ValueError("Aligned data is empty; cannot continue.")
         pipeline_results["aligned_data"] = aligned_data
 
-        print("\n🔍 STEP 2: COINTEGRATING RELATIONSHIP ESTIMATION")
-        print("=" * 60)
-        cointegration_results = _estimate_cointegrating_relation(aligned_data)
+        logger.info("\n🔍 STEP 2: COINTEGRATING RELATIONSHIP ESTIMATION")
+        logger.info("=" * 60)
+        cointegration_results = runner.run(
+            "cointegrate",
+            lambda: _estimate_cointegrating_relation(aligned_data, plot=False, keep_model=keep_models),
+            deps=["align"],
+            params={"keep_model": True} if keep_models else None,
+        )
         pipeline_results["cointegration_results"] = cointegration_results
 
         beta1 = cointegration_results.get("coefficients", {}).get("β1_L13")
         beta2 = cointegration_results.get("coefficients", {}).get("β2_trend")
         if beta1 is not None and beta2 is not None:
-            print(f"✅ Cointegrating relationship: β₁={beta1:.4f}, β₂={beta2:.4f}")
-
-        print("\n⚙️  STEP 3: ECM MODEL BUILDING")
-        print("=" * 60)
-        ecm_results = _build_ecm_model(
-            aligned_data=aligned_data,
-            cointegration_results=cointegration_results,
-            exog_nowcast=exog_nowcast,
-            exog_ma_lookback=exog_ma_lookback,
+            logger.info("✅ Cointegrating relationship: β₁=%.4f, β₂=%.4f", beta1, beta2)
+
+        logger.info("\n⚙️  STEP 3: ECM MODEL BUILDING")
+        logger.info("=" * 60)
+        ecm_results = runner.run(
+            "ecm",
+            lambda: _build_ecm_model(
+                aligned_data=aligned_data,
+                cointegration_results=cointegration_results,
+                keep_model=keep_models,
+            ),
+            deps=["align", "cointegrate"],
+            params={"keep_model": True} if keep_models else None,
         )
         pipeline_results["ecm_results"] = ecm_results
 
@@ -100,49 +198,77 @@ def run_pipeline_complete(
             ecm_results.get("diagnostics", {}).get("error_correction_coeff", np.nan)
         )
         chosen_lags = ecm_results.get("specification", {}).get("lags", {})
-        print(
-            "✅ ECM model: γ={:.4f}, lags={}".format(
-                ecm_gamma if np.isfinite(ecm_gamma) else float("nan"), chosen_lags
-            )
+        logger.info(
+            "✅ ECM model: γ=%.4f, lags=%s",
+            ecm_gamma if np.isfinite(ecm_gamma) else float("nan"), chosen_lags,
         )
 
-        print("\n📈 STEP 4: FORECAST EVALUATION")
-        print("=" * 60)
-        eval_out = _forecast_evaluation(
-            aligned_data=aligned_data,
-            cointegration_results=cointegration_results,
-            ecm_results=ecm_results,
-            n_test=n_test,
-            exog_nowcast=exog_nowcast,
-            exog_ma_lookback=exog_ma_lookback,
+        logger.info("\n📈 STEP 4: FORECAST EVALUATION")
+        logger.info("=" * 60)
+        eval_out = runner.run(
+            "backtest",
+            lambda: _forecast_evaluation(
+                aligned_data=aligned_data,
+                cointegration_results=cointegration_results,
+                ecm_results=ecm_results,
+                n_test=n_test,
+                exog_nowcast=exog_nowcast,
+                exog_ma_lookback=exog_ma_lookback,
+                vintages=vintages,
+                progress=progress,
+            ),
+            deps=["align", "cointegrate", "ecm"],
+            params={"n_test": n_test, "exog_nowcast": exog_nowcast, "exog_ma_lookback": exog_ma_lookback},
+            inputs=vintages,
         )
         pipeline_results["forecast_evaluation"] = eval_out
-        print("✅ Forecast evaluation complete")
+        logger.info("✅ Forecast evaluation complete")
+
+        if display_results or renderer is not None:
+            logger.info("\n📊 STEP 5: RESULTS DISPLAY")
+            logger.info("=" * 60)
+            def _display():
+                if display_results:
+                    with section("display.tables"):
+                        _display_results(cointegration_results, ecm_results, eval_out)
+                with section("display.plots"):
+                    # Drawn here from the (possibly cached) result, never inside the cointegrate stage
+                    if renderer is not None:
+                        _submit_diagnostics(renderer, aligned_data, cointegration_results)
+                    else:
+                        _show_diagnostics(aligned_data, cointegration_results)
+                    _display_plots(aligned_data, cointegration_results, ecm_results, eval_out, renderer=renderer)
 
-        if display_results:
-            print("\n📊 STEP 5: RESULTS DISPLAY")
-            print("=" * 60)
             try:
-                _display_results(cointegration_results, ecm_results, eval_out)
-                _display_plots(aligned_data, cointegration_results, ecm_results, eval_out)
-                print("✅ Results display complete")
+                runner.run("display", _display, deps=["backtest"], cacheable=False)
+                logger.info("✅ Results display complete")
             except Exception as err:
-                print(f"⚠️  Display warning: {err}")
+                logger.warning("⚠️  Display warning: %s", err)
 
         if save_outputs:
-            print("\n💾 STEP 6: OUTPUT SAVING")
-            print("=" * 60)
+            logger.info("\n💾 STEP 6: OUTPUT SAVING")
+            logger.info("=" * 60)
             try:
-                output_dir = _save_outputs(
-                    aligned_data, cointegration_results, ecm_results, eval_out
+                saved = runner.run(
+                    "save",
+                    lambda: _save_outputs(
+                        aligned_data, cointegration_results, ecm_results, eval_out,
+                        run_store=run_store, params=pipeline_results["execution_metadata"]["parameters"],
+                    ),
+                    deps=["backtest"],
+                    cacheable=False,
                 )
-                pipeline_results["execution_metadata"]["output_directory"] = str(output_dir)
-                print(f"✅ Outputs saved to: {output_dir}")
+                if run_store is not None:
+                    pipeline_results["execution_metadata"]["run_id"] = saved
+                    logger.info("✅ Run %s appended to the run store", saved)
+                else:
+                    pipeline_results["execution_metadata"]["output_directory"] = str(saved)
+                    logger.info("✅ Outputs saved to: %s", saved)
             except Exception as err:
-                print(f"⚠️  Save warning: {err}")
+                logger.warning("⚠️  Save warning: %s", err)
 
-        print("\n📋 STEP 7: COMPILING KEY METRICS")
-        print("=" * 60)
+        logger.info("\n📋 STEP 7: COMPILING KEY METRICS")
+        logger.info("=" * 60)
         key_metrics = {
             "beta1": cointegration_results.get("coefficients", {}).get("β1_L13", np.nan),
             "beta2": cointegration_results.get("coefficients", {}).get("β2_trend", np.nan),
@@ -205,6 +331,14 @@ def run_pipeline_complete(
             "best_horizon": best_horizon,
         }
 
+        if renderer is not None:
+            with section("display.render_wait"):
+                figures = renderer.close()
+            pipeline_results["execution_metadata"]["figures"] = {
+                name: str(path) if path is not None else None for name, path in figures.items()
+            }
+            logger.info("🖼️  %s figure(s) in %s (%s reused)", len(figures), render_dir, renderer.hits)
+
         end_time = time.time()
         execution_time = end_time - start_time
 
@@ -216,32 +350,50 @@ def run_pipeline_complete(
             }
         )
 
-        print("\n🎉" + "=" * 80)
-        print("           🎯 ECM PIPELINE EXECUTION COMPLETED 🎯")
-        print("🎉" + "=" * 80)
-        print(f"\n⏱️  EXECUTION SUMMARY:")
-        print(f"   • Total time: {execution_time:.2f} seconds")
-        print(f"   • Data points: {len(aligned_data)}")
-        print(f"   • Test periods: {n_test}")
-        print(
-            f"   • Error correction speed: {ecm_gamma:.3f}"
-            if np.isfinite(ecm_gamma)
-            else "   • Error correction speed: N/A"
-        )
+        logger.info("\n🎉" + "=" * 80)
+        logger.info("           🎯 ECM PIPELINE EXECUTION COMPLETED 🎯")
+        logger.info("🎉" + "=" * 80)
+        logger.info("\n⏱️  EXECUTION SUMMARY:")
+        logger.info("   • Total time: %.2f seconds", execution_time)
+        logger.info("   • Data points: %s", len(aligned_data))
+        logger.info("   • Test periods: %s", n_test)
+        if np.isfinite(ecm_gamma):
+            logger.info("   • Error correction speed: %.3f", ecm_gamma)
+        else:
+            logger.info("   • Error correction speed: N/A")
         if np.isfinite(avg_improvement):
-            print(f"   • Average improvement vs RW: {avg_improvement:.1f}%")
+            logger.info("   • Average improvement vs RW: %.1f%%", avg_improvement)
         else:
-            print("   • Average improvement vs RW: N/A")
-        print("\n✅ Pipeline completed successfully!")
+            logger.info("   • Average improvement vs RW: N/A")
+        logger.info("\n✅ Pipeline completed successfully!")
+
+        if report_path is not None:
+            from .html_report import write_html_report
+
+            try:
+                with section("report"):
+                    write_html_report(pipeline_results, report_path)
+                pipeline_results["execution_metadata"]["report_path"] = str(report_path)
+            except Exception as err:
+                logger.warning("⚠️  Report warning: %s", err)
 
     except Exception as err:
-        print(f"❌ PIPELINE ERROR: {err}")
+        logger.exception("❌ PIPELINE ERROR: %s", err)
         pipeline_results["execution_metadata"]["status"] = "failed"
         pipeline_results["execution_metadata"]["error"] = str(err)
-        import traceback
-
-        traceback.print_exc()
-
+    finally:
+        if renderer is not None:
+            renderer.close()
+        if profiler is not None:
+            profiler.__exit__(None, None, None)
+
+    pipeline_results["execution_metadata"]["stages"] = runner.records
+    pipeline_results["execution_metadata"]["cache"] = {
+        status: sum(1 for r in runner.records.values() if r["status"] == status)
+        for status in ("hit", "miss", "uncached")
+    }
+    if profiler is not None:
+        pipeline_results["execution_metadata"]["profile"] = profiler.report()
     return pipeline_results
 
 __all__ = ["run_pipeline_complete"]
@@ -0,0 +1,234 @@
+"""Append-only Parquet store of pipeline runs (forecasts, metrics, coefficients).
+
+Each run appends one file per table under a hive partition
+(``<root>/metrics/run_id=<id>/part-0.parquet``) and one row to the small run
+index ``<root>/_runs.parquet``. Comparing runs is a single dataset scan
+filtered on ``run_id``, which only opens the matching partitions::
+
+    store = RunStore('outputs/runs')
+    store.metric_history('RMSE', last=100)   # runs x horizon, ECM RMSE
+"""
+
+import json
+import logging
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+_PARTITION_SCHEMA = pa.schema([('run_id', pa.string())])
+
+_TABLE_SCHEMAS = {
+    'forecasts': pa.schema([
+        ('date', pa.timestamp('ns')),
+        ('horizon', pa.int64()),
+        ('y_actual', pa.float64()),
+        ('ecm_forecast', pa.float64()),
+        ('rw_forecast', pa.float64()),
+        ('arima_forecast', pa.float64()),
+        ('forecast_origin', pa.timestamp('ns')),
+    ]),
+    'metrics': pa.schema([
+        ('model', pa.string()),
+        ('horizon', pa.int64()),
+        ('RMSE', pa.float64()),
+        ('MAE', pa.float64()),
+        ('MAPE', pa.float64()),
+    ]),
+    'coefficients': pa.schema([
+        ('stage', pa.string()),
+        ('term', pa.string()),
+        ('estimate', pa.float64()),
+        ('std_error', pa.float64()),
+        ('pvalue', pa.float64()),
+    ]),
+}
+
+_INDEX_SCHEMA = pa.schema([
+    ('run_id', pa.string()),
+    ('created_at', pa.timestamp('ns')),
+    ('n_obs', pa.int64()),
+    ('sample_start', pa.timestamp('ns')),
+    ('sample_end', pa.timestamp('ns')),
+    ('lags', pa.string()),
+    ('ic_used', pa.string()),
+    ('gamma', pa.float64()),
+    ('r_squared', pa.float64()),
+    ('ecm_rmse_h1', pa.float64()),
+    ('params', pa.string()),
+])
+
+
+def _new_run_id():
+    # Sorts chronologically; the suffix keeps ids unique within one second
+    return f"{datetime.now():%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:6]}"
+
+
+def _coefficient_rows(stage, result):
+    """(term, estimate, std_error, pvalue) rows from a cointegration/ECM result."""
+    if result is None:
+        return []
+    names = list(result.get('param_names') or [])
+    if 'params' in result:
+        estimates = list(result['params'].values())
+    else:
+        # Cointegration coefficients are keyed by β labels in parameter order
+        estimates = list(result.get('coefficients', {}).values())
+        names = names or list(result.get('coefficients', {}))
+    cov = result.get('cov_params')
+    std_errors = np.sqrt(np.diag(cov)) if cov is not None else [np.nan] * len(names)
+    pvalues = result.get('pvalues') or {}
+    return [
+        {'stage': stage, 'term': name, 'estimate': float(value), 'std_error': float(se),
+         'pvalue': float(pvalues.get(name, np.nan))}
+        for name, value, se in zip(names, estimates, std_errors)
+    ]
+
+
+class RunStore:
+    """Append-only run artifact store partitioned by ``run_id``."""
+
+    TABLES = tuple(_TABLE_SCHEMAS)
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.index_path = self.root / '_runs.parquet'
+
+    def _write_table(self, name, frame, run_id):
+        schema = _TABLE_SCHEMAS[name]
+        frame = frame.reindex(columns=schema.names)
+        table = pa.Table.from_pandas(frame, schema=schema, preserve_index=False)
+        table = table.append_column('run_id', pa.array([run_id] * len(table), pa.string()))
+        ds.write_dataset(
+            table,
+            str(self.root / name),
+            format='parquet',
+            partitioning=ds.partitioning(_PARTITION_SCHEMA, flavor='hive'),
+            basename_template='part-{i}.parquet',
+            existing_data_behavior='overwrite_or_ignore',
+        )
+
+    def append(self, eval_out, cointegration_results=None, ecm_results=None, aligned_data=None,
+               params=None, run_id=None):
+        """Store one run and return its ``run_id``.
+
+        Parameters
+        ----------
+        eval_out : dict
+            Output of :func:`_forecast_evaluation` (``forecast_results`` and
+            ``metrics`` are stored).
+        cointegration_results, ecm_results : optional
+            Fit results; their coefficients, standard errors and p-values
+            are stored, and the ECM lags/γ go to the run index.
+        aligned_data : pandas.DataFrame, optional
+            Estimation panel; only its size and date range are recorded.
+        params : dict, optional
+            Run parameters, kept as JSON in the run index.
+        run_id : str, optional
+            Defaults to a timestamp-based id.
+        """
+        run_id = run_id or _new_run_id()
+        metrics = eval_out.get('metrics') if eval_out else None
+        tables = {
+            'forecasts': eval_out.get('forecast_results') if eval_out else None,
+            'metrics': metrics,
+            'coefficients': pd.DataFrame(
+                _coefficient_rows('cointegration', cointegration_results) + _coefficient_rows('ecm', ecm_results),
+                columns=_TABLE_SCHEMAS['coefficients'].names,
+            ),
+        }
+        for name, frame in tables.items():
+            if isinstance(frame, pd.DataFrame) and not frame.empty:
+                self._write_table(name, frame, run_id)
+
+        ecm_results = ecm_results or {}
+        spec = ecm_results.get('specification', {})
+        ecm_rmse_h1 = np.nan
+        if isinstance(metrics, pd.DataFrame) and not metrics.empty:
+            row = metrics[(metrics['model'] == 'ECM') & (metrics['horizon'] == 1)]
+            ecm_rmse_h1 = float(row['RMSE'].iloc[0]) if not row.empty else np.nan
+        has_panel = isinstance(aligned_data, pd.DataFrame) and 'Date' in aligned_data
+        entry = {
+            'run_id': run_id,
+            'created_at': pd.Timestamp.now(),
+            'n_obs': len(aligned_data) if has_panel else None,
+            'sample_start': aligned_data['Date'].min() if has_panel else None,
+            'sample_end': aligned_data['Date'].max() if has_panel else None,
+            'lags': json.dumps(spec.get('lags')) if spec.get('lags') is not None else None,
+            'ic_used': spec.get('ic_used'),
+            'gamma': ecm_results.get('diagnostics', {}).get('error_correction_coeff', np.nan),
+            'r_squared': (cointegration_results or {}).get('r_squared', np.nan),
+            'ecm_rmse_h1': ecm_rmse_h1,
+            'params': json.dumps(params or {}, default=str, sort_keys=True),
+        }
+        index = pd.concat([self.runs(), pd.DataFrame([entry])], ignore_index=True)
+        self._write_index(index)
+        logger.info("🗄️  Stored run %s in %s", run_id, self.root)
+        return run_id
+
+    def _write_index(self, index):
+        self.root.mkdir(parents=True, exist_ok=True)
+        table = pa.Table.from_pandas(index, schema=_INDEX_SCHEMA, preserve_index=False)
+        tmp = self.index_path.with_suffix('.tmp')
+        pq.write_table(table, tmp)
+        tmp.replace(self.index_path)
+
+    def runs(self, last=None):
+        """Run index, oldest first (``last`` keeps the most recent runs)."""
+        if not self.index_path.exists():
+            return pd.DataFrame({name: pd.Series(dtype=object) for name in _INDEX_SCHEMA.names})
+        index = pd.read_parquet(self.index_path).sort_values('created_at', kind='mergesort')
+        if last is not None:
+            index = index.tail(last)
+        return index.reset_index(drop=True)
+
+    def read(self, table, runs=None, last=None, columns=None):
+        """Rows of ``table`` for the given runs (all runs by default).
+
+        Parameters
+        ----------
+        table : {'forecasts', 'metrics', 'coefficients'}
+        runs : str or list of str, optional
+            Run ids to read.
+        last : int, optional
+            Read the ``last`` most recent runs from the index instead.
+        columns : list of str, optional
+            Columns to materialize (``run_id`` is always included).
+        """
+        if table not in _TABLE_SCHEMAS:
+            raise ValueError(f"Unknown table {table!r}; expected one of {self.TABLES}")
+        schema = _TABLE_SCHEMAS[table]
+        wanted = ['run_id'] + [c for c in (columns or schema.names) if c != 'run_id']
+        if last is not None:
+            runs = self.runs(last=last)['run_id'].tolist()
+        elif isinstance(runs, str):
+            runs = [runs]
+        if not (self.root / table).exists() or (runs is not None and not runs):
+            return pd.DataFrame(columns=wanted)
+
+        dataset = ds.dataset(
+            str(self.root / table),
+            schema=pa.unify_schemas([schema, _PARTITION_SCHEMA]),
+            format='parquet',
+            partitioning=ds.partitioning(_PARTITION_SCHEMA, flavor='hive'),
+        )
+        predicate = ds.field('run_id').isin(list(runs)) if runs is not None else None
+        return dataset.to_table(filter=predicate, columns=wanted).to_pandas()
+
+    def metric_history(self, metric='RMSE', model='ECM', last=None, runs=None):
+        """``metric`` for ``model`` as a runs x horizon table (runs in index order)."""
+        metrics = self.read('metrics', runs=runs, last=last, columns=['model', 'horizon', metric])
+        metrics = metrics[metrics['model'] == model]
+        order = self.runs()['run_id']
+        history = metrics.pivot_table(index='run_id', columns='horizon', values=metric)
+        return history.reindex([r for r in order if r in history.index])
+
+
+__all__ = ['RunStore']
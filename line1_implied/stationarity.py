@@ -1,7 +1,13 @@
 """Stationarity diagnostics for Colonial Pipeline series."""
 
+import logging
+
 import pandas as pd
-from statsmodels.tsa.stattools import adfuller, kpss
+
+from .log import console
+
+logger = logging.getLogger(__name__)
+
 
 def _test_stationarity(ts_data, column_name, max_lags=None, trend='c'):
     """
@@ -16,6 +22,8 @@ def _test_stationarity(ts_data, column_name, max_lags=None, trend='c'):
     Returns:
     - Dictionary with test results
     """
+    from statsmodels.tsa.stattools import adfuller, kpss
+
     # Remove NaN values
     clean_data = ts_data.dropna()
 
@@ -82,46 +90,47 @@ def _test_stationarity(ts_data, column_name, max_lags=None, trend='c'):
 
     return results
 
+@console()
 def _print_stationarity_results(results):
     """Print formatted stationarity test results"""
-    print(f"\n{'='*70}")
-    print(f"STATIONARITY ANALYSIS: {results['series_name']}")
-    print(f"{'='*70}")
-    print(f"Data Summary:")
-    print(f"  • Observations: {results['n_observations']}")
-    print(f"  • Mean: {results['mean']:.4f}")
-    print(f"  • Std Dev: {results['std']:.4f}")
-    print(f"  • Range: [{results['min']:.4f}, {results['max']:.4f}]")
+    logger.info("\n" + "=" * 70)
+    logger.info("STATIONARITY ANALYSIS: %s", results['series_name'])
+    logger.info("=" * 70)
+    logger.info("Data Summary:")
+    logger.info("  • Observations: %s", results['n_observations'])
+    logger.info("  • Mean: %.4f", results['mean'])
+    logger.info("  • Std Dev: %.4f", results['std'])
+    logger.info("  • Range: [%.4f, %.4f]", results['min'], results['max'])
 
     if 'adf' in results and 'error' not in results['adf']:
         adf = results['adf']
-        print(f"\n🔍 Augmented Dickey-Fuller Test:")
-        print(f"  • Test Statistic: {adf['statistic']:.6f}")
-        print(f"  • P-value: {adf['p_value']:.6f}")
-        print(f"  • Lags Used: {adf['used_lag']}")
-        print(f"  • Critical Values:")
+        logger.info("\n🔍 Augmented Dickey-Fuller Test:")
+        logger.info("  • Test Statistic: %.6f", adf['statistic'])
+        logger.info("  • P-value: %.6f", adf['p_value'])
+        logger.info("  • Lags Used: %s", adf['used_lag'])
+        logger.info("  • Critical Values:")
         for level, cv in adf['critical_values'].items():
-            print(f"    - {level}: {cv:.6f}")
-        print(f"  • Conclusion: {adf['conclusion']} (p {'<' if adf['is_stationary'] else '≥'} 0.05)")
+            logger.info("    - %s: %.6f", level, cv)
+        logger.info("  • Conclusion: %s (p %s 0.05)", adf['conclusion'], '<' if adf['is_stationary'] else '≥')
 
     if 'kpss' in results and 'error' not in results['kpss']:
         kpss = results['kpss']
-        print(f"\n📊 KPSS Test:")
-        print(f"  • Test Statistic: {kpss['statistic']:.6f}")
-        print(f"  • P-value: {kpss['p_value']:.6f}")
-        print(f"  • Lags Used: {kpss['lags_used']}")
-        print(f"  • Critical Values:")
+        logger.info("\n📊 KPSS Test:")
+        logger.info("  • Test Statistic: %.6f", kpss['statistic'])
+        logger.info("  • P-value: %.6f", kpss['p_value'])
+        logger.info("  • Lags Used: %s", kpss['lags_used'])
+        logger.info("  • Critical Values:")
         for level, cv in kpss['critical_values'].items():
-            print(f"    - {level}%: {cv:.6f}")
-        print(f"  • Conclusion: {kpss['conclusion']} (p {'>' if kpss['is_stationary'] else '≤'} 0.05)")
+            logger.info("    - %s: %.6f", level, cv)
+        logger.info("  • Conclusion: %s (p %s 0.05)", kpss['conclusion'], '>' if kpss['is_stationary'] else '≤')
 
     if 'overall_conclusion' in results:
-        print(f"\n🎯 OVERALL CONCLUSION: {results['overall_conclusion']}")
+        logger.info("\n🎯 OVERALL CONCLUSION: %s", results['overall_conclusion'])
 
 def analyze_pipeline_stationarity(pipeline_data):
     """Analyze stationarity for all pipeline data"""
-    print("🔍 STATIONARITY ANALYSIS FOR ALL PIPELINES")
-    print("="*80)
+    logger.info("🔍 STATIONARITY ANALYSIS FOR ALL PIPELINES")
+    logger.info("="*80)
 
     stationarity_results = {}
     for line_name, data in pipeline_data.items():
@@ -131,7 +140,7 @@ def analyze_pipeline_stationarity(pipeline_data):
             stationarity_results[line_name] = results
             _print_stationarity_results(results)
         else:
-            print(f"\n⚠️  {line_name}: Insufficient data ({len(clean_data)} points) for stationarity tests")
+            logger.warning("\n⚠️  %s: Insufficient data (%s points) for stationarity tests", line_name, len(clean_data))
 
     return stationarity_results
 
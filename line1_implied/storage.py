@@ -0,0 +1,380 @@
+"""Partitioned Parquet store for Colonial transit-time bulletins."""
+
+import logging
+import uuid
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from .upsert import LONG_COLUMNS, to_long, to_wide, upsert_transit
+
+logger = logging.getLogger(__name__)
+
+# Pipeline line name -> Colonial route (From-To) used throughout the package.
+# A line whose bulletins moved to another route lists dated (route, first_date)
+# switches; resolve with line_route_keys / split_line_rows.
+LINE_ROUTES = {
+    'Line1': 'HTN-GBJ',
+    'Line3': [('GBJ-HTN', None), ('GBJ-LNJ', '2025-08-03')],
+    'Line13': 'HTN-LNJ',
+}
+
+VALUE_COLUMNS = ['Gas Days', 'Gas Hours', 'Distillates Days', 'Distillates Hours']
+RECORD_COLUMNS = ['Date', 'From', 'To', 'Cycle'] + VALUE_COLUMNS + ['Gas Transit Days']
+
+_PARTITION_SCHEMA = pa.schema([('Route', pa.string()), ('year', pa.int32())])
+_DATA_SCHEMA = pa.schema(
+    [('Date', pa.timestamp('ns')), ('From', pa.string()), ('To', pa.string()), ('Cycle', pa.int64())]
+    + [(col, pa.int64()) for col in VALUE_COLUMNS]
+    + [('Gas Transit Days', pa.float64())]
+)
+_SCHEMA = pa.schema(list(_DATA_SCHEMA) + list(_PARTITION_SCHEMA))
+
+
+def _as_timestamp(value):
+    return None if value is None else pd.Timestamp(value)
+
+
+def _route_segments(spec):
+    """``[(route, start, end)]`` for one line (``end`` exclusive, ``None`` = open)."""
+    if isinstance(spec, str):
+        return [(spec, None, None)]
+    spec = list(spec)
+    if all(isinstance(item, str) for item in spec):
+        return [(route, None, None) for route in spec]
+    starts = [_as_timestamp(start) for _, start in spec]
+    return [(route, start, end) for (route, _), start, end in zip(spec, starts, starts[1:] + [None])]
+
+
+def line_route_keys(line_routes=None):
+    """Every route key a line mapping refers to, in first-seen order.
+
+    Parameters
+    ----------
+    line_routes : dict, optional
+        Line name -> route key, list of route keys, or list of dated
+        ``(route, first_date)`` switches; defaults to :data:`LINE_ROUTES`.
+    """
+    keys = []
+    for spec in (line_routes or LINE_ROUTES).values():
+        keys.extend(route for route, _, _ in _route_segments(spec) if route not in keys)
+    return keys
+
+
+def split_line_rows(rows, line_routes=None):
+    """Split bulletin rows into ``pipeline_data`` line frames.
+
+    Parameters
+    ----------
+    rows : pandas.DataFrame
+        Rows with ``Route`` and ``Date`` columns.
+    line_routes : dict, optional
+        Line mapping as in :func:`line_route_keys`. A line with several routes
+        takes each route's rows (within its date window for dated switches).
+
+    Returns
+    -------
+    dict
+        Line name -> rows without ``Route``, sorted by ``Date``.
+    """
+    pipeline_data = {}
+    for line_name, spec in (line_routes or LINE_ROUTES).items():
+        mask = pd.Series(False, index=rows.index)
+        for route, start, end in _route_segments(spec):
+            part = rows['Route'] == route
+            if start is not None:
+                part &= rows['Date'] >= start
+            if end is not None:
+                part &= rows['Date'] < end
+            mask |= part
+        line_df = rows[mask].sort_values('Date', kind='mergesort')
+        pipeline_data[line_name] = line_df.drop(columns='Route').reset_index(drop=True)
+    return pipeline_data
+
+
+def normalize_transit_frame(df):
+    """Coerce bulletin rows to the store's typed schema.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Rows with ``Date``, ``From``, ``To``, ``Cycle`` and the four day/hour
+        columns, as produced by the extractor or the workbook sheets. A
+        ``Route`` column is derived from ``From``/``To`` when absent and
+        ``Gas Transit Days`` is (re)computed as ``Gas Days + Gas Hours / 24``.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Copy with nullable integer day/hour/cycle columns, datetime ``Date``,
+        string ``Route`` and an integer ``year`` partition column.
+    """
+    missing = {'Date', 'From', 'To', 'Cycle', 'Gas Days', 'Gas Hours'} - set(df.columns)
+    if missing:
+        raise ValueError(f"Transit rows missing columns: {missing}")
+
+    out = pd.DataFrame({
+        'Date': pd.to_datetime(df['Date'], errors='coerce'),
+        'From': df['From'].astype(str).str.upper(),
+        'To': df['To'].astype(str).str.upper(),
+    })
+    for col in ['Cycle'] + VALUE_COLUMNS:
+        values = df[col] if col in df.columns else np.nan
+        out[col] = pd.to_numeric(pd.Series(values, index=df.index), errors='coerce').round().astype('Int64')
+    out['Gas Transit Days'] = (
+        out['Gas Days'].astype('float64') + out['Gas Hours'].astype('float64') / 24
+    )
+    out['Route'] = df['Route'].astype(str) if 'Route' in df.columns else out['From'] + '-' + out['To']
+    out = out.dropna(subset=['Date'])
+    out['year'] = out['Date'].dt.year.astype('int32')
+    return out.reset_index(drop=True)
+
+
+class TransitStore:
+    """Append-only Parquet dataset partitioned by ``Route`` and ``year``.
+
+    Layout is hive-style (``<root>/Route=HTN-GBJ/year=2025/part-*.parquet``) so
+    reads filtered by route and date range only open the matching partitions,
+    and the ``Date`` predicate is pushed down to row-group statistics.
+
+    Alongside the raw rows the store keeps ``<root>/_latest.parquet``, the
+    latest bulletin per (route, product, year, cycle), upserted on every
+    append (the leading underscore keeps it out of the dataset scan).
+    """
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.latest_path = self.root / '_latest.parquet'
+
+    def _dataset(self):
+        return ds.dataset(
+            str(self.root),
+            schema=_SCHEMA,
+            format='parquet',
+            partitioning=ds.partitioning(_PARTITION_SCHEMA, flavor='hive'),
+        )
+
+    def exists(self):
+        return self.root.exists() and any(self.root.rglob('*.parquet'))
+
+    def append(self, df):
+        """Append bulletin rows as new part files; existing files are never rewritten.
+
+        Returns
+        -------
+        int
+            Number of rows written.
+        """
+        rows = normalize_transit_frame(df)
+        if rows.empty:
+            return 0
+        table = pa.Table.from_pandas(rows[list(_SCHEMA.names)], schema=_SCHEMA, preserve_index=False)
+        ds.write_dataset(
+            table,
+            str(self.root),
+            format='parquet',
+            partitioning=ds.partitioning(_PARTITION_SCHEMA, flavor='hive'),
+            basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+            existing_data_behavior='overwrite_or_ignore',
+        )
+        self._write_latest(upsert_transit(self._read_latest(), to_long(rows)))
+        return len(rows)
+
+    def _read_latest(self):
+        if not self.latest_path.exists():
+            return None
+        return pd.read_parquet(self.latest_path)
+
+    def _write_latest(self, long_df):
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.latest_path.with_suffix('.tmp')
+        long_df.to_parquet(tmp, index=False)
+        tmp.replace(self.latest_path)
+
+    def rebuild_latest(self):
+        """Recompute the latest-bulletin snapshot from every raw row in the store."""
+        rows = self.read(columns=RECORD_COLUMNS)
+        if rows.empty:
+            return 0
+        latest = upsert_transit(None, to_long(normalize_transit_frame(rows)))
+        self._write_latest(latest)
+        return len(latest)
+
+    def latest(self, routes=None, start=None, end=None):
+        """Latest bulletin per (route, year, cycle) in the workbook's wide layout.
+
+        Replaces ``threshold_merge`` + ``keep_latest_cycle_per_year``: no cutoff
+        date is needed because every append is upserted with "latest bulletin
+        wins" semantics.
+
+        Parameters
+        ----------
+        routes : str or list of str, optional
+            Route keys; all routes when omitted.
+        start, end : date-like, optional
+            Inclusive bounds on the bulletin ``Date``.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Rows sorted by ``Route`` and ``Date``.
+        """
+        if not self.latest_path.exists() and self.exists():
+            self.rebuild_latest()
+        long_df = self._read_latest()
+        if long_df is None:
+            return to_wide(pd.DataFrame(columns=LONG_COLUMNS))
+
+        if routes is not None:
+            routes = [routes] if isinstance(routes, str) else list(routes)
+            long_df = long_df[long_df['Route'].isin(routes)]
+        wide = to_wide(long_df)
+        start, end = _as_timestamp(start), _as_timestamp(end)
+        if start is not None:
+            wide = wide[wide['Date'] >= start]
+        if end is not None:
+            wide = wide[wide['Date'] <= end]
+        return wide.reset_index(drop=True)
+
+    def read(self, routes=None, start=None, end=None, columns=None):
+        """Read rows for the given routes and inclusive date range.
+
+        Parameters
+        ----------
+        routes : str or list of str, optional
+            Route keys such as ``'HTN-GBJ'``; all routes when omitted.
+        start, end : date-like, optional
+            Inclusive bounds on ``Date``.
+        columns : list of str, optional
+            Subset of columns to materialize (``Route`` is always included).
+
+        Returns
+        -------
+        pandas.DataFrame
+            Matching rows sorted by ``Route`` and ``Date``.
+        """
+        if not self.exists():
+            return pd.DataFrame(columns=['Route'] + RECORD_COLUMNS)
+
+        start, end = _as_timestamp(start), _as_timestamp(end)
+        predicate = None
+
+        def _and(expr):
+            return expr if predicate is None else predicate & expr
+
+        if routes is not None:
+            routes = [routes] if isinstance(routes, str) else list(routes)
+            predicate = _and(ds.field('Route').isin(routes))
+        if start is not None:
+            predicate = _and((ds.field('year') >= start.year) & (ds.field('Date') >= pa.scalar(start, pa.timestamp('ns'))))
+        if end is not None:
+            predicate = _and((ds.field('year') <= end.year) & (ds.field('Date') <= pa.scalar(end, pa.timestamp('ns'))))
+
+        wanted = ['Route'] + [c for c in (columns or RECORD_COLUMNS) if c != 'Route']
+        table = self._dataset().to_table(filter=predicate, columns=wanted)
+        df = table.to_pandas(types_mapper={pa.int64(): pd.Int64Dtype()}.get)
+        return df.sort_values(['Route', 'Date'], kind='mergesort').reset_index(drop=True)
+
+    def compact(self):
+        """Rewrite each partition as a single file (after many small appends)."""
+        for partition in sorted({p.parent for p in self.root.rglob('*.parquet')}):
+            parts = sorted(partition.glob('*.parquet'))
+            if len(parts) <= 1:
+                continue
+            table = pa.concat_tables([pq.read_table(p, schema=_DATA_SCHEMA) for p in parts])
+            target = partition / f"part-{uuid.uuid4().hex}-0.parquet"
+            tmp = target.with_suffix('.tmp')
+            pq.write_table(table, tmp)
+            tmp.rename(target)
+            for part in parts:
+                part.unlink()
+
+
+def load_pipeline_data(store, start=None, end=None, line_routes=None, latest_cycle=True):
+    """Load the pipeline line frames (``Line1``, ``Line3``, ``Line13``) from the store.
+
+    Parameters
+    ----------
+    store : TransitStore or path-like
+        Store to read from.
+    start, end : date-like, optional
+        Inclusive date bounds pushed down to the Parquet scan.
+    line_routes : dict, optional
+        Line name -> route mapping (see :func:`line_route_keys`); defaults to
+        :data:`LINE_ROUTES`.
+    latest_cycle : bool, default True
+        Read the latest bulletin per (year, cycle) from the upserted snapshot;
+        ``False`` returns every raw bulletin row.
+
+    Returns
+    -------
+    dict
+        ``pipeline_data`` dictionary ready for :func:`_prepare_aligned_data`.
+    """
+    store = store if isinstance(store, TransitStore) else TransitStore(store)
+    routes = line_route_keys(line_routes)
+    if latest_cycle:
+        rows = store.latest(routes=routes, start=start, end=end)
+    else:
+        rows = store.read(routes=routes, start=start, end=end)
+    return split_line_rows(rows, line_routes)
+
+
+def import_workbooks(store, paths):
+    """One-time import of the legacy Excel workbooks into a :class:`TransitStore`.
+
+    Every sheet with bulletin-level columns (``Date``, ``From``, ``To``,
+    ``Cycle``, day/hour values) is imported; pivoted sheets without dates
+    (e.g. the ``line13`` cycle-by-year grid in ``Archive/``) are skipped.
+    Rows repeated across workbooks (same route, date and cycle) are written once.
+
+    Parameters
+    ----------
+    store : TransitStore or path-like
+        Destination store.
+    paths : list of path-like
+        Workbooks such as ``data/colonial_transit_time.xlsx`` and the
+        ``Archive/colonial_transit_time_*.xlsx`` snapshots.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per sheet with the number of rows read and imported.
+    """
+    store = store if isinstance(store, TransitStore) else TransitStore(store)
+    required = {'Date', 'From', 'To', 'Cycle', 'Gas Days', 'Gas Hours'}
+
+    frames, report = [], []
+    for path in paths:
+        for sheet_name, sheet in pd.read_excel(path, sheet_name=None).items():
+            if not required.issubset(sheet.columns):
+                report.append({'workbook': str(path), 'sheet': sheet_name, 'rows': len(sheet), 'status': 'skipped'})
+                continue
+            frames.append(normalize_transit_frame(sheet))
+            report.append({'workbook': str(path), 'sheet': sheet_name, 'rows': len(sheet), 'status': 'imported'})
+
+    if frames:
+        combined = pd.concat(frames, ignore_index=True)
+        combined = combined.drop_duplicates(['Route', 'Date', 'Cycle'], keep='first')
+        written = store.append(combined)
+    else:
+        written = 0
+
+    report_df = pd.DataFrame(report)
+    logger.info("📦 Imported %s unique rows from %s workbook(s) into %s", written, len(paths), store.root)
+    return report_df
+
+
+__all__ = [
+    'LINE_ROUTES',
+    'line_route_keys',
+    'split_line_rows',
+    'TransitStore',
+    'normalize_transit_frame',
+    'load_pipeline_data',
+    'import_workbooks',
+]
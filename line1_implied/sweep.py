@@ -0,0 +1,221 @@
+"""Parallel parameter sweeps over the ECM pipeline.
+
+The aligned panel and the cointegrating relation are computed once in the
+parent process. The panel is placed in shared memory and mapped read-only by
+every worker. Configurations that share an ECM specification
+(``ic_kind``, ``include_L3``, ...) are grouped so each ECM is fitted once; as
+soon as a fit finishes, one backtest task per configuration using it
+(``n_test``, ``exog_nowcast``, ...) is queued on the same pool, so a sweep
+over backtest settings alone is still spread over every worker.
+"""
+
+import itertools
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from .log import quiet
+
+logger = logging.getLogger(__name__)
+
+# Options accepted by the sweep and by routes.run_multi_route
+ECM_PARAMS = ('ic_kind', 'include_L3', 'allow_contemporaneous', 'max_lags_cap')
+FORECAST_PARAMS = ('n_test', 'exog_nowcast', 'exog_ma_lookback')
+
+_PANEL_COLUMNS = ['L1', 'L3', 'L13', 'trend']
+
+# Worker-side state set by _init_worker
+_WORKER = {}
+
+
+def split_pipeline_options(options, label='pipeline options'):
+    """``(ecm_kwargs, forecast_kwargs)`` from one options dict; unknown keys raise ``ValueError``."""
+    unknown = set(options) - set(ECM_PARAMS) - set(FORECAST_PARAMS)
+    if unknown:
+        raise ValueError(f"Unknown {label}: {sorted(unknown)}")
+    return ({k: options[k] for k in ECM_PARAMS if k in options},
+            {k: options[k] for k in FORECAST_PARAMS if k in options})
+
+
+def expand_grid(param_grid):
+    """List of configuration dicts from a grid (dict of lists) or a list of dicts."""
+    if isinstance(param_grid, dict):
+        names = list(param_grid)
+        return [dict(zip(names, values)) for values in itertools.product(*(param_grid[n] for n in names))]
+    return [dict(config) for config in param_grid]
+
+
+def _share_panel(aligned_data):
+    """Copy the panel into shared memory; returns (handles, spec) for the workers."""
+    dates = pd.to_datetime(aligned_data['Date']).to_numpy(dtype='datetime64[ns]').view('int64')
+    values = aligned_data[_PANEL_COLUMNS].to_numpy(dtype='float64')
+    handles, spec = [], {}
+    for name, array in (('dates', dates), ('values', values)):
+        shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+        handles.append(shm)
+        spec[name] = (shm.name, array.shape, array.dtype.str)
+    return handles, spec
+
+
+def _attach_panel(spec):
+    """Read-only DataFrame view over the shared panel (kept alive in _WORKER)."""
+    arrays = {}
+    for name, (shm_name, shape, dtype) in spec.items():
+        shm = shared_memory.SharedMemory(name=shm_name)
+        _WORKER.setdefault('handles', []).append(shm)
+        array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+        array.flags.writeable = False
+        arrays[name] = array
+    panel = pd.DataFrame(arrays['values'], columns=_PANEL_COLUMNS, copy=False)
+    panel.insert(0, 'Date', pd.DatetimeIndex(arrays['dates'].view('datetime64[ns]')))
+    panel['trend'] = panel['trend'].astype('int64')
+    return panel
+
+
+def _init_worker(spec, cointegration_results):
+    _WORKER['aligned_data'] = _attach_panel(spec) if spec is not None else None
+    _WORKER['cointegration_results'] = cointegration_results
+
+
+def _fit_ecm(ecm_kwargs, aligned_data=None, cointegration_results=None):
+    """Fit one ECM specification on the shared panel."""
+    from .ecm import _build_ecm_model
+
+    aligned_data = aligned_data if aligned_data is not None else _WORKER['aligned_data']
+    cointegration_results = cointegration_results or _WORKER['cointegration_results']
+    with quiet():
+        return _build_ecm_model(aligned_data, cointegration_results, **ecm_kwargs)
+
+
+def _run_backtest(config, ecm_results, aligned_data=None, cointegration_results=None):
+    """Backtest one configuration with its fitted ECM; errors are returned, not raised."""
+    from .forecast import _forecast_evaluation
+
+    aligned_data = aligned_data if aligned_data is not None else _WORKER['aligned_data']
+    cointegration_results = cointegration_results or _WORKER['cointegration_results']
+    forecast_kwargs = split_pipeline_options(config, 'sweep parameters')[1]
+    try:
+        with quiet():
+            eval_out = _forecast_evaluation(aligned_data.copy(), cointegration_results, ecm_results,
+                                            **forecast_kwargs)
+    except Exception as err:
+        return {'config': config, 'error': str(err)}
+    metrics = eval_out['metrics'].copy()
+    metrics['gamma'] = ecm_results['diagnostics']['error_correction_coeff']
+    metrics['lags'] = str(tuple(ecm_results['specification']['lags'].values()))
+    return {'config': config, 'metrics': metrics}
+
+
+def run_parameter_sweep(param_grid, pipeline_data=None, correlation_results=None,
+                        aligned_data=None, workers=None):
+    """Run many pipeline configurations in parallel on one prepared panel.
+
+    Parameters
+    ----------
+    param_grid : dict of lists or list of dict
+        Values for any of ``n_test``, ``exog_nowcast``, ``exog_ma_lookback``
+        (backtest) and ``ic_kind``, ``include_L3``, ``allow_contemporaneous``,
+        ``max_lags_cap`` (ECM specification).
+    pipeline_data, correlation_results : dict, optional
+        Inputs for :func:`_prepare_aligned_data` when ``aligned_data`` is not given.
+    aligned_data : pandas.DataFrame, optional
+        Pre-aligned panel (e.g. from :func:`load_aligned_panel`).
+    workers : int, optional
+        Worker processes; defaults to ``os.cpu_count()``. ``1`` runs in-process.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Metrics (``RMSE``, ``MAE``, ``MAPE``, ``gamma``, ``lags``) indexed by the
+        swept parameters plus ``model`` and ``horizon``. Failed configurations
+        are listed in ``df.attrs['errors']``.
+    """
+    from .preparation import _prepare_aligned_data
+    from .cointegration import _estimate_cointegrating_relation
+
+    configs = expand_grid(param_grid)
+    if not configs:
+        raise ValueError("param_grid produced no configurations")
+    split_pipeline_options({k: None for config in configs for k in config}, 'sweep parameters')
+    param_names = list(dict.fromkeys(k for config in configs for k in config))
+
+    logger.info("🧪 Parameter sweep: %s configurations", len(configs))
+    with quiet():
+        if aligned_data is None:
+            aligned_data = _prepare_aligned_data(pipeline_data, correlation_results or {})
+        if aligned_data is None or aligned_data.empty:
+            raise ValueError("Aligned data is empty; cannot run the sweep.")
+        aligned_data = aligned_data[['Date'] + _PANEL_COLUMNS].reset_index(drop=True)
+        coint = _estimate_cointegrating_relation(aligned_data, plot=False)
+    # Only what the ECM and backtest read; summary statistics and covariance stay in the parent
+    shared_coint = {k: coint[k] for k in ('coefficients', 'residuals') if k in coint}
+
+    groups = {}
+    for position, config in enumerate(configs):
+        ecm_kwargs = tuple(split_pipeline_options(config, 'sweep parameters')[0].items())
+        groups.setdefault(ecm_kwargs, []).append(position)
+    logger.info("  • ECM specifications to fit: %s", len(groups))
+
+    def _ecm_failed(positions, err):
+        for position in positions:
+            results[position] = {'config': configs[position], 'error': f"ECM: {err}"}
+
+    workers = workers or os.cpu_count() or 1
+    results = {}
+    if workers <= 1 or len(configs) == 1:
+        for ecm_kwargs, positions in groups.items():
+            try:
+                ecm_results = _fit_ecm(dict(ecm_kwargs), aligned_data, shared_coint)
+            except Exception as err:
+                _ecm_failed(positions, err)
+                continue
+            for position in positions:
+                results[position] = _run_backtest(configs[position], ecm_results, aligned_data, shared_coint)
+    else:
+        handles, spec = _share_panel(aligned_data)
+        try:
+            with ProcessPoolExecutor(max_workers=min(workers, len(configs)), initializer=_init_worker,
+                                     initargs=(spec, shared_coint)) as pool:
+                fits = {pool.submit(_fit_ecm, dict(ecm_kwargs)): ecm_kwargs for ecm_kwargs in groups}
+                backtests = {}
+                for fit in as_completed(fits):
+                    positions = groups[fits[fit]]
+                    try:
+                        ecm_results = fit.result()
+                    except Exception as err:
+                        _ecm_failed(positions, err)
+                        continue
+                    for position in positions:
+                        backtests[position] = pool.submit(_run_backtest, configs[position], ecm_results)
+                for position, future in backtests.items():
+                    results[position] = future.result()
+        finally:
+            for shm in handles:
+                shm.close()
+                shm.unlink()
+    results = [results[position] for position in range(len(configs))]
+
+    frames, errors = [], []
+    for result in results:
+        if 'error' in result:
+            errors.append({**result['config'], 'error': result['error']})
+            continue
+        metrics = result['metrics']
+        for name in param_names:
+            metrics[name] = result['config'].get(name)
+        frames.append(metrics)
+
+    if not frames:
+        raise ValueError(f"Every configuration failed: {errors[:3]}")
+    sweep_df = pd.concat(frames, ignore_index=True).set_index(param_names + ['model', 'horizon']).sort_index()
+    sweep_df.attrs['errors'] = errors
+    logger.info("✅ Sweep complete: %s succeeded, %s failed", len(configs) - len(errors), len(errors))
+    return sweep_df
+
+
+__all__ = ['expand_grid', 'run_parameter_sweep', 'split_pipeline_options']
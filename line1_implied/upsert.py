@@ -0,0 +1,182 @@
+"""Keyed "latest bulletin wins" upsert for Colonial transit-time rows.
+
+Replaces the notebooks' ``threshold_merge`` (manual cutoff date) followed by
+``keep_latest_cycle_per_year`` (``groupby([year, Cycle]).idxmax()``). Rows are
+held in long format keyed by ``(Route, Product, year, Cycle)`` so a newer
+bulletin that only reports gasoline does not wipe an older distillate value.
+"""
+
+import numpy as np
+import pandas as pd
+
+PRODUCTS = ('Gas', 'Distillates')
+LONG_COLUMNS = ['Route', 'Product', 'year', 'Cycle', 'Date', 'Days', 'Hours']
+
+_YEAR_SPAN = 10_000
+_CYCLE_SPAN = 1_000
+
+
+def to_long(rows):
+    """Melt normalized wide bulletin rows into one row per product.
+
+    Parameters
+    ----------
+    rows : pandas.DataFrame
+        Output of :func:`line1_implied.storage.normalize_transit_frame`.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Columns :data:`LONG_COLUMNS`; rows without a cycle or without any
+        day/hour value for the product are dropped.
+    """
+    parts = []
+    for product in PRODUCTS:
+        part = pd.DataFrame({
+            'Route': rows['Route'].astype(str).to_numpy(),
+            'Product': product,
+            'year': rows['Date'].dt.year.to_numpy(dtype='int64'),
+            'Cycle': rows['Cycle'].to_numpy(dtype='float64', na_value=np.nan),
+            'Date': rows['Date'].to_numpy(dtype='datetime64[ns]'),
+            'Days': rows[f'{product} Days'].to_numpy(dtype='float64', na_value=np.nan),
+            'Hours': rows[f'{product} Hours'].to_numpy(dtype='float64', na_value=np.nan),
+        })
+        keep = ~np.isnan(part['Cycle'].to_numpy()) & ~(
+            np.isnan(part['Days'].to_numpy()) & np.isnan(part['Hours'].to_numpy())
+        )
+        parts.append(part[keep])
+    long_df = pd.concat(parts, ignore_index=True)
+    long_df['Cycle'] = long_df['Cycle'].astype('int64')
+    return long_df[LONG_COLUMNS]
+
+
+def _keys(long_df, routes):
+    """Composite int64 key whose order matches (Route, Product, year, Cycle)."""
+    route_code = np.searchsorted(routes, long_df['Route'].to_numpy(dtype=object)).astype('int64')
+    product_code = (long_df['Product'].to_numpy(dtype=object) == PRODUCTS[1]).astype('int64')
+    year = long_df['year'].to_numpy(dtype='int64')
+    cycle = long_df['Cycle'].to_numpy(dtype='int64')
+    return ((route_code * 2 + product_code) * _YEAR_SPAN + year) * _CYCLE_SPAN + cycle
+
+
+def _latest_unique(long_df, routes):
+    """Sort by key and keep the latest bulletin per key (later input row wins ties)."""
+    keys = _keys(long_df, routes)
+    dates = long_df['Date'].to_numpy(dtype='datetime64[ns]').view('int64')
+    order = np.lexsort((np.arange(len(keys)), dates, keys))
+    sorted_keys = keys[order]
+    last = np.ones(len(order), dtype=bool)
+    last[:-1] = sorted_keys[1:] != sorted_keys[:-1]
+    picked = order[last]
+    return long_df.iloc[picked].reset_index(drop=True), keys[picked]
+
+
+def upsert_transit(existing, new):
+    """Merge new long-format rows into an existing latest-per-key table.
+
+    Parameters
+    ----------
+    existing : pandas.DataFrame or None
+        Previous result of this function (sorted and unique by key).
+    new : pandas.DataFrame
+        New long-format rows (see :func:`to_long`), any order, may contain
+        several bulletins for the same key.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Sorted, key-unique table where each key holds its latest bulletin
+        (ties on the date go to ``new``). Idempotent: upserting the same rows
+        again returns an identical table.
+
+    Notes
+    -----
+    The new rows are deduplicated with one sort (O(m log m)), matched against
+    the existing sorted keys with a binary search (O(m log n)), and spliced in
+    with a single vectorized copy; the existing table is never re-sorted.
+    """
+    existing = existing if existing is not None else pd.DataFrame(columns=LONG_COLUMNS)
+    routes = np.union1d(
+        existing['Route'].to_numpy(dtype=object).astype(str),
+        new['Route'].to_numpy(dtype=object).astype(str),
+    ).astype(object)
+
+    new_unique, new_keys = _latest_unique(new[LONG_COLUMNS], routes)
+    if existing.empty:
+        return new_unique
+    if new_unique.empty:
+        return existing.reset_index(drop=True)
+
+    existing = existing[LONG_COLUMNS].reset_index(drop=True)
+    existing_keys = _keys(existing, routes)
+
+    pos = np.searchsorted(existing_keys, new_keys)
+    clipped = np.minimum(pos, len(existing_keys) - 1)
+    hit = (pos < len(existing_keys)) & (existing_keys[clipped] == new_keys)
+
+    new_dates = new_unique['Date'].to_numpy(dtype='datetime64[ns]')
+    old_dates = existing['Date'].to_numpy(dtype='datetime64[ns]')
+    replace = hit & (new_dates >= old_dates[clipped])
+    insert = ~hit
+
+    columns = {}
+    for col in LONG_COLUMNS:
+        values = existing[col].to_numpy().copy()
+        incoming = new_unique[col].to_numpy()
+        values[pos[replace]] = incoming[replace]
+        columns[col] = np.insert(values, pos[insert], incoming[insert])
+    return pd.DataFrame(columns)[LONG_COLUMNS]
+
+
+def to_wide(long_df):
+    """Pivot a latest-per-key long table back to the workbook's wide layout.
+
+    ``Date`` is the gasoline bulletin date when present (the pipeline models
+    gasoline transit), otherwise the distillate one.
+    """
+    key = ['Route', 'year', 'Cycle']
+    gas = long_df[long_df['Product'] == 'Gas'].rename(
+        columns={'Date': 'Gas Date', 'Days': 'Gas Days', 'Hours': 'Gas Hours'})
+    dist = long_df[long_df['Product'] == 'Distillates'].rename(
+        columns={'Date': 'Dist Date', 'Days': 'Distillates Days', 'Hours': 'Distillates Hours'})
+    wide = gas.drop(columns='Product').merge(dist.drop(columns='Product'), on=key, how='outer')
+
+    wide['Date'] = wide['Gas Date'].fillna(wide['Dist Date'])
+    route_parts = wide['Route'].str.split('-', n=1, expand=True)
+    wide['From'] = route_parts[0]
+    wide['To'] = route_parts[1] if route_parts.shape[1] > 1 else ''
+    for col in ['Gas Days', 'Gas Hours', 'Distillates Days', 'Distillates Hours']:
+        wide[col] = wide[col].round().astype('Int64')
+    wide['Cycle'] = wide['Cycle'].astype('int64')
+    wide['Gas Transit Days'] = wide['Gas Days'].astype('float64') + wide['Gas Hours'].astype('float64') / 24
+
+    columns = ['Route', 'Date', 'From', 'To', 'Cycle', 'Gas Days', 'Gas Hours',
+               'Distillates Days', 'Distillates Hours', 'Gas Transit Days']
+    return wide[columns].sort_values(['Route', 'Date'], kind='mergesort').reset_index(drop=True)
+
+
+def latest_transit_rows(*frames):
+    """Library replacement for ``threshold_merge`` + ``keep_latest_cycle_per_year``.
+
+    Parameters
+    ----------
+    *frames : pandas.DataFrame
+        Wide bulletin frames (old workbook sheets, fresh extractions, ...) in
+        any order; no cutoff date is needed.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Wide rows with the latest bulletin per (route, year, cycle), sorted by
+        route and date, including ``Gas Transit Days``.
+    """
+    from .storage import normalize_transit_frame
+
+    rows = pd.concat([normalize_transit_frame(f) for f in frames if f is not None and len(f)],
+                     ignore_index=True)
+    if rows.empty:
+        return to_wide(pd.DataFrame(columns=LONG_COLUMNS))
+    return to_wide(upsert_transit(None, to_long(rows)))
+
+
+__all__ = ['to_long', 'to_wide', 'upsert_transit', 'latest_transit_rows']
@@ -0,0 +1,112 @@
+"""Bitemporal (vintage-aware) view of Colonial transit bulletins.
+
+Published transit times for a cycle are revised between bulletins, so the
+latest-per-cycle panel used for estimation contains values that were not yet
+known at earlier forecast origins. :class:`VintageStore` keeps every bulletin
+row and answers "what did the panel look like on date *d*?" without rescanning.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .storage import RECORD_COLUMNS, TransitStore, line_route_keys, normalize_transit_frame, split_line_rows
+
+_LINE_COLUMNS = {'Line1': 'L1', 'Line3': 'L3', 'Line13': 'L13'}
+
+
+class VintageStore:
+    """Every bulletin row indexed by (route, year, cycle) and bulletin date.
+
+    Rows are kept in bulletin-date order with an integer key per
+    (route, year, cycle). :meth:`as_of` binary-searches the date index and
+    replays only the bulletins published since the previous query, so a
+    rolling backtest that walks origins forward touches each row once.
+
+    Parameters
+    ----------
+    rows : pandas.DataFrame
+        Raw bulletin rows (all vintages), e.g. ``TransitStore.read()`` or the
+        un-deduplicated output of the extractor.
+    """
+
+    def __init__(self, rows):
+        rows = normalize_transit_frame(rows).dropna(subset=['Cycle'])
+        rows = rows.sort_values('Date', kind='mergesort').reset_index(drop=True)
+
+        self._rows = rows[['Route'] + RECORD_COLUMNS]
+        self._dates = rows['Date'].to_numpy(dtype='datetime64[ns]')
+        self._keys = rows.groupby(['Route', 'year', 'Cycle'], sort=True).ngroup().to_numpy()
+        self.n_keys = int(self._keys.max()) + 1 if len(self._keys) else 0
+        self._reset()
+
+    @classmethod
+    def from_store(cls, store, routes=None):
+        """Build from a :class:`~line1_implied.storage.TransitStore` (or its path)."""
+        store = store if isinstance(store, TransitStore) else TransitStore(store)
+        return cls(store.read(routes=routes))
+
+    def __len__(self):
+        return len(self._rows)
+
+    def content_digest(self):
+        """Hash of every stored bulletin row (used to key cached backtests)."""
+        from .artifacts import input_digest
+        return input_digest(self._rows)
+
+    def _reset(self):
+        self._latest = np.full(self.n_keys, -1, dtype=np.int64)
+        self._applied = 0
+
+    def _advance(self, as_of):
+        """Apply bulletins published up to ``as_of`` to the per-key latest index."""
+        stop = int(np.searchsorted(self._dates, np.datetime64(pd.Timestamp(as_of), 'ns'), side='right'))
+        if stop < self._applied:
+            self._reset()
+        if stop > self._applied:
+            np.maximum.at(self._latest, self._keys[self._applied:stop], np.arange(self._applied, stop))
+            self._applied = stop
+
+    def as_of(self, as_of, routes=None):
+        """Latest known bulletin row per (route, year, cycle) on ``as_of``.
+
+        Parameters
+        ----------
+        as_of : date-like
+            Knowledge date; bulletins dated after it are ignored.
+        routes : str or list of str, optional
+            Restrict to these route keys.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Wide rows (``Route`` + workbook columns) sorted by route and date.
+        """
+        self._advance(as_of)
+        picked = np.sort(self._latest[self._latest >= 0])
+        out = self._rows.iloc[picked]
+        if routes is not None:
+            routes = [routes] if isinstance(routes, str) else list(routes)
+            out = out[out['Route'].isin(routes)]
+        return out.sort_values(['Route', 'Date'], kind='mergesort').reset_index(drop=True)
+
+    def pipeline_as_of(self, as_of, line_routes=None):
+        """``pipeline_data`` dictionary as it was known on ``as_of``."""
+        rows = self.as_of(as_of, routes=line_route_keys(line_routes))
+        return split_line_rows(rows, line_routes)
+
+    def aligned_as_of(self, as_of, line_routes=None):
+        """Common-date ``Date``/``L1``/``L3``/``L13`` panel as known on ``as_of``.
+
+        Same inner-join alignment as :func:`_prepare_aligned_data`, without the
+        diagnostics, so it can be called once per forecast origin.
+        """
+        pipeline_data = self.pipeline_as_of(as_of, line_routes)
+        panel = None
+        for line_name, col_name in _LINE_COLUMNS.items():
+            line = pipeline_data[line_name][['Date', 'Gas Transit Days']].dropna()
+            line = line.drop_duplicates('Date', keep='last').rename(columns={'Gas Transit Days': col_name})
+            panel = line if panel is None else panel.merge(line, on='Date', how='inner')
+        return panel.sort_values('Date').reset_index(drop=True)
+
+
+__all__ = ['VintageStore']
@@ -0,0 +1,56 @@
+"""
+Tests for data/bulletin_archive.py recovery from a crash during append().
+"""
+
+import json
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "data"))
+
+from bulletin_archive import BulletinArchive  # noqa: E402
+
+SUBJECT = "Colonial Pipeline Transit Times"
+
+
+def filled_archive(archive_dir, n=3):
+    archive = BulletinArchive(str(archive_dir))
+    start = datetime(2025, 1, 1, 8)
+    for i in range(n):
+        archive.append(start + timedelta(days=i), SUBJECT, f"<html><body>bulletin {i}</body></html>")
+    return archive
+
+
+def test_truncated_index_still_replays(tmp_path, caplog):
+    archive = filled_archive(tmp_path)
+    index_path = Path(archive.index_path)
+    # Simulate a crash halfway through the last index write
+    last = json.dumps({"received": "2025-01-04T08:00:00", "subject": SUBJECT, "digest": "ab"})
+    with open(index_path, "a", encoding="utf-8") as fh:
+        fh.write(last[:len(last) // 2])
+
+    with caplog.at_level("WARNING", logger="bulletin_archive"):
+        reopened = BulletinArchive(str(tmp_path))
+    assert "torn" in caplog.text
+    assert len(reopened) == 3
+    bodies = [msg.HTMLBody for msg in reopened.iter_messages(newest_first=False)]
+    assert bodies == [f"<html><body>bulletin {i}</body></html>" for i in range(3)]
+
+    # The torn tail is gone, so the next append lands on its own line
+    assert reopened.append(datetime(2025, 1, 5, 8), SUBJECT, "<html><body>bulletin 4</body></html>")
+    assert len(BulletinArchive(str(tmp_path))) == 4
+    assert all(json.loads(line) for line in index_path.read_text(encoding="utf-8").splitlines())
+
+
+def test_corrupt_line_before_the_end_raises(tmp_path):
+    archive = filled_archive(tmp_path)
+    index_path = Path(archive.index_path)
+    lines = index_path.read_text(encoding="utf-8").splitlines(keepends=True)
+    lines[1] = lines[1][:10] + "\n"
+    index_path.write_text("".join(lines), encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        BulletinArchive(str(tmp_path))
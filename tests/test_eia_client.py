@@ -0,0 +1,116 @@
+"""
+Offline tests for data/eia_client.py against data/eia_fake_server.py.
+
+The fake server rebuilds its records from the committed EIA CSVs, so a full
+fetch_pipeline_kbd / refresh_eia_csvs pass must reproduce those files. No
+network access or real API key is needed.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+sys.path.insert(0, str(DATA_DIR))
+
+from eia_client import (  # noqa: E402
+    GASOIL_SERIES,
+    GASOLINE_SERIES,
+    PIPE_ROUTE,
+    EIAClient,
+    fetch_pipeline_kbd,
+    refresh_eia_csvs,
+)
+from eia_fake_server import EIAFakeServer  # noqa: E402
+
+API_KEY = "offline-test-key"
+
+
+@pytest.fixture
+def server():
+    with EIAFakeServer(page_limit=12) as fake:
+        yield fake
+
+
+def offsets(request_log, series):
+    return sorted(int(entry["query"]["offset"][0]) for entry in request_log
+                  if entry["query"].get("facets[series][]") == list(series))
+
+
+def test_round_trip_matches_committed_csvs(server, tmp_path):
+    cache_dir = tmp_path / "cache"
+    client = EIAClient(api_key=API_KEY, base_url=server.base_url, cache_dir=str(cache_dir),
+                       max_age=0, workers=2)
+
+    paths = refresh_eia_csvs(str(tmp_path), client=client)
+    for path in paths:
+        expected = pd.read_csv(DATA_DIR / Path(path).name)
+        pd.testing.assert_frame_equal(pd.read_csv(path), expected, check_exact=False, rtol=1e-9)
+
+    # Both queries span several capped pages, each requested exactly once
+    months = len(pd.read_csv(paths[1]))
+    pages = client.stats["requests"]
+    assert offsets(server.request_log, GASOLINE_SERIES) == list(range(0, 2 * months, 12))
+    assert offsets(server.request_log, GASOIL_SERIES) == list(range(0, months, 12))
+    assert pages == len(server.request_log) > 2
+    assert client.stats["not_modified"] == 0
+
+    # max_age=0: every cached page is revalidated and the server answers 304
+    gasoline, gasoil = fetch_pipeline_kbd(client)
+    assert client.stats["requests"] == 2 * pages
+    assert client.stats["not_modified"] == pages
+    pd.testing.assert_frame_equal(gasoil, pd.read_csv(paths[1]), check_exact=False, rtol=1e-9)
+    pd.testing.assert_frame_equal(gasoline, pd.read_csv(paths[0]), check_exact=False, rtol=1e-9)
+
+
+def test_fresh_cache_is_served_without_requests(server, tmp_path):
+    client = EIAClient(api_key=API_KEY, base_url=server.base_url, cache_dir=str(tmp_path))
+    first = client.fetch_pipe_series(GASOIL_SERIES)
+    pages = client.stats["requests"]
+
+    second = client.fetch_pipe_series(GASOIL_SERIES)
+    pd.testing.assert_frame_equal(first, second)
+    assert client.stats["requests"] == pages
+    assert client.stats["cache_hits"] == pages
+
+
+def test_cache_key_excludes_api_key(server, tmp_path):
+    params = {"frequency": "monthly", "facets[series][]": ["B", "A"], "offset": 0, "length": 12}
+    key = EIAClient._query_key(PIPE_ROUTE, params)
+    assert EIAClient._query_key(PIPE_ROUTE, {**params, "api_key": "one"}) == key
+    assert EIAClient._query_key(PIPE_ROUTE, {**params, "api_key": "two"}) == key
+    reordered = {"length": 12, "offset": 0, "facets[series][]": ["A", "B"], "frequency": "monthly"}
+    assert EIAClient._query_key(PIPE_ROUTE, reordered) == key
+    assert EIAClient._query_key(PIPE_ROUTE, {**params, "offset": 12}) != key
+
+    # A client with a different key reuses the cache, and the key is never written to disk
+    EIAClient(api_key=API_KEY, base_url=server.base_url, cache_dir=str(tmp_path)).fetch_pipe_series(GASOIL_SERIES)
+    other = EIAClient(api_key="another-key", base_url=server.base_url, cache_dir=str(tmp_path))
+    other.fetch_pipe_series(GASOIL_SERIES)
+    assert other.stats["requests"] == 0
+    for path in tmp_path.glob("*.json"):
+        assert API_KEY not in path.read_text()
+        assert "api_key" not in json.loads(path.read_text())
+
+
+def test_pagination_follows_server_page_cap(tmp_path):
+    records = [{"period": f"{2000 + i // 12}-{i % 12 + 1:02d}", "series": GASOIL_SERIES[0],
+                "value": float(i), "units": "MBBL"} for i in range(23)]
+    with EIAFakeServer(records=records, page_limit=5) as fake:
+        client = EIAClient(api_key=API_KEY, base_url=fake.base_url, page_length=100, workers=3)
+        rows = client.fetch_pipe_series(GASOIL_SERIES, start="2000-01")
+
+        assert offsets(fake.request_log, GASOIL_SERIES) == [0, 5, 10, 15, 20]
+        assert [entry["query"]["length"] for entry in fake.request_log[1:]] == [["5"]] * 4
+    assert len(rows) == len(records)
+    assert not rows.duplicated(["period", "series"]).any()
+    assert sorted(rows["value"]) == [float(i) for i in range(23)]
+
+
+def test_missing_api_key_is_rejected(monkeypatch):
+    monkeypatch.delenv("EIA_API_KEY", raising=False)
+    with pytest.raises(ValueError, match="EIA_API_KEY"):
+        EIAClient()